@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图片加载提示脚本
+根据图片在页面中的位置判断是否位于首屏 (header、nav 以及第一个 hero/section, 与关键CSS使用相同的范围):
+  - 首屏主图 (hero / 第一张大图): fetchpriority="high", 不延迟加载
+  - 其他首屏图片: decoding="async", 不延迟加载
+  - 首屏以下的图片: loading="lazy" decoding="async"
+并统计每个页面因延迟加载而不在首次加载中下载的图片字节数
+
+用法: python apply_loading_hints.py [站点目录]
+文章优化脚本会给所有插入的图片加上 loading="lazy", 重新生成文章后需要再运行一次
+"""
+
+import re
+import sys
+from pathlib import Path
+from urllib.parse import unquote
+
+from image_metadata import ImageMetadataCache
+from inline_critical_css import extract_above_fold
+
+IMG_TAG_PATTERN = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'\s([\w:-]+)\s*=\s*(["\'])(.*?)\2', re.DOTALL)
+
+# 首屏最多保留这么多张立即加载的图片
+MAX_EAGER_IMAGES = 4
+
+# 显示宽度不小于这个值的图片才可能是首屏主图 (LCP元素)
+HERO_MIN_WIDTH = 300
+
+# 首屏范围内没有主图时, 紧随其后这么多字符内的第一张大图仍按主图处理 (例如文章标题区下方的配图)
+HERO_LOOKAHEAD_CHARS = 3000
+
+
+def get_attr(tag, name):
+    """读取标签属性值"""
+    for attr, _, value in ATTR_PATTERN.findall(tag):
+        if attr.lower() == name:
+            return value
+    return None
+
+
+def set_attr(tag, name, value):
+    """设置或删除 (value为None) 标签属性"""
+    pattern = re.compile(r'\s' + re.escape(name) + r'\s*=\s*(["\']).*?\1', re.IGNORECASE | re.DOTALL)
+    if value is None:
+        return pattern.sub('', tag)
+    if pattern.search(tag):
+        return pattern.sub(f' {name}="{value}"', tag, count=1)
+    closing = '/>' if tag.endswith('/>') else '>'
+    return tag[:-len(closing)].rstrip() + f' {name}="{value}"' + closing
+
+
+def image_filename(src):
+    """从src中取出 images/ 下的文件名"""
+    if not src or 'images/' not in src:
+        return None
+    return unquote(src.split('?', 1)[0].split('#', 1)[0].rsplit('/', 1)[-1])
+
+
+def display_width(tag, filename, metadata):
+    """估算图片显示宽度: width属性、内联样式宽度, 否则取图片本身宽度"""
+    width = get_attr(tag, 'width')
+    if width and width.isdigit():
+        return int(width)
+    style_match = re.search(r'(?:^|;)\s*width\s*:\s*(\d+)px', get_attr(tag, 'style') or '')
+    if style_match:
+        return int(style_match.group(1))
+    size = metadata.get_size(filename) if filename else None
+    return size[0] if size else 0
+
+
+def is_hero_candidate(tag, filename, metadata):
+    """判断图片是否可能是首屏主图"""
+    if 'hero' in (get_attr(tag, 'class') or ''):
+        return True
+    return display_width(tag, filename, metadata) >= HERO_MIN_WIDTH
+
+
+def fold_offset(content):
+    """计算首屏范围在页面中的结束位置"""
+    body_match = re.search(r'<body[^>]*>', content, re.IGNORECASE)
+    body_start = body_match.end() if body_match else 0
+    return body_start + len(extract_above_fold(content))
+
+
+def classify_images(content, metadata):
+    """返回 [(标签match, 分类)], 分类为 hero / eager / lazy"""
+    matches = list(IMG_TAG_PATTERN.finditer(content))
+    boundary = fold_offset(content)
+
+    classes = []
+    eager_count = 0
+    hero_index = None
+    for index, match in enumerate(matches):
+        tag = match.group(0)
+        filename = image_filename(get_attr(tag, 'src'))
+        above = match.start() < boundary and eager_count < MAX_EAGER_IMAGES
+
+        if hero_index is None and is_hero_candidate(tag, filename, metadata):
+            if above or (eager_count == 0 and match.start() < boundary + HERO_LOOKAHEAD_CHARS):
+                hero_index = index
+                classes.append('hero')
+                eager_count += 1
+                continue
+
+        if above:
+            classes.append('eager')
+            eager_count += 1
+        else:
+            classes.append('lazy')
+
+    return list(zip(matches, classes))
+
+
+def apply_hint(tag, kind):
+    """按分类写入 loading / decoding / fetchpriority 属性"""
+    if kind == 'hero':
+        # 主图需要尽快解码显示, 保持浏览器默认的 decoding
+        tag = set_attr(tag, 'loading', None)
+        tag = set_attr(tag, 'decoding', None)
+        return set_attr(tag, 'fetchpriority', 'high')
+
+    tag = set_attr(tag, 'fetchpriority', None)
+    tag = set_attr(tag, 'loading', 'lazy' if kind == 'lazy' else None)
+    return set_attr(tag, 'decoding', 'async')
+
+
+def apply_loading_hints(html_file, metadata):
+    """处理单个页面, 返回 (各分类数量, 延迟加载的图片 {文件名: 字节数}, 是否修改)"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    counts = {'hero': 0, 'eager': 0, 'lazy': 0}
+    deferred = {}
+    eager_files = set()
+    parts = []
+    last = 0
+    for match, kind in classify_images(content, metadata):
+        tag = match.group(0)
+        counts[kind] += 1
+        filename = image_filename(get_attr(tag, 'src'))
+        if filename:
+            entry = metadata.get(filename)
+            if kind == 'lazy' and entry:
+                deferred[filename] = entry['bytes']
+            elif kind != 'lazy':
+                eager_files.add(filename)
+        parts.append(content[last:match.start()])
+        parts.append(apply_hint(tag, kind))
+        last = match.end()
+    parts.append(content[last:])
+    new_content = ''.join(parts)
+
+    # 首屏已经加载的图片在页面下方重复出现时不算节省
+    deferred = {name: size for name, size in deferred.items() if name not in eager_files}
+
+    changed = new_content != content
+    if changed:
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+    return counts, deferred, changed
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.').resolve()
+    metadata = ImageMetadataCache(site_root / 'images')
+    html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+
+    print("开始为图片添加加载提示...")
+
+    # 多个页面共用的图片在 page_total 中每页各算一次, 在 deferred_files 中只算一次
+    page_total = 0
+    deferred_files = {}
+    updated = 0
+    for html_file in html_files:
+        counts, deferred, changed = apply_loading_hints(html_file, metadata)
+        deferred_bytes = sum(deferred.values())
+        page_total += deferred_bytes
+        deferred_files.update(deferred)
+        updated += changed
+        if sum(counts.values()):
+            print(f"  {'✓' if changed else '-'} {html_file.relative_to(site_root)}: "
+                  f"主图 {counts['hero']}, 首屏 {counts['eager']}, 延迟 {counts['lazy']} "
+                  f"({deferred_bytes / 1024:.1f} KB 延迟加载)")
+    metadata.save()
+
+    print(f"\n完成! 更新了 {updated}/{len(html_files)} 个页面")
+    print(f"延迟加载的图片: {len(deferred_files)} 个文件, 共 {sum(deferred_files.values()) / 1024 / 1024:.2f} MB")
+    print(f"各页面首次加载减少的图片下载合计 (按页面累加, 共用图片重复计算): {page_total / 1024 / 1024:.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预取提示脚本
+统计全站页面之间的内部链接, 为每个页面选出最可能访问的下一个页面 (最多 MAX_PREFETCH 个),
+在 <head> 中写入 <link rel="prefetch"> 提示, 浏览器空闲时预先下载, 点击链接时不再等待一次完整往返
+
+页面得分 = 正文中指向它的链接数 + 导航/页脚中的链接数 × BOILERPLATE_WEIGHT, 同分时全站入链比例高的在前
+预取的页面按压缩后大小累计, 不超过 PREFETCH_BUDGET_BYTES
+
+提示写在 <!-- prefetch --> ... <!-- /prefetch --> 之间, 重复运行时替换
+由 build_site.py 在发布目录上运行, 源目录中的页面不写入提示, 修改页面或模板后重新构建即可更新
+
+用法: python apply_prefetch_hints.py [发布目录]
+"""
+
+import os
+import re
+import sys
+import zlib
+from pathlib import Path
+
+from fingerprint_assets import DEFAULT_OUTPUT_DIR, require_build_dir, resolve_reference
+
+# 每个页面最多预取的页面数
+MAX_PREFETCH = 3
+
+# 每个页面预取的压缩后总字节数上限
+PREFETCH_BUDGET_BYTES = 60 * 1024
+
+# 导航栏和页脚出现在每个页面上, 其中的链接权重较低
+BOILERPLATE_WEIGHT = 0.25
+
+BLOCK_START = '<!-- prefetch -->'
+BLOCK_END = '<!-- /prefetch -->'
+BLOCK_PATTERN = re.compile(r'\n?[ \t]*' + re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END), re.DOTALL)
+
+LINK_PATTERN = re.compile(r'<a\b[^>]*?\shref=(["\'])([^"\']+)\1', re.IGNORECASE)
+BOILERPLATE_PATTERN = re.compile(r'<(header|nav|footer)\b.*?</\1>', re.DOTALL | re.IGNORECASE)
+HEAD_PATTERN = re.compile(r'<head\b.*?</head>', re.DOTALL | re.IGNORECASE)
+
+
+def page_links(content, html_file, site_root):
+    """页面中指向站内页面的链接, 返回 {目标页面: 权重}"""
+    body = HEAD_PATTERN.sub('', content)
+    regions = [(BOILERPLATE_PATTERN.sub(' ', body), 1.0)]
+    regions += [(match.group(0), BOILERPLATE_WEIGHT) for match in BOILERPLATE_PATTERN.finditer(body)]
+
+    source = html_file.relative_to(site_root).as_posix()
+    weights = {}
+    for text, weight in regions:
+        for _, href in LINK_PATTERN.findall(text):
+            target = resolve_reference(site_root, html_file.parent, href)
+            if not target or target == source or not target.endswith('.html'):
+                continue
+            if not (site_root / target).is_file():
+                continue
+            weights[target] = weights.get(target, 0) + weight
+    return weights
+
+
+def compressed_size(file_path):
+    """页面压缩后的大小, 接近实际传输字节数"""
+    return len(zlib.compress(file_path.read_bytes(), 6))
+
+
+def choose_prefetch(weights, popularity, sizes):
+    """按得分选出预取页面, 同时受数量和字节预算限制; 全站入链比例只决定同分页面的次序"""
+    ranked = sorted(weights, key=lambda target: (-weights[target], -popularity.get(target, 0), target))
+    chosen = []
+    budget = PREFETCH_BUDGET_BYTES
+    for target in ranked:
+        if len(chosen) >= MAX_PREFETCH:
+            break
+        if sizes[target] <= budget:
+            chosen.append(target)
+            budget -= sizes[target]
+    return chosen
+
+
+def render_block(html_file, site_root, targets):
+    """生成预取提示区块, 链接写成相对页面的路径"""
+    lines = [f'    {BLOCK_START}']
+    for target in targets:
+        href = Path(os.path.relpath(site_root / target, html_file.parent)).as_posix()
+        lines.append(f'    <link rel="prefetch" href="{href.replace(" ", "%20")}">')
+    lines.append(f'    {BLOCK_END}')
+    return '\n'.join(lines)
+
+
+def apply_block(content, block):
+    """写入或替换 <head> 中的预取区块"""
+    content = BLOCK_PATTERN.sub('', content, count=1)
+    head_end = content.find('</head>')
+    if not block or head_end == -1:
+        return content
+    # 有的页面 </head> 紧跟在 </script> 之后, 区块从新的一行开始
+    separator = '' if content[:head_end].endswith('\n') else '\n'
+    return content[:head_end] + separator + block + '\n' + content[head_end:]
+
+
+def main():
+    site_root = require_build_dir(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR)
+    html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+
+    print(f"开始统计 {len(html_files)} 个页面的内部链接...")
+    contents = {}
+    graph = {}
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            contents[html_file] = f.read()
+        graph[html_file] = page_links(contents[html_file], html_file, site_root)
+
+    # 全站入链比例: 有多少比例的页面链接到目标页面, 作为同分时的次序
+    popularity = {}
+    for weights in graph.values():
+        for target in weights:
+            popularity[target] = popularity.get(target, 0) + 1 / len(html_files)
+
+    sizes = {}
+    updated = 0
+    total_hints = 0
+    for html_file in html_files:
+        weights = graph[html_file]
+        for target in weights:
+            if target not in sizes:
+                sizes[target] = compressed_size(site_root / target)
+        targets = choose_prefetch(weights, popularity, sizes)
+        total_hints += len(targets)
+
+        block = render_block(html_file, site_root, targets) if targets else ''
+        new_content = apply_block(contents[html_file], block)
+        if new_content != contents[html_file]:
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+            updated += 1
+            print(f"  ✓ {html_file.relative_to(site_root)}: {', '.join(targets) or '(无)'}")
+
+    print(f"\n完成! 共 {total_hints} 个预取提示, 更新了 {updated}/{len(html_files)} 个页面")
+
+
+if __name__ == '__main__':
+    main()
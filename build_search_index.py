@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+站内搜索索引生成脚本
+对 articles/ 中的所有文章分词, 生成按词前缀分片的倒排索引, 写入 search/ 目录:
+  - search/manifest.json: 文章数量、停用词和各分片的文件名
+  - search/terms/<前缀>.<哈希>.json: 以该前缀开头的词 -> 倒排列表 [文章编号差值, 分数, ...]
+  - search/docs/<序号>.<哈希>.json: 文章的链接、标题和摘要
+
+js/search.js 先读取清单, 再按查询词的前缀只下载需要的分片, 文章数量上万时也不需要服务器
+分片文件名包含内容哈希, 内容没有变化的分片保持原文件, 浏览器可以长期缓存
+
+用法: python build_search_index.py [站点目录]
+"""
+
+import re
+import sys
+import json
+import html
+import math
+import hashlib
+from pathlib import Path
+
+from related_articles import STOP_WORDS, TAG_PATTERN, article_text, article_title
+from update_blog_articles import categorize_article, get_category_display_name, meta_content
+
+INDEX_DIR = 'search'
+
+# 词的前几个字符决定所在分片, 查询时按同样的前缀下载分片
+SHARD_PREFIX_LENGTH = 2
+
+# 每个文章信息分片包含的文章数
+DOCS_PER_SHARD = 500
+
+# 出现在标题中的词额外加的分数 (正文词频的分数为 10 * (1 + ln 词频))
+TITLE_BONUS = 30
+
+# 摘要最多保留的字符数
+SNIPPET_LENGTH = 160
+
+HASH_LENGTH = 8
+
+# 与 js/search.js 中的分词规则保持一致
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    """分词: 小写字母数字串, 去掉停用词和单字符, 简单去掉复数 s"""
+    words = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        if len(word) < 2 or word in STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+def term_scores(title, text):
+    """文章中每个词的分数: 正文词频取对数并放大为整数以压缩索引体积, 标题中的词另外加分"""
+    counts = {}
+    for word in tokenize(text):
+        counts[word] = counts.get(word, 0) + 1
+    scores = {word: round(10 * (1 + math.log(count))) for word, count in counts.items()}
+    for word in set(tokenize(title)):
+        scores[word] = scores.get(word, 0) + TITLE_BONUS
+    return scores
+
+
+def article_snippet(content):
+    """文章摘要: meta description, 没有时取第一段正文"""
+    description = meta_content(content, 'name', 'description')
+    if not description:
+        match = re.search(r'<p[^>]*>(.*?)</p>', content, re.DOTALL)
+        description = TAG_PATTERN.sub('', match.group(1)) if match else ''
+    description = ' '.join(html.unescape(description).split())
+    if len(description) > SNIPPET_LENGTH:
+        description = description[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + '...'
+    return description
+
+
+def build_index(html_files, site_root):
+    """返回 (文章列表, 倒排索引)"""
+    docs = []
+    postings = {}
+    for doc_id, html_file in enumerate(html_files):
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        title = article_title(content, html_file.name)
+        category = get_category_display_name(categorize_article(html_file.name, title))
+        docs.append([html_file.relative_to(site_root).as_posix(), title, article_snippet(content), category])
+        for word, score in term_scores(title, article_text(content)).items():
+            postings.setdefault(word, []).append((doc_id, score))
+    return docs, postings
+
+
+def encode_postings(entries):
+    """倒排列表按文章编号排序, 编号写成与前一项的差值: [差值, 分数, 差值, 分数, ...]"""
+    encoded = []
+    previous = 0
+    for doc_id, score in sorted(entries):
+        encoded += [doc_id - previous, score]
+        previous = doc_id
+    return encoded
+
+
+def write_shard(directory, name, data):
+    """以内容哈希命名写入分片, 同名文件已存在时不重写, 返回相对索引目录的路径"""
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    digest = hashlib.md5(text.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    path = directory / f'{name}.{digest}.json'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    return path
+
+
+def update_search_index(site_root):
+    """重新生成站点的搜索索引"""
+    site_root = Path(site_root).resolve()
+    index_dir = site_root / INDEX_DIR
+    html_files = sorted((site_root / 'articles').glob('*.html'))
+
+    if not html_files:
+        print("没有找到文章, 不生成搜索索引")
+        return
+
+    print(f"开始为 {len(html_files)} 篇文章生成搜索索引...")
+    docs, postings = build_index(html_files, site_root)
+
+    shards = {}
+    for word, entries in postings.items():
+        shards.setdefault(word[:SHARD_PREFIX_LENGTH], {})[word] = encode_postings(entries)
+
+    written = set()
+    manifest = {
+        'docCount': len(docs),
+        'docsPerShard': DOCS_PER_SHARD,
+        'prefixLength': SHARD_PREFIX_LENGTH,
+        'stopWords': sorted(STOP_WORDS),
+        'terms': {},
+        'docs': [],
+    }
+    for prefix, terms in sorted(shards.items()):
+        path = write_shard(index_dir / 'terms', prefix, terms)
+        manifest['terms'][prefix] = path.relative_to(index_dir).as_posix()
+        written.add(path)
+    for start in range(0, len(docs), DOCS_PER_SHARD):
+        path = write_shard(index_dir / 'docs', str(start // DOCS_PER_SHARD), docs[start:start + DOCS_PER_SHARD])
+        manifest['docs'].append(path.relative_to(index_dir).as_posix())
+        written.add(path)
+
+    manifest_path = index_dir / 'manifest.json'
+    manifest_text = json.dumps(manifest, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    if not manifest_path.exists() or manifest_path.read_text(encoding='utf-8') != manifest_text:
+        manifest_path.write_text(manifest_text, encoding='utf-8')
+
+    # 删除已经不在清单中的旧分片
+    removed = 0
+    for old_file in list(index_dir.glob('terms/*.json')) + list(index_dir.glob('docs/*.json')):
+        if old_file not in written:
+            old_file.unlink()
+            removed += 1
+
+    total_bytes = sum(path.stat().st_size for path in written) + manifest_path.stat().st_size
+    largest = max(written, key=lambda path: path.stat().st_size)
+    print(f"  - {len(postings)} 个词, {len(shards)} 个词分片, {len(manifest['docs'])} 个文章分片")
+    print(f"  - 最大分片 {largest.relative_to(site_root)}: {largest.stat().st_size / 1024:.1f} KB")
+    print(f"\n完成! 索引共 {total_bytes / 1024:.1f} KB, 删除了 {removed} 个旧分片")
+
+
+def main():
+    update_search_index(sys.argv[1] if len(sys.argv) > 1 else '.')
+
+
+if __name__ == '__main__':
+    main()
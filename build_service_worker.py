@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Service Worker 生成脚本
+根据站点目录中的文件生成 sw.js:
+  - 预缓存清单: css/、js/ 中的所有文件和 PRECACHE_PAGES 中的页面, 每项带内容哈希作为版本
+  - 运行时缓存: 页面 (包括 articles/) 网络优先, 离线时使用缓存; 图片和搜索索引分片缓存优先
+
+缓存按 "URL + 内容哈希" 存储, 重新发布后浏览器只下载哈希变化的文件, 其余文件继续使用旧缓存
+
+由 build_site.py 在发布目录上运行, 在 fingerprint_assets.py 之后执行; 目录中有 asset-manifest.json 时
+只预缓存清单中出现的 css/js 文件 (指纹化之后的文件名)
+同时在每个页面的 <head> 中写入 <meta name="service-worker">, js/main.js (js/script.js) 只在页面带有
+这个标记时注册 sw.js, 没有经过构建的源目录页面不会请求不存在的 sw.js
+
+用法: python build_service_worker.py [站点目录]
+"""
+
+import re
+import sys
+import json
+import hashlib
+from pathlib import Path
+from string import Template
+
+from site_templates import TEMPLATES_DIR
+
+SERVICE_WORKER_FILE = 'sw.js'
+
+# 预缓存的资源目录和扩展名
+PRECACHE_ASSETS = [
+    ('css', ['.css']),
+    ('js', ['.js']),
+]
+
+# 预缓存的页面; 第一个作为离线时的后备页面
+PRECACHE_PAGES = ['404.html', 'index.html', 'blog.html']
+
+# 运行时图片缓存最多保留的图片数量
+MAX_IMAGE_ENTRIES = 200
+
+HASH_LENGTH = 8
+
+REGISTRATION_META = '<meta name="service-worker" content="{href}">'
+REGISTRATION_META_PATTERN = re.compile(r'\n?[ \t]*<meta name="service-worker" content="[^"]*">')
+
+
+def file_revision(file_path):
+    """文件内容的短哈希"""
+    with open(file_path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()[:HASH_LENGTH]
+
+
+def precache_files(site_root):
+    """需要预缓存的文件 (相对站点根目录的路径)"""
+    manifest_path = site_root / 'asset-manifest.json'
+    fingerprinted = None
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            fingerprinted = set(json.load(f).values())
+
+    files = []
+    for directory, extensions in PRECACHE_ASSETS:
+        asset_dir = site_root / directory
+        if not asset_dir.is_dir():
+            continue
+        for asset in sorted(asset_dir.iterdir()):
+            relative = asset.relative_to(site_root).as_posix()
+            if not asset.is_file() or asset.suffix.lower() not in extensions:
+                continue
+            # 指纹化之后只保留清单中的文件
+            if fingerprinted is not None and relative not in fingerprinted:
+                continue
+            files.append(relative)
+
+    files += [page for page in PRECACHE_PAGES if (site_root / page).exists()]
+    return files
+
+
+def mark_registration(html_file, site_root):
+    """在页面 <head> 中写入 Service Worker 地址 (相对页面的路径), 返回是否修改"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    depth = html_file.relative_to(site_root).as_posix().count('/')
+    meta = REGISTRATION_META.format(href='../' * depth + SERVICE_WORKER_FILE)
+    new_content = REGISTRATION_META_PATTERN.sub('', content, count=1)
+    head_end = new_content.find('</head>')
+    if head_end == -1:
+        return False
+    separator = '' if new_content[:head_end].endswith('\n') else '\n'
+    new_content = new_content[:head_end] + separator + f'    {meta}\n' + new_content[head_end:]
+    if new_content == content:
+        return False
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(new_content)
+    return True
+
+
+def render_service_worker(entries):
+    """用 templates/sw.js 生成 Service Worker 脚本"""
+    template = Template((TEMPLATES_DIR / SERVICE_WORKER_FILE).read_text(encoding='utf-8'))
+    version = hashlib.md5(json.dumps(entries).encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    offline_page = next((url for url, _ in entries if url in PRECACHE_PAGES), '')
+    precache = '[\n' + ',\n'.join(f'    {json.dumps(entry, ensure_ascii=False)}' for entry in entries) + '\n]'
+    return template.substitute(version=version, precache=precache,
+                               max_images=MAX_IMAGE_ENTRIES, offline_page=offline_page)
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.').resolve()
+    output = site_root / SERVICE_WORKER_FILE
+
+    # 先写入注册标记, 预缓存页面的版本包含这次修改
+    html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+    marked = sum(1 for html_file in html_files if mark_registration(html_file, site_root))
+    if marked:
+        print(f"已在 {marked} 个页面中写入 Service Worker 注册标记")
+
+    entries = [[relative, file_revision(site_root / relative)] for relative in precache_files(site_root)]
+    content = render_service_worker(entries)
+
+    previous = output.read_text(encoding='utf-8') if output.exists() else ''
+    if previous == content:
+        print(f"{SERVICE_WORKER_FILE} 没有变化 ({len(entries)} 个预缓存文件)")
+        return
+
+    output.write_text(content, encoding='utf-8')
+    total = sum((site_root / relative).stat().st_size for relative, _ in entries)
+    print(f"已生成 {output.relative_to(site_root)}: {len(entries)} 个预缓存文件, 共 {total / 1024:.1f} KB")
+
+    # 和上一次生成的清单比较, 只有这些文件会被浏览器重新下载
+    changed = [entry for entry in entries if json.dumps(entry, ensure_ascii=False) not in previous]
+    for relative, revision in changed:
+        print(f"  ✓ {relative} ({revision})")
+    print(f"\n完成! {len(changed)}/{len(entries)} 个预缓存文件需要重新下载")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+发布构建脚本
+把站点源目录复制到发布目录 (默认 dist/), 然后在发布目录上按顺序运行会改写页面的构建步骤,
+源目录中的页面不会被修改:
+  1. build_svg_sprite.py       图标合并为雪碧图 (先于CSS裁剪和内联, 图标规则才会保留在首屏CSS中)
+  2. prune_unused_css.py       按页面分组裁剪未使用的CSS
+  3. inline_critical_css.py    内联首屏关键CSS
+  4. apply_prefetch_hints.py   写入下一页预取提示
+  5. fingerprint_assets.py     资源文件名加内容哈希 (原地处理发布目录)
+  6. build_service_worker.py   生成 sw.js 并在页面中写入注册标记
+
+任何一步失败时停止构建, 以该步骤的退出码结束
+
+用法: python build_site.py [发布目录]
+"""
+
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+from fingerprint_assets import DEFAULT_OUTPUT_DIR, SOURCE_DIR, copy_site
+
+# 构建步骤: (脚本, 是否需要把发布目录同时作为输出目录传入)
+BUILD_STEPS = [
+    ('build_svg_sprite.py', False),
+    ('prune_unused_css.py', False),
+    ('inline_critical_css.py', False),
+    ('apply_prefetch_hints.py', False),
+    ('fingerprint_assets.py', True),
+    ('build_service_worker.py', False),
+]
+
+
+def run_step(script, output_dir, in_place):
+    """运行单个构建步骤, 返回退出码"""
+    args = [sys.executable, str(SOURCE_DIR / script), str(output_dir)]
+    if in_place:
+        args.append(str(output_dir))
+    return subprocess.run(args, cwd=SOURCE_DIR).returncode
+
+
+def main():
+    output_dir = Path(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR).resolve()
+    if output_dir == SOURCE_DIR:
+        print(f"✗ 发布目录不能是站点源目录: {output_dir}")
+        sys.exit(1)
+
+    started = time.monotonic()
+    print(f"复制站点到发布目录: {output_dir}")
+    copy_site(SOURCE_DIR, output_dir)
+
+    for script, in_place in BUILD_STEPS:
+        print(f"\n== {script} ==")
+        returncode = run_step(script, output_dir, in_place)
+        if returncode != 0:
+            print(f"\n✗ {script} 失败 (退出码 {returncode}), 构建停止")
+            sys.exit(returncode)
+
+    print(f"\n完成! 发布目录 {output_dir}, 用时 {time.monotonic() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG图标雪碧图生成脚本
+把页面中引用的小图标 (*-icon.svg、author-*.svg) 打包为一个 <symbol> 雪碧图,
+把 <img src="images/xxx-icon.svg"> 改写为 <svg><use href="images/icons-sprite.svg#icon-xxx"></use></svg>,
+几十个图标请求合并为一个可缓存的文件
+
+同时为样式表中 "... img" 形式的图标规则生成对应的 svg.sprite-icon 规则, 保证显示尺寸不变
+
+用法: python build_svg_sprite.py [发布目录]
+会原地改写页面和样式表, 只能在发布目录上运行 (默认 dist/), 由 build_site.py 在裁剪CSS之前执行
+"""
+
+import re
+import sys
+from urllib.parse import unquote
+
+from fingerprint_assets import DEFAULT_OUTPUT_DIR, require_build_dir
+from image_metadata import ImageMetadataCache
+from minify_svgs import minify_svg
+from prune_unused_css import parse_css, serialize_css, split_selectors
+
+SPRITE_NAME = 'icons-sprite.svg'
+SPRITE_CLASS = 'sprite-icon'
+ICON_PATTERNS = ['*-icon.svg', 'author-*.svg']
+
+# 超过这个大小的SVG不适合放进雪碧图
+MAX_ICON_BYTES = 8 * 1024
+
+CSS_MARKER_START = '/* sprite-icon rules: generated by build_svg_sprite.py */'
+CSS_MARKER_END = '/* end sprite-icon rules */'
+
+IMG_TAG_PATTERN = re.compile(r'<img\b([^>]*?)/?>(?:\s*</img>)?', re.IGNORECASE | re.DOTALL)
+ATTR_PATTERN = re.compile(r'([\w:-]+)\s*=\s*(["\'])(.*?)\2', re.DOTALL)
+
+
+def symbol_id(filename):
+    """图标文件名 -> symbol id"""
+    return 'icon-' + re.sub(r'[^\w-]', '-', filename.rsplit('.', 1)[0])
+
+
+def collect_icons(images_dir):
+    """找出可以放进雪碧图的图标"""
+    icons = []
+    for pattern in ICON_PATTERNS:
+        for svg_file in sorted(images_dir.glob(pattern)):
+            if svg_file.name == SPRITE_NAME or svg_file.stat().st_size > MAX_ICON_BYTES:
+                continue
+            content = svg_file.read_text(encoding='utf-8')
+            # 内嵌 <style> 的规则在雪碧图中会作用到所有图标, 这类图标保持独立文件
+            if '<style' in content:
+                continue
+            if svg_file not in icons:
+                icons.append(svg_file)
+    return icons
+
+
+def svg_to_symbol(svg_file):
+    """把单个SVG文件转换为 <symbol>, 内部id加上前缀避免冲突"""
+    content = minify_svg(svg_file.read_text(encoding='utf-8'))
+    root_match = re.search(r'<svg\b([^>]*)>(.*)</svg>', content, re.DOTALL)
+    if not root_match:
+        return None
+
+    attrs = {name: value for name, _, value in ATTR_PATTERN.findall(root_match.group(1))}
+    inner = root_match.group(2)
+
+    view_box = attrs.get('viewBox')
+    if not view_box and attrs.get('width') and attrs.get('height'):
+        view_box = f"0 0 {attrs['width']} {attrs['height']}"
+
+    sid = symbol_id(svg_file.name)
+    for element_id in re.findall(r'\bid="([^"]+)"', inner):
+        new_id = f'{sid}-{element_id}'
+        inner = re.sub(rf'\bid="{re.escape(element_id)}"', f'id="{new_id}"', inner)
+        inner = re.sub(rf'url\(#{re.escape(element_id)}\)', f'url(#{new_id})', inner)
+        inner = re.sub(rf'href="#{re.escape(element_id)}"', f'href="#{new_id}"', inner)
+
+    view_box_attr = f' viewBox="{view_box}"' if view_box else ''
+    return f'<symbol id="{sid}"{view_box_attr}>{inner}</symbol>'
+
+
+def build_sprite(icons, sprite_path):
+    """生成雪碧图文件, 返回打包成功的图标文件名集合"""
+    symbols = []
+    packed = set()
+    for svg_file in icons:
+        symbol = svg_to_symbol(svg_file)
+        if symbol:
+            symbols.append(symbol)
+            packed.add(svg_file.name)
+
+    sprite = ('<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">'
+              + ''.join(symbols) + '</svg>\n')
+    sprite_path.write_text(sprite, encoding='utf-8')
+    return packed
+
+
+def rewrite_img_tags(html_file, packed, metadata):
+    """把页面中的图标 <img> 改写为引用雪碧图的 <svg><use>, 返回改写数量"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    count = 0
+
+    def replace_img(match):
+        nonlocal count
+        attrs = {name.lower(): value for name, _, value in ATTR_PATTERN.findall(match.group(1))}
+        src = attrs.get('src', '')
+        if '/images/' not in src and not src.startswith('images/'):
+            return match.group(0)
+
+        filename = unquote(src.split('?', 1)[0].rsplit('/', 1)[-1])
+        if filename not in packed:
+            return match.group(0)
+
+        prefix = src[:src.rfind('images/')]
+        sprite_href = f'{prefix}images/{SPRITE_NAME}#{symbol_id(filename)}'
+
+        classes = ' '.join(filter(None, [attrs.get('class', ''), SPRITE_CLASS]))
+        parts = [f'class="{classes}"']
+        for name in ('id', 'style', 'width', 'height'):
+            if name in attrs:
+                parts.append(f'{name}="{attrs[name]}"')
+        if 'width' not in attrs and 'height' not in attrs:
+            size = metadata.get_size(filename)
+            if size:
+                parts.append(f'width="{size[0]}" height="{size[1]}"')
+
+        alt = attrs.get('alt', '')
+        if alt:
+            parts.append(f'role="img" aria-label="{alt}"')
+        else:
+            parts.append('aria-hidden="true"')
+
+        count += 1
+        return f'<svg {" ".join(parts)}><use href="{sprite_href}"></use></svg>'
+
+    new_content = IMG_TAG_PATTERN.sub(replace_img, content)
+    if count:
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+    return count
+
+
+def sprite_selector(selector):
+    """把以 img 结尾的选择器转换为对应的 svg.sprite-icon 选择器, 不相关时返回None"""
+    new_selector, replaced = re.subn(r'(^|[\s>+~])img((?:[.:\[#][^\s>+~]*)?)$',
+                                     rf'\1svg.{SPRITE_CLASS}\2', selector)
+    return new_selector if replaced else None
+
+
+def collect_sprite_rules(nodes):
+    """为图标 img 规则生成对应的 svg 规则"""
+    rules = []
+    for node in nodes:
+        if node[0] == 'rule':
+            selectors = [s for s in map(sprite_selector, split_selectors(node[1])) if s]
+            if selectors:
+                rules.append(('rule', ', '.join(selectors), node[2]))
+        elif node[0] == 'block':
+            children = collect_sprite_rules(node[2])
+            if children:
+                rules.append(('block', node[1], children))
+    return rules
+
+
+def update_stylesheet(css_file):
+    """在样式表末尾写入 (或更新) 雪碧图标规则"""
+    content = css_file.read_text(encoding='utf-8')
+    content = re.sub(re.escape(CSS_MARKER_START) + r'.*?' + re.escape(CSS_MARKER_END) + r'\n?',
+                     '', content, flags=re.DOTALL).rstrip() + '\n'
+
+    rules = collect_sprite_rules(parse_css(content))
+    if rules:
+        content += '\n'.join(['', CSS_MARKER_START, serialize_css(rules), CSS_MARKER_END]) + '\n'
+    css_file.write_text(content, encoding='utf-8')
+    return len(rules)
+
+
+def main():
+    site_root = require_build_dir(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR)
+    images_dir = site_root / 'images'
+
+    icons = collect_icons(images_dir)
+    packed = build_sprite(icons, images_dir / SPRITE_NAME)
+    sprite_size = (images_dir / SPRITE_NAME).stat().st_size
+    print(f"已生成雪碧图 {SPRITE_NAME}: {len(packed)} 个图标, {sprite_size / 1024:.1f} KB")
+
+    metadata = ImageMetadataCache(images_dir)
+    html_files = list(site_root.glob('*.html')) + list(site_root.glob('articles/*.html'))
+    total = 0
+    for html_file in html_files:
+        count = rewrite_img_tags(html_file, packed, metadata)
+        if count:
+            print(f"  - {html_file.relative_to(site_root)}: 合并 {count} 个图标请求")
+        total += count
+    metadata.save()
+
+    for css_file in sorted((site_root / 'css').glob('*.css')):
+        rules = update_stylesheet(css_file)
+        print(f"已更新样式表 {css_file.name}: {rules} 条图标规则")
+
+    print(f"\n共改写 {total} 处图标引用")
+
+
+if __name__ == '__main__':
+    main()
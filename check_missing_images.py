@@ -4,6 +4,7 @@
 import os
 import re
 from pathlib import Path
+from minify_svgs import minify_svg
 
 def get_referenced_images():
     """获取所有HTML文件中引用的图片"""
@@ -113,7 +114,7 @@ def main():
             if img.endswith('.svg'):
                 # 创建SVG文件
                 title = img.replace('-', ' ').replace('.svg', '').title()
-                svg_content = create_missing_svg(img, title)
+                svg_content = minify_svg(create_missing_svg(img, title))
                 
                 try:
                     with open(img_path, 'w', encoding='utf-8') as f:
@@ -130,7 +131,7 @@ def main():
                 
                 if not placeholder_path.exists():
                     title = img.replace('-', ' ').rsplit('.', 1)[0].title()
-                    svg_content = create_missing_svg(placeholder_name, title)
+                    svg_content = minify_svg(create_missing_svg(placeholder_name, title))
                     
                     try:
                         with open(placeholder_path, 'w', encoding='utf-8') as f:
@@ -2,41 +2,18 @@
 # -*- coding: utf-8 -*-
 """
 图片文件清理脚本
-分析当前网站使用的图片文件，删除未使用的文件
+分析当前网站使用的图片文件，列出未使用的文件 (不做任何修改)
+引用分析和隔离由 image_gc.py 完成, 覆盖 articles/、CSS、JS 等全站引用
 """
 
-import os
-import re
 from pathlib import Path
 
+from image_gc import find_unused_images
+
 def get_used_images():
-    """获取网站中实际使用的所有图片文件"""
-    used_images = set()
-    project_root = Path('.')
-    
-    # 搜索所有HTML文件中的图片引用
-    html_files = list(project_root.glob('*.html'))
-    
-    for html_file in html_files:
-        try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # 查找所有图片引用
-            # 匹配 src="images/filename.ext" 格式
-            img_matches = re.findall(r'src=["\']images/([^"\'\']+)["\']', content)
-            for img in img_matches:
-                used_images.add(img)
-                
-            # 匹配 content="...images/filename.ext" 格式 (meta标签)
-            meta_matches = re.findall(r'content=["\'][^"\'\']*images/([^"\'\']+)["\']', content)
-            for img in meta_matches:
-                used_images.add(img)
-                
-        except Exception as e:
-            print(f"读取文件 {html_file} 时出错: {e}")
-    
-    return used_images
+    """获取网站中实际使用的所有图片文件 (基于全站引用索引)"""
+    all_images, unused, _ = find_unused_images(Path('.').resolve())
+    return set(all_images) - set(unused)
 
 def get_all_image_files():
     """获取images目录下的所有图片文件"""
@@ -70,27 +47,11 @@ def main():
         for img in sorted(unused_images):
             print(f"  - {img}")
         
-        # 询问是否删除
-        response = input(f"\n是否删除这 {len(unused_images)} 个未使用的图片文件? (y/N): ")
-        if response.lower() in ['y', 'yes']:
-            images_dir = Path('images')
-            deleted_count = 0
-            
-            for img in unused_images:
-                img_path = images_dir / img
-                try:
-                    img_path.unlink()
-                    deleted_count += 1
-                    print(f"已删除: {img}")
-                except Exception as e:
-                    print(f"删除 {img} 时出错: {e}")
-            
-            print(f"\n成功删除 {deleted_count} 个未使用的图片文件")
-            print(f"images目录现在有 {len(all_images) - deleted_count} 个文件")
-        else:
-            print("取消删除操作")
+        
+        # 只输出报告, 需要清理时运行 auto_cleanup_images.py 把这些文件移到隔离目录
+        print("\n运行 python auto_cleanup_images.py 可把这些文件移到隔离目录 (可恢复)")
     else:
-        print("所有图片文件都在使用中，无需删除")
+        print("所有图片文件都在使用中，无需清理")
     
     print("\n实际使用的图片文件:")
     for img in sorted(used_images):
@@ -17,12 +17,15 @@ import os
 import re
 import random
 from pathlib import Path
+from urllib.parse import unquote
 from bs4 import BeautifulSoup
+from image_metadata import ImageMetadataCache
 
 class ComprehensiveArticleOptimizer:
     def __init__(self, articles_dir):
         self.articles_dir = Path(articles_dir)
         self.image_files = self._get_available_images()
+        self.image_metadata = ImageMetadataCache(self.articles_dir.parent / 'images')
         self.processed_count = 0
         
     def _get_available_images(self):
@@ -37,6 +40,15 @@ class ComprehensiveArticleOptimizer:
         available = [img for img in self.image_files if img != exclude]
         return random.sample(available, min(count, len(available)))
     
+    def _apply_image_size(self, img):
+        """根据图片元数据设置真实的 width/height 属性, 避免布局偏移"""
+        src = img.get('src', '')
+        if '/images/' not in src and not src.startswith('images/'):
+            return
+        size = self.image_metadata.get_size(unquote(src.rsplit('/', 1)[-1]))
+        if size:
+            img['width'], img['height'] = str(size[0]), str(size[1])
+    
     def _detect_article_type(self, content, filename):
         """检测文章类型"""
         content_lower = content.lower()
@@ -545,6 +557,8 @@ class ComprehensiveArticleOptimizer:
                         new_image = random.choice(available_images)
                         img['src'] = f'../images/{new_image}'
                         used_images.add(new_image)
+            
+            self._apply_image_size(img)
         
         return used_images
     
@@ -595,6 +609,7 @@ class ComprehensiveArticleOptimizer:
         img['style'] = 'width: 640px; height: 640px; object-fit: cover; border-radius: 8px;'
         if css_class:
             img['class'] = css_class
+        self._apply_image_size(img)
         
         return img
     
@@ -738,6 +753,8 @@ class ComprehensiveArticleOptimizer:
             
             self.optimize_article(file_path)
         
+        self.image_metadata.save()
+        
         print(f"\n🎉 全面优化完成!")
         print(f"📊 处理统计:")
         print(f"   - 总文章数: {len(html_files)}")
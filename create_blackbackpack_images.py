@@ -98,49 +98,16 @@ def create_backpack_svg(number, theme):
 def create_blackbackpack_images():
     """创建所需的blackbackpack图片"""
     base_dir = Path('.')
-    images_dir = base_dir / 'images'
     
-    # 定义主题分配
-    theme_mapping = {
-        1: 'business', 2: 'business', 3: 'business', 4: 'business',
-        5: 'sports', 6: 'sports', 7: 'sports', 8: 'sports',
-        9: 'outdoor', 10: 'outdoor', 11: 'outdoor', 12: 'outdoor',
-        13: 'school', 14: 'school', 15: 'school', 16: 'school',
-        17: 'business', 18: 'business', 19: 'business', 20: 'business',
-        21: 'tactical', 22: 'tactical', 23: 'tactical', 24: 'tactical',
-        25: 'travel', 26: 'travel', 27: 'travel', 28: 'travel',
-        29: 'business', 30: 'business', 31: 'business', 32: 'business',
-        33: 'outdoor', 34: 'outdoor', 35: 'outdoor', 36: 'outdoor',
-        37: 'sports', 38: 'sports', 39: 'sports', 40: 'sports',
-        41: 'tactical', 42: 'tactical', 43: 'tactical', 44: 'tactical',
-        45: 'travel', 46: 'travel', 47: 'travel', 48: 'travel',
-        49: 'school', 50: 'school', 51: 'school', 52: 'school',
-        53: 'business', 54: 'business', 55: 'business', 56: 'business'
-    }
-    
-    # 创建blackbackpack (X).webp文件
-    for i in range(1, 57):  # 创建1-56号图片
-        filename = f"blackbackpack ({i}).webp"
-        filepath = images_dir / filename
-        
-        if not filepath.exists():
-            # 创建对应的SVG文件
-            svg_filename = f"blackbackpack-{i}.svg"
-            svg_filepath = images_dir / svg_filename
-            
-            theme = theme_mapping.get(i, 'business')
-            svg_content = create_backpack_svg(i, theme)
-            
-            with open(svg_filepath, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            
-            print(f"Created SVG: {svg_filename}")
-            
-            # 创建一个简单的占位符webp文件（实际上是SVG内容）
-            # 由于我们无法直接创建webp文件，我们创建SVG并在HTML中引用SVG
-            print(f"SVG created for: {filename}")
+    # 主题分配在 svg_spec.json 的 blackbackpack 组中维护,
+    # 组中的 unless_exists 保证只为没有对应webp图片的编号创建SVG
+    from generate_svgs import generate_svgs
+
+    created = generate_svgs(groups=['blackbackpack'])
+    for svg_filename in created:
+        print(f"Created SVG: {svg_filename}")
     
-    print(f"\n已创建 {len(theme_mapping)} 个背包主题SVG图片")
+    print(f"\n已创建 {len(created)} 个背包主题SVG图片")
     
     # 更新HTML文件，将.webp引用替换为.svg
     html_files = list(base_dir.glob('*.html')) + list(base_dir.glob('articles/*.html'))
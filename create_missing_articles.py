@@ -6,8 +6,33 @@ Create missing article pages based on articles.html links
 
 import os
 import re
+import hashlib
 from datetime import datetime
 
+from site_templates import RenderCache, render_page, render_fragment, root_prefix
+
+def render_article(page, template_data):
+    """Render one generated article page through the shared layout"""
+    # Render the body fragment; nav and footer come from the shared layout partials
+    body = render_fragment(
+        'article',
+        root=root_prefix(page),
+        category='Manufacturing',
+        date=datetime.now().strftime('%B %d, %Y'),
+        title=template_data['title'],
+        image=template_data['image'],
+        body=template_data['content'].strip(),
+    )
+    return render_page(
+        page,
+        f"{template_data['title']} | Black Backpack Manufacturing",
+        body,
+        description=template_data['description'],
+        keywords=f"backpack manufacturing, {template_data['title'].lower()}, custom backpacks, B2B manufacturing",
+        stylesheets=['css/style.css', 'css/article.css'],
+        scripts=['js/main.js'],
+    )
+
 def create_missing_articles():
     """Create missing article HTML files"""
     
@@ -48,7 +73,8 @@ def create_missing_articles():
     def get_article_template(filename):
         # Extract topic from filename
         topic = filename.replace('.html', '').replace('-', ' ').title()
-        image_num = (hash(filename) % 50) + 1
+        # Stable across runs so the render cache sees unchanged template data
+        image_num = int(hashlib.md5(filename.encode('utf-8')).hexdigest(), 16) % 50 + 1
         return {
             'title': topic,
             'description': f'Comprehensive guide to {topic.lower()} in the backpack manufacturing industry.',
@@ -125,130 +151,21 @@ def create_missing_articles():
     
     created_count = 0
     
+    cache = RenderCache('.')
     for article_file in missing_articles:
-        article_path = os.path.join(articles_dir, article_file)
-        
-        # Skip if file already exists
-        if os.path.exists(article_path):
-            print(f"Skipping {article_file} - already exists")
-            continue
-        
-        # Get template data
+        page = f"{articles_dir}/{article_file}"
         template_data = get_article_template(article_file)
-        
-        # Generate HTML content
-        html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{template_data['title']} | Black Backpack Manufacturing</title>
-    <meta name="description" content="{template_data['description']}">
-    <meta name="keywords" content="backpack manufacturing, {template_data['title'].lower()}, custom backpacks, B2B manufacturing">
-    <link rel="stylesheet" href="../css/styles.css">
-    <link rel="stylesheet" href="../css/article.css">
-</head>
-<body>
-    <header>
-        <nav class="navbar">
-            <div class="nav-container">
-                <div class="nav-logo">
-                    <a href="../index.html">
-                        <img src="../images/logo.svg" alt="Black Backpack Logo" class="logo">
-                    </a>
-                </div>
-                <ul class="nav-menu">
-                    <li class="nav-item"><a href="../index.html" class="nav-link">Home</a></li>
-                    <li class="nav-item"><a href="../products.html" class="nav-link">Products</a></li>
-                    <li class="nav-item"><a href="../blog.html" class="nav-link">Blog</a></li>
-                    <li class="nav-item"><a href="../articles.html" class="nav-link active">Articles</a></li>
-                    <li class="nav-item"><a href="../contact.html" class="nav-link">Contact</a></li>
-                </ul>
-                <div class="hamburger">
-                    <span class="bar"></span>
-                    <span class="bar"></span>
-                    <span class="bar"></span>
-                </div>
-            </div>
-        </nav>
-    </header>
-
-    <main class="article-main">
-        <article class="article-content">
-            <header class="article-header">
-                <div class="article-meta">
-                    <span class="article-category">Manufacturing</span>
-                    <span class="article-date">{datetime.now().strftime('%B %d, %Y')}</span>
-                </div>
-                <h1 class="article-title">{template_data['title']}</h1>
-                <div class="article-image">
-                    <img src="../images/{template_data['image']}" alt="{template_data['title']}" loading="lazy">
-                </div>
-            </header>
-
-            <div class="article-body">
-                {template_data['content']}
-                
-                <section class="conclusion">
-                    <h2>Conclusion</h2>
-                    <p>The backpack manufacturing industry continues to evolve with new technologies and consumer demands. By implementing these strategies and best practices, manufacturers can stay competitive while delivering high-quality products that meet and exceed market expectations. Success in this industry requires a commitment to continuous improvement, innovation, and customer satisfaction.</p>
-                </section>
-            </div>
-
-            <footer class="article-footer">
-                <div class="author-info">
-                    <img src="../images/author-manufacturing-expert.jpg" alt="Manufacturing Expert" class="author-avatar">
-                    <div class="author-details">
-                        <h4>Manufacturing Expert</h4>
-                        <p>Specialist in backpack manufacturing and industry best practices</p>
-                    </div>
-                </div>
-                
-                <div class="article-tags">
-                    <span class="tag">Manufacturing</span>
-                    <span class="tag">Backpacks</span>
-                    <span class="tag">Industry Guide</span>
-                </div>
-            </footer>
-        </article>
-    </main>
 
-    <footer class="site-footer">
-        <div class="footer-content">
-            <div class="footer-section">
-                <h3>Black Backpack Manufacturing</h3>
-                <p>Leading manufacturer of high-quality custom backpacks for businesses worldwide.</p>
-            </div>
-            <div class="footer-section">
-                <h4>Quick Links</h4>
-                <ul>
-                    <li><a href="../products.html">Products</a></li>
-                    <li><a href="../blog.html">Blog</a></li>
-                    <li><a href="../articles.html">Articles</a></li>
-                    <li><a href="../contact.html">Contact</a></li>
-                </ul>
-            </div>
-            <div class="footer-section">
-                <h4>Contact Info</h4>
-                <p>Email: cco@junyuanbags.com</p>
-                <p>Phone: WhatsApp +86 17750020688</p>
-            </div>
-        </div>
-        <div class="footer-bottom">
-            <p>&copy; 2024 Black Backpack Manufacturing. All rights reserved.</p>
-        </div>
-    </footer>
+        # Only pages whose template data, layout or partials changed are re-rendered;
+        # existing articles that were not generated here are left alone
+        if not cache.build(page, render_article, page, template_data, fragment='article'):
+            print(f"Skipping {article_file} - up to date or not generated by this script")
+            continue
 
-    <script src="../js/main.js"></script>
-</body>
-</html>'''
-        
-        # Write the file
-        with open(article_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
         created_count += 1
         print(f"Created: {article_file}")
+
+    cache.save()
     
     print(f"\nTotal articles created: {created_count}")
     print("All missing articles have been generated successfully!")
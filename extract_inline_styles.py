@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+内联样式提取脚本
+统计 articles/ 中重复出现的 style 属性 (例如插入图片的
+style="width: 640px; height: 640px; object-fit: cover; border-radius: 8px;"),
+为出现次数足够多的样式生成 css/article.css 中的类, 把 style 属性替换为 class,
+并输出文章HTML体积的变化
+
+生成的规则使用 ":root 标签.类名" 选择器, 优先级 (0,2,1) 高于样式表和页面 <style> 中
+.article-image img 等针对文章图片的规则 (最高 (0,1,1)), 包括媒体查询中的规则,
+保持原来内联样式覆盖样式表的效果; 不用 .article-content 限定, 因为不是所有文章都有这个容器.
+图片同时写入 width/height 属性,
+apply_loading_hints.py 等脚本仍然可以从标签上读取显示尺寸
+
+用法: python extract_inline_styles.py [站点目录]
+"""
+
+import re
+import sys
+import hashlib
+from pathlib import Path
+
+# 同一个样式至少出现这么多次才提取为类
+MIN_OCCURRENCES = 3
+
+CLASS_PREFIX = 'is-'
+CSS_MARKER_START = '/* inline style classes: generated by extract_inline_styles.py */'
+CSS_MARKER_END = '/* end inline style classes */'
+
+# 生成规则的选择器前缀, 提高优先级以代替内联样式
+SELECTOR_SCOPE = ':root '
+
+# 内联SVG中的样式 (渐变 stop 等) 不处理
+SVG_TAGS = {'svg', 'g', 'path', 'rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon',
+            'text', 'tspan', 'stop', 'lineargradient', 'radialgradient', 'defs', 'use', 'symbol'}
+
+STYLED_TAG_PATTERN = re.compile(
+    r'<([a-zA-Z][\w-]*)\b([^>]*?)\sstyle=(["\'])(.*?)\3([^>]*)>', re.DOTALL)
+CLASS_ATTR_PATTERN = re.compile(r'\sclass=(["\'])(.*?)\1', re.DOTALL)
+STYLESHEET_LINK_PATTERN = re.compile(r'<link[^>]+rel=["\']stylesheet["\'][^>]*>', re.IGNORECASE)
+
+
+def normalize_style(style):
+    """规范化样式声明, 相同的声明得到相同的结果"""
+    declarations = []
+    for declaration in style.split(';'):
+        if ':' not in declaration:
+            continue
+        prop, value = declaration.split(':', 1)
+        declarations.append(f'{prop.strip().lower()}: {" ".join(value.split())}')
+    return '; '.join(declarations)
+
+
+def class_name(tag, style):
+    """根据标签和样式生成稳定的类名, 重复运行时类名不变"""
+    digest = hashlib.md5(f'{tag}|{style}'.encode('utf-8')).hexdigest()[:6]
+    return f'{CLASS_PREFIX}{tag}-{digest}'
+
+
+def iter_styled_tags(content):
+    """遍历带 style 属性的HTML元素, 返回 (match, 标签名, 规范化样式)"""
+    for match in STYLED_TAG_PATTERN.finditer(content):
+        tag = match.group(1).lower()
+        if tag in SVG_TAGS:
+            continue
+        style = normalize_style(match.group(4))
+        if style:
+            yield match, tag, style
+
+
+def collect_styles(html_files):
+    """统计所有文章中 (标签, 样式) 的出现次数"""
+    counts = {}
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        for _, tag, style in iter_styled_tags(content):
+            counts[(tag, style)] = counts.get((tag, style), 0) + 1
+    return counts
+
+
+def replace_styles(content, classes):
+    """把页面中可提取的 style 属性替换为类"""
+    replaced = 0
+
+    def replace_tag(match):
+        nonlocal replaced
+        tag = match.group(1).lower()
+        name = classes.get((tag, normalize_style(match.group(4))))
+        if tag in SVG_TAGS or not name:
+            return match.group(0)
+
+        attrs = match.group(2) + match.group(5)
+        class_match = CLASS_ATTR_PATTERN.search(attrs)
+        if class_match:
+            existing = class_match.group(2).split()
+            if name not in existing:
+                existing.append(name)
+            attrs = (attrs[:class_match.start()] + f' class="{" ".join(existing)}"'
+                     + attrs[class_match.end():])
+        else:
+            attrs = f' class="{name}"' + attrs
+
+        # 图片保留像素尺寸作为 width/height 属性, 浏览器加载前即可预留空间
+        if tag == 'img' and not re.search(r'\swidth=', attrs):
+            declarations = dict(item.split(': ', 1) for item in normalize_style(match.group(4)).split('; '))
+            width = re.fullmatch(r'(\d+)px', declarations.get('width', ''))
+            height = re.fullmatch(r'(\d+)px', declarations.get('height', ''))
+            if width and height:
+                closing = '/' if attrs.endswith('/') else ''
+                attrs = attrs[:len(attrs) - len(closing)] + f' width="{width.group(1)}" height="{height.group(1)}"' + closing
+
+        replaced += 1
+        return f'<{match.group(1)}{attrs}>'
+
+    return STYLED_TAG_PATTERN.sub(replace_tag, content), replaced
+
+
+def ensure_stylesheet_link(content, href):
+    """页面没有引用生成类所在的样式表时, 在最后一个样式表之后加上链接"""
+    if href in content:
+        return content
+    links = list(STYLESHEET_LINK_PATTERN.finditer(content))
+    head_end = content.find('</head>')
+    position = links[-1].end() if links else head_end
+    if position == -1:
+        return content
+    return content[:position] + f'\n<link rel="stylesheet" href="{href}">' + content[position:]
+
+
+def render_rules(classes):
+    """生成样式表中的类规则"""
+    lines = [CSS_MARKER_START]
+    for (tag, style), name in sorted(classes.items(), key=lambda item: item[1]):
+        lines.append(f'{SELECTOR_SCOPE}{tag}.{name} {{')
+        for declaration in style.split('; '):
+            lines.append(f'    {declaration};')
+        lines.append('}')
+    lines.append(CSS_MARKER_END)
+    return '\n'.join(lines) + '\n'
+
+
+def update_stylesheet(css_file, classes):
+    """在 article.css 末尾写入 (或更新) 生成的类规则"""
+    content = css_file.read_text(encoding='utf-8') if css_file.exists() else ''
+    existing = re.search(re.escape(CSS_MARKER_START) + r'.*?' + re.escape(CSS_MARKER_END) + r'\n?',
+                         content, re.DOTALL)
+    if existing:
+        # 保留之前运行生成的类, 已经替换过的页面仍然需要它们
+        for match in re.finditer(r'^(?:' + re.escape(SELECTOR_SCOPE) + r')?(\w+)\.(' + re.escape(CLASS_PREFIX)
+                                 + r'[\w-]+) \{\n(.*?)\n\}',
+                                 existing.group(0), re.DOTALL | re.MULTILINE):
+            style = '; '.join(line.strip().rstrip(';') for line in match.group(3).splitlines())
+            classes.setdefault((match.group(1), style), match.group(2))
+        content = content[:existing.start()] + content[existing.end():]
+
+    content = content.rstrip() + '\n\n' + render_rules(classes)
+    css_file.write_text(content, encoding='utf-8')
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.').resolve()
+    html_files = sorted(site_root.glob('articles/*.html'))
+    css_file = site_root / 'css' / 'article.css'
+
+    print(f"开始统计 {len(html_files)} 篇文章中的内联样式...")
+    counts = collect_styles(html_files)
+    classes = {key: class_name(*key) for key, count in counts.items() if count >= MIN_OCCURRENCES}
+
+    if not classes:
+        print("没有重复出现的内联样式, 无需提取")
+        # 之前生成的规则按当前的选择器格式重新写入
+        if css_file.exists() and CSS_MARKER_START in css_file.read_text(encoding='utf-8'):
+            update_stylesheet(css_file, classes)
+        return
+
+    for (tag, style), name in sorted(classes.items(), key=lambda item: -counts[item[0]]):
+        print(f"  - {tag}.{name}: {counts[(tag, style)]} 次  [{style}]")
+
+    total_before = 0
+    total_after = 0
+    updated = 0
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        new_content, replaced = replace_styles(content, classes)
+        if replaced:
+            new_content = ensure_stylesheet_link(new_content, '../css/article.css')
+
+        total_before += len(content.encode('utf-8'))
+        total_after += len(new_content.encode('utf-8'))
+        if new_content != content:
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+            updated += 1
+
+    update_stylesheet(css_file, classes)
+
+    saved = total_before - total_after
+    print(f"\n已生成 {len(classes)} 个类并写入 {css_file.relative_to(site_root)}, 更新了 {updated} 篇文章")
+    print(f"文章HTML: {total_before / 1024:.1f} KB -> {total_after / 1024:.1f} KB, "
+          f"减少 {saved / 1024:.1f} KB ({saved / max(total_before, 1) * 100:.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
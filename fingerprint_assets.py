@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+静态资源指纹化脚本
+将站点复制到发布目录 (或直接处理已有的发布目录), 把 css/js/images 重命名为 name.<hash>.ext,
+重写所有HTML(包括articles/中的 ../ 路径)和CSS中的引用, 并生成资源清单,
+这样除HTML之外的文件都可以设置永久缓存
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+from pathlib import Path
+from urllib.parse import unquote
+
+SITE_DOMAINS = ['https://www.blackbackpack.co.uk', 'https://blackbackpack.co.uk']
+
+# 不复制到发布目录的文件和目录
+EXCLUDE_PATTERNS = ['.*', '__pycache__', '*.py', '*.jsonl', '*.md', 'articles_backup_*',
+                    'verification_report.json', 'svg_spec.json', 'templates', 'tests', 'dist']
+
+# 需要指纹化的资源 (按顺序处理: 图片先处理, CSS引用图片, 最后是JS)
+ASSET_GROUPS = [
+    ('images', ['.svg', '.webp', '.jpg', '.jpeg', '.png', '.gif', '.ico']),
+    ('css', ['.css']),
+    ('articles', ['.css']),
+    ('js', ['.js']),
+]
+
+HASH_LENGTH = 8
+
+# 站点源目录 (脚本所在目录) 和默认的发布目录
+SOURCE_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT_DIR = 'dist'
+
+# 匹配HTML属性中的资源引用
+ATTR_PATTERN = re.compile(r'((?:src|href|content|data-src|poster)=)(["\'])([^"\']+)\2')
+SRCSET_PATTERN = re.compile(r'(srcset=)(["\'])([^"\']+)\2')
+# 匹配CSS中的 url(...) 引用
+CSS_URL_PATTERN = re.compile(r'url\((["\']?)([^"\')]+)\1\)')
+
+
+def content_hash(file_path):
+    """计算文件内容的短哈希"""
+    md5 = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            md5.update(chunk)
+    return md5.hexdigest()[:HASH_LENGTH]
+
+
+def fingerprinted_name(file_path, digest):
+    """生成带哈希的文件名: style.css -> style.1a2b3c4d.css"""
+    return f"{file_path.stem}.{digest}{file_path.suffix}"
+
+
+def copy_site(source_dir, output_dir):
+    """把站点复制到发布目录"""
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    shutil.copytree(source_dir, output_dir, ignore=shutil.ignore_patterns(*EXCLUDE_PATTERNS))
+
+
+def require_build_dir(path):
+    """检查原地改写页面的构建步骤的目标目录: 必须是已经存在的发布目录, 不能是站点源目录"""
+    build_dir = Path(path).resolve()
+    if build_dir == SOURCE_DIR:
+        print(f"✗ {build_dir} 是站点源目录, 这一步会原地改写页面和样式表, "
+              f"请在发布目录 (例如 {DEFAULT_OUTPUT_DIR}/) 上运行")
+        sys.exit(1)
+    if not build_dir.is_dir():
+        print(f"✗ 发布目录 {build_dir} 不存在")
+        sys.exit(1)
+    return build_dir
+
+
+def resolve_reference(site_root, page_dir, ref):
+    """把页面中的引用解析为相对站点根目录的路径, 无法解析时返回None"""
+    if ref.startswith(('data:', 'mailto:', 'tel:', 'javascript:', '#')):
+        return None
+
+    for domain in SITE_DOMAINS:
+        if ref.startswith(domain):
+            ref = ref[len(domain):]
+            break
+    else:
+        if re.match(r'^[a-z]+:', ref) or ref.startswith('//'):
+            return None
+
+    path = unquote(ref.split('#', 1)[0].split('?', 1)[0])
+    if not path:
+        return None
+
+    if path.startswith('/'):
+        target = site_root / path.lstrip('/')
+    else:
+        target = page_dir / path
+
+    try:
+        return Path(os.path.normpath(target)).relative_to(site_root).as_posix()
+    except ValueError:
+        return None
+
+
+def rewrite_reference(site_root, page_dir, ref, manifest):
+    """如果引用指向已指纹化的资源, 返回替换后的引用"""
+    resolved = resolve_reference(site_root, page_dir, ref)
+    if not resolved or resolved not in manifest:
+        return ref
+
+    old_name = resolved.rsplit('/', 1)[-1]
+    new_name = manifest[resolved].rsplit('/', 1)[-1]
+
+    # 只替换文件名部分, 保留原有的 ../ 前缀、域名、查询参数和锚点
+    for old, new in ((old_name, new_name), (old_name.replace(' ', '%20'), new_name.replace(' ', '%20'))):
+        if old in ref:
+            head, _, tail = ref.rpartition(old)
+            return head + new + tail
+    return ref
+
+
+def rewrite_html(html_file, site_root, manifest):
+    """重写HTML文件中的资源引用, 返回替换次数"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    page_dir = html_file.parent
+    count = 0
+
+    def replace_attr(match):
+        nonlocal count
+        new_ref = rewrite_reference(site_root, page_dir, match.group(3), manifest)
+        if new_ref != match.group(3):
+            count += 1
+        return f'{match.group(1)}{match.group(2)}{new_ref}{match.group(2)}'
+
+    def replace_srcset(match):
+        nonlocal count
+        entries = []
+        for entry in match.group(3).split(','):
+            parts = entry.strip().split(' ', 1)
+            new_ref = rewrite_reference(site_root, page_dir, parts[0], manifest)
+            if new_ref != parts[0]:
+                count += 1
+            entries.append(' '.join([new_ref] + parts[1:]))
+        return f'{match.group(1)}{match.group(2)}{", ".join(entries)}{match.group(2)}'
+
+    def replace_url(match):
+        nonlocal count
+        new_ref = rewrite_reference(site_root, page_dir, match.group(2), manifest)
+        if new_ref != match.group(2):
+            count += 1
+        return f'url({match.group(1)}{new_ref}{match.group(1)})'
+
+    content = ATTR_PATTERN.sub(replace_attr, content)
+    content = SRCSET_PATTERN.sub(replace_srcset, content)
+    content = CSS_URL_PATTERN.sub(replace_url, content)
+
+    if count:
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+    return count
+
+
+def rewrite_css(css_file, site_root, manifest):
+    """重写CSS文件中 url() 指向的资源"""
+    with open(css_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    page_dir = css_file.parent
+    new_content = CSS_URL_PATTERN.sub(
+        lambda m: f'url({m.group(1)}{rewrite_reference(site_root, page_dir, m.group(2), manifest)}{m.group(1)})',
+        content)
+
+    if new_content != content:
+        with open(css_file, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
+
+def fingerprint_assets(site_root):
+    """重命名所有资源文件并返回清单 {原路径: 新路径}"""
+    manifest = {}
+
+    for directory, extensions in ASSET_GROUPS:
+        asset_dir = site_root / directory
+        if not asset_dir.exists():
+            continue
+
+        for asset in sorted(asset_dir.iterdir()):
+            if not asset.is_file() or asset.suffix.lower() not in extensions:
+                continue
+
+            # CSS中可能引用了已经指纹化的图片, 先改写再计算哈希
+            if asset.suffix.lower() == '.css':
+                rewrite_css(asset, site_root, manifest)
+
+            new_path = asset.with_name(fingerprinted_name(asset, content_hash(asset)))
+            asset.rename(new_path)
+            manifest[asset.relative_to(site_root).as_posix()] = new_path.relative_to(site_root).as_posix()
+
+    return manifest
+
+
+def main():
+    source_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('.')
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(DEFAULT_OUTPUT_DIR)
+
+    source_dir = source_dir.resolve()
+    output_dir = output_dir.resolve()
+
+    # 源目录和发布目录相同时直接在原地处理 (例如已经运行过其他构建步骤的 dist/),
+    # 原地处理的目录不能是站点源目录
+    if output_dir == source_dir or output_dir == SOURCE_DIR:
+        require_build_dir(output_dir)
+    else:
+        print(f"复制站点到发布目录: {output_dir}")
+        copy_site(source_dir, output_dir)
+
+    print("开始指纹化静态资源...")
+    manifest = fingerprint_assets(output_dir)
+    print(f"已重命名 {len(manifest)} 个资源文件")
+
+    html_files = list(output_dir.glob('*.html')) + list(output_dir.glob('articles/*.html'))
+    total_refs = 0
+    for html_file in html_files:
+        total_refs += rewrite_html(html_file, output_dir, manifest)
+
+    manifest_path = output_dir / 'asset-manifest.json'
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+    print(f"已更新 {len(html_files)} 个HTML文件中的 {total_refs} 处引用")
+    print(f"资源清单已保存: {manifest_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -54,71 +54,20 @@ def fix_images():
     base_dir = Path('.')
     images_dir = base_dir / 'images'
     
-    # 需要创建的作者头像
-    author_images = {
-        'author-finance.jpg': ('Finance Expert', 'FINANCE'),
-        'author-manufacturing-expert.jpg': ('Manufacturing Expert', 'MFG'),
-        'author-market-research.jpg': ('Market Research', 'MARKET'),
-        'author-tech.jpg': ('Tech Expert', 'TECH'),
-        'author-design.jpg': ('Design Expert', 'DESIGN'),
-        'author-sustainability.jpg': ('Sustainability', 'ECO'),
-        'author-quality-control.jpg': ('Quality Expert', 'QC'),
-        'author-supply-chain.jpg': ('Supply Chain', 'SC'),
-        'author-business.jpg': ('Business Expert', 'BIZ'),
-        'author-innovation.jpg': ('Innovation', 'INNOV')
-    }
-    
-    # 需要创建的英雄图片
-    hero_images = {
-        'laptop-backpack-hero.jpg': 'Professional Laptop Backpacks',
-        'outdoor-backpack-hero.jpg': 'Professional Outdoor Backpacks',
-        'case-study-tech-company.jpg': 'Tech Company Case Study',
-        'case-study-university.jpg': 'University Case Study',
-        'case-study-retail.jpg': 'Retail Case Study'
-    }
-    
-    # 创建作者头像SVG
-    for filename, (name, role) in author_images.items():
-        svg_filename = filename.replace('.jpg', '.svg')
-        svg_path = images_dir / svg_filename
-        if not svg_path.exists():
-            svg_content = create_author_svg(svg_filename, name, role)
-            with open(svg_path, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            print(f"Created: {svg_filename}")
-    
-    # 创建英雄图片SVG
-    for filename, title in hero_images.items():
-        svg_filename = filename.replace('.jpg', '.svg')
-        svg_path = images_dir / svg_filename
-        if not svg_path.exists():
-            svg_content = create_hero_image_svg(svg_filename, title)
-            with open(svg_path, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            print(f"Created: {svg_filename}")
+    # 作者头像和英雄图片在 svg_spec.json 的 authors / heroes 组中维护
+    from generate_svgs import SPEC_FILE, expand_group, generate_svgs, load_spec
+
+    for svg_filename in generate_svgs(groups=['authors', 'heroes']):
+        print(f"Created: {svg_filename}")
     
     # 更新HTML文件中的图片引用
     html_files = list(base_dir.glob('*.html')) + list(base_dir.glob('articles/*.html'))
     
-    replacements = {
-        # 作者头像替换
-        'author-finance.jpg': 'author-finance.svg',
-        'author-manufacturing-expert.jpg': 'author-manufacturing-expert.svg',
-        'author-market-research.jpg': 'author-market-research.svg',
-        'author-tech.jpg': 'author-tech.svg',
-        'author-design.jpg': 'author-design.svg',
-        'author-sustainability.jpg': 'author-sustainability.svg',
-        'author-quality-control.jpg': 'author-quality-control.svg',
-        'author-supply-chain.jpg': 'author-supply-chain.svg',
-        'author-business.jpg': 'author-business.svg',
-        'author-innovation.jpg': 'author-innovation.svg',
-        # 英雄图片替换
-        'laptop-backpack-hero.jpg': 'laptop-backpack-hero.svg',
-        'outdoor-backpack-hero.jpg': 'outdoor-backpack-hero.svg',
-        'case-study-tech-company.jpg': 'case-study-tech-company.svg',
-        'case-study-university.jpg': 'case-study-university.svg',
-        'case-study-retail.jpg': 'case-study-retail.svg'
-    }
+    spec = load_spec(SPEC_FILE)
+    replacements = {}
+    for group in ('authors', 'heroes'):
+        for svg_filename, *_ in expand_group(group, spec['groups'][group]):
+            replacements[svg_filename.replace('.svg', '.jpg')] = svg_filename
     
     for html_file in html_files:
         try:
@@ -260,80 +260,15 @@ def create_svg_content(title, description, icon_type="tech"):
     return svg_content
 
 def main():
-    # Create images directory if it doesn't exist
-    images_dir = "images"
-    if not os.path.exists(images_dir):
-        os.makedirs(images_dir)
-    
-    # Define all SVG images needed for the article
-    svg_images = {
-        # Smart Technology Integration
-        "innovative-backpack-design.svg": ("Innovative Design", "2024 Backpack Innovations", "design"),
-        "wireless-charging-backpack.svg": ("Wireless Charging", "Built-in Power Solutions", "tech"),
-        "gps-tracking-backpack.svg": ("GPS Tracking", "Location & Security", "tech"),
-        "smart-organization-system.svg": ("Smart Organization", "Intelligent Compartments", "tech"),
-        "biometric-security-backpack.svg": ("Biometric Security", "Advanced Protection", "tech"),
-        "smart-backpack-adoption-stats.svg": ("Adoption Statistics", "Market Analysis 2024", "tech"),
-        
-        # Sustainable Design
-        "recycled-ocean-plastic-material.svg": ("Ocean Plastic", "Recycled Materials", "sustainable"),
-        "bio-based-materials.svg": ("Bio-Based Materials", "Sustainable Innovation", "sustainable"),
-        "recycled-textile-fibers.svg": ("Recycled Textiles", "Circular Economy", "sustainable"),
-        "design-for-disassembly.svg": ("Design for Disassembly", "Circular Design", "sustainable"),
-        "durability-optimization.svg": ("Durability Focus", "Long-lasting Design", "sustainable"),
-        "material-minimization.svg": ("Material Efficiency", "Waste Reduction", "sustainable"),
-        
-        # Modular Systems
-        "modular-compartment-system.svg": ("Modular Compartments", "Flexible Organization", "modular"),
-        "expandable-capacity-system.svg": ("Expandable Capacity", "Dynamic Volume", "modular"),
-        "convertible-design-system.svg": ("Convertible Design", "Multi-Function", "modular"),
-        "modular-design-benefits.svg": ("Design Benefits", "Market Advantages", "modular"),
-        
-        # Ergonomic Innovations
-        "adaptive-suspension-system.svg": ("Adaptive Suspension", "Dynamic Load Distribution", "ergonomic"),
-        "smart-weight-distribution.svg": ("Weight Distribution", "AI-Powered Balance", "ergonomic"),
-        "breathable-back-panel.svg": ("Ventilation System", "Advanced Airflow", "ergonomic"),
-        "posture-monitoring-system.svg": ("Posture Monitoring", "Health Tracking", "ergonomic"),
-        
-        # Aesthetic Trends
-        "minimalist-design-trend.svg": ("Minimalist Design", "Clean Aesthetics", "aesthetic"),
-        "retro-futuristic-design.svg": ("Retro-Futuristic", "Vintage Meets Future", "aesthetic"),
-        "nature-inspired-design.svg": ("Nature Inspired", "Organic Forms", "aesthetic"),
-        "urban-tactical-design.svg": ("Urban Tactical", "Technical Wear", "aesthetic"),
-        
-        # Advanced Functional Features
-        "climate-control-system.svg": ("Climate Control", "Temperature Regulation", "functional"),
-        "auto-organization-system.svg": ("Auto Organization", "Smart Compartments", "functional"),
-        "water-purification-system.svg": ("Water Purification", "Built-in Filtration", "functional"),
-        "emergency-communication-system.svg": ("Emergency Comm", "Safety Features", "functional"),
-        "performance-enhancement-features.svg": ("Performance Features", "User Optimization", "functional"),
-        
-        # Sidebar and Footer Images
-        "advanced-manufacturing-facility.svg": ("Manufacturing", "Advanced Techniques", "tech"),
-        "sustainable-backpack-manufacturing.svg": ("Sustainable Mfg", "Eco-Friendly Production", "sustainable"),
-        "backpack-materials-comparison.svg": ("Materials Guide", "Performance Comparison", "design"),
-        "design-inspiration-icon.svg": ("Design Inspiration", "Creative Resources", "design"),
-        "trend-forecast-icon.svg": ("Trend Forecast", "Future Predictions", "design"),
-        "color-palette-icon.svg": ("Color Palettes", "Seasonal Colors", "aesthetic"),
-        "logo.svg": ("Black Backpack", "Premium Manufacturing", "design")
-    }
-    
-    print(f"Generating {len(svg_images)} SVG images...")
-    
-    for filename, (title, description, icon_type) in svg_images.items():
-        filepath = os.path.join(images_dir, filename)
-        
-        # Generate SVG content
-        svg_content = create_svg_content(title, description, icon_type)
-        
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
-        
-        print(f"Created: {filepath}")
-    
+    # 图片列表在 svg_spec.json 的 article-trends 组中维护, 由批量生成引擎按需生成
+    from generate_svgs import generate_svgs
+
+    written = generate_svgs(groups=['article-trends'])
+    for filename in written:
+        print(f"Created: {os.path.join('images', filename)}")
+
     print("\nAll SVG images generated successfully!")
-    print(f"Images saved to: {os.path.abspath(images_dir)}")
+    print(f"Images saved to: {os.path.abspath('images')}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+生成 sitemap.xml 和 robots.txt
+遍历根目录页面和 articles/ 目录, 根据内容哈希判断页面是否变化,
+只有变化的页面才更新 lastmod (取文件修改时间), URL超过50000条时拆分为多个
+sitemap文件并生成索引, 没有任何变化时不重写文件
+页面哈希缓存 .sitemap-cache.json 只保存在本地, 不提交; 没有缓存时 (例如刚克隆的仓库)
+沿用现有 sitemap 中的 lastmod, 不会把所有页面都标记为刚修改
+"""
+
+import re
+import sys
+import json
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+from xml.sax.saxutils import escape, unescape
+
+CACHE_FILE = '.sitemap-cache.json'
+MAX_URLS_PER_SITEMAP = 50000
+
+SITEMAP_URL_PATTERN = re.compile(r'<url>\s*<loc>([^<]+)</loc>\s*<lastmod>([^<]+)</lastmod>')
+
+# 不需要被收录的页面
+EXCLUDED_PAGES = {'404.html'}
+
+PRIORITIES = {
+    'index.html': '1.0',
+    'blog.html': '0.9',
+    'products.html': '0.9',
+}
+
+
+def get_base_url(site_root):
+    """从CNAME读取站点域名"""
+    cname_file = site_root / 'CNAME'
+    if cname_file.exists():
+        domain = cname_file.read_text(encoding='utf-8').strip()
+        if domain:
+            return f'https://{domain}'
+    return 'https://www.blackbackpack.co.uk'
+
+
+def get_site_pages(site_root):
+    """获取所有需要写入sitemap的页面"""
+    pages = []
+    for html_file in sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html')):
+        if html_file.name in EXCLUDED_PAGES:
+            continue
+
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # 跳过声明了noindex的页面
+        if re.search(r'<meta[^>]+name=["\']robots["\'][^>]+noindex', content, re.IGNORECASE):
+            continue
+
+        pages.append((html_file, hashlib.md5(content.encode('utf-8')).hexdigest()))
+    return pages
+
+
+def page_url(base_url, site_root, html_file):
+    """把页面路径转换为完整URL"""
+    relative = html_file.relative_to(site_root).as_posix()
+    if relative == 'index.html':
+        return f'{base_url}/'
+    return f'{base_url}/{relative}'
+
+
+def load_cache(cache_path):
+    """读取上次生成时的页面哈希和lastmod"""
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"读取缓存 {cache_path} 失败, 将重新生成: {e}")
+    return {}
+
+
+def load_published_lastmods(site_root):
+    """读取现有sitemap文件中每个URL的lastmod"""
+    lastmods = {}
+    for sitemap_file in [site_root / 'sitemap.xml'] + sorted(site_root.glob('sitemap-*.xml')):
+        if sitemap_file.exists():
+            content = sitemap_file.read_text(encoding='utf-8')
+            lastmods.update((unescape(url), lastmod) for url, lastmod in SITEMAP_URL_PATTERN.findall(content))
+    return lastmods
+
+
+def build_entries(site_root, base_url, cache):
+    """生成sitemap条目, 返回 (条目列表, 新缓存, 变化的页面数)"""
+    entries = []
+    new_cache = {}
+    changed = 0
+    published = load_published_lastmods(site_root) if not cache else {}
+
+    for html_file, digest in get_site_pages(site_root):
+        url = page_url(base_url, site_root, html_file)
+        cached = cache.get(url)
+
+        if cached and cached['hash'] == digest:
+            lastmod = cached['lastmod']
+        elif not cache and url in published:
+            # 没有缓存时无法判断页面是否变化, 沿用已发布的lastmod
+            lastmod = published[url]
+        else:
+            mtime = datetime.fromtimestamp(html_file.stat().st_mtime, tz=timezone.utc)
+            lastmod = mtime.strftime('%Y-%m-%d')
+            changed += 1
+
+        if html_file.parent.name == 'articles':
+            priority = '0.7'
+        else:
+            priority = PRIORITIES.get(html_file.name, '0.8')
+
+        entries.append({'url': url, 'lastmod': lastmod, 'priority': priority})
+        new_cache[url] = {'hash': digest, 'lastmod': lastmod}
+
+    # 被删除的页面也算作变化
+    changed += len(set(cache) - set(new_cache))
+    return entries, new_cache, changed
+
+
+def render_urlset(entries):
+    """生成 <urlset> 格式的sitemap"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for entry in entries:
+        lines.append('  <url>')
+        lines.append(f'    <loc>{escape(entry["url"])}</loc>')
+        lines.append(f'    <lastmod>{entry["lastmod"]}</lastmod>')
+        lines.append(f'    <priority>{entry["priority"]}</priority>')
+        lines.append('  </url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+
+def render_index(base_url, chunks):
+    """生成 <sitemapindex> 格式的索引"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for name, chunk in chunks:
+        lines.append('  <sitemap>')
+        lines.append(f'    <loc>{escape(base_url)}/{name}</loc>')
+        lines.append(f'    <lastmod>{max(entry["lastmod"] for entry in chunk)}</lastmod>')
+        lines.append('  </sitemap>')
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines) + '\n'
+
+
+def write_if_changed(file_path, content):
+    """内容有变化时才写入文件"""
+    if file_path.exists() and file_path.read_text(encoding='utf-8') == content:
+        return False
+    file_path.write_text(content, encoding='utf-8')
+    return True
+
+
+def write_sitemaps(site_root, base_url, entries):
+    """写入sitemap文件, 超过上限时拆分并生成索引"""
+    written = []
+
+    if len(entries) <= MAX_URLS_PER_SITEMAP:
+        if write_if_changed(site_root / 'sitemap.xml', render_urlset(entries)):
+            written.append('sitemap.xml')
+        stale = sorted(site_root.glob('sitemap-*.xml'))
+    else:
+        chunks = []
+        for i in range(0, len(entries), MAX_URLS_PER_SITEMAP):
+            name = f'sitemap-{i // MAX_URLS_PER_SITEMAP + 1}.xml'
+            chunk = entries[i:i + MAX_URLS_PER_SITEMAP]
+            chunks.append((name, chunk))
+            if write_if_changed(site_root / name, render_urlset(chunk)):
+                written.append(name)
+
+        if write_if_changed(site_root / 'sitemap.xml', render_index(base_url, chunks)):
+            written.append('sitemap.xml')
+        names = {name for name, _ in chunks}
+        stale = [f for f in sorted(site_root.glob('sitemap-*.xml')) if f.name not in names]
+
+    # 删除拆分数量减少后多余的sitemap文件
+    for stale_file in stale:
+        stale_file.unlink()
+        print(f"已删除过期的 {stale_file.name}")
+
+    return written
+
+
+def write_robots(site_root, base_url):
+    """生成robots.txt, 指向sitemap.xml"""
+    lines = ['User-agent: *', 'Allow: /']
+    # 文章备份目录不需要被抓取
+    for backup_dir in sorted(site_root.glob('articles_backup_*')):
+        lines.append(f'Disallow: /{backup_dir.name}/')
+    lines += ['', f'Sitemap: {base_url}/sitemap.xml']
+    content = '\n'.join(lines) + '\n'
+    return write_if_changed(site_root / 'robots.txt', content)
+
+
+def update_sitemap(site_root):
+    """按需更新sitemap和robots.txt, 返回写入的文件名列表"""
+    base_url = get_base_url(site_root)
+    cache_path = site_root / CACHE_FILE
+
+    print(f"开始生成sitemap: {base_url}")
+
+    cache = load_cache(cache_path)
+    entries, new_cache, changed = build_entries(site_root, base_url, cache)
+    print(f"共 {len(entries)} 个页面, 其中 {changed} 个新增或有变化")
+
+    written = []
+    if changed or not (site_root / 'sitemap.xml').exists():
+        written = write_sitemaps(site_root, base_url, entries)
+        for name in written:
+            print(f"已更新: {name}")
+    else:
+        print("页面没有变化, sitemap无需更新")
+    if new_cache != cache:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(new_cache, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+    if write_robots(site_root, base_url):
+        print("已更新: robots.txt")
+        written.append('robots.txt')
+    return written
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.').resolve()
+    update_sitemap(site_root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量SVG生成引擎
+根据声明式配置文件 (svg_spec.json, 安装了PyYAML时也可以使用 .yaml) 生成SVG图片:
+每个条目指定模板和参数, 相同的 (模板, 参数) 只渲染一次, 条目的配置和模板源码都没有变化
+且文件仍然存在时直接跳过, 需要生成大量占位图时多进程并行渲染和压缩
+
+配置格式:
+{
+  "output_dir": "images",
+  "groups": {
+    "组名": {
+      "template": "article",          模板名, 见 TEMPLATES
+      "overwrite": false,             是否覆盖不是由本脚本生成的已有文件 (条目中可单独设置)
+      "images": {"文件名.svg": {参数}},
+      "range": [1, 1000],             也可以按编号批量生成,
+      "file": "placeholder-{n}.svg",  文件名和参数中的 {n} 会被替换为编号
+      "params": {"number": "{n}"},
+      "cycle": {"every": 4, "theme": ["business", "sports"]},  按编号轮换参数值
+      "unless_exists": "photo ({n}).webp"   这个真实图片存在时不生成占位图 (条目中可单独设置)
+    }
+  }
+}
+
+用法: python generate_svgs.py [配置文件] [组名...]
+"""
+
+import sys
+import json
+import inspect
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from minify_svgs import minify_svg
+from generate_article_svgs import create_svg_content
+from create_blackbackpack_images import create_backpack_svg
+from fix_missing_images import create_author_svg, create_hero_image_svg
+from check_missing_images import create_missing_svg
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+SPEC_FILE = 'svg_spec.json'
+CACHE_FILE = '.svg-generation-cache.json'
+
+# 模板名 -> 生成函数
+TEMPLATES = {
+    'article': create_svg_content,
+    'backpack': create_backpack_svg,
+    'author': create_author_svg,
+    'hero': create_hero_image_svg,
+    'placeholder': create_missing_svg,
+}
+
+# 渲染任务少于这个数量时不启动进程池
+PARALLEL_THRESHOLD = 64
+
+
+def load_spec(spec_path):
+    """读取JSON或YAML格式的配置文件"""
+    spec_path = Path(spec_path)
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        if spec_path.suffix.lower() in ('.yaml', '.yml'):
+            if yaml is None:
+                raise RuntimeError(f"读取 {spec_path} 需要安装PyYAML, 或改用JSON格式的配置")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def template_hash(template):
+    """模板函数源码的哈希, 修改模板后所有使用它的条目都会重新生成"""
+    return hashlib.md5(inspect.getsource(TEMPLATES[template]).encode('utf-8')).hexdigest()
+
+
+def _format_value(value, n):
+    """替换参数中的编号占位符"""
+    if isinstance(value, str):
+        formatted = value.replace('{n}', str(n))
+        return int(formatted) if value == '{n}' else formatted
+    return value
+
+
+def expand_group(name, group):
+    """把一个组展开为 (文件名, 参数, 是否覆盖, 替代的真实图片) 列表"""
+    overwrite = group.get('overwrite', False)
+    unless_exists = group.get('unless_exists')
+    entries = []
+
+    for filename, params in group.get('images', {}).items():
+        params = dict(params)
+        entries.append((filename, params, params.pop('overwrite', overwrite),
+                        params.pop('unless_exists', unless_exists)))
+
+    if 'range' in group:
+        start, end = group['range']
+        cycle = dict(group.get('cycle', {}))
+        every = cycle.pop('every', 1)
+        for n in range(start, end + 1):
+            params = {key: _format_value(value, n) for key, value in group.get('params', {}).items()}
+            for key, values in cycle.items():
+                params[key] = values[(n - start) // every % len(values)]
+            real_file = unless_exists.replace('{n}', str(n)) if unless_exists else None
+            entries.append((group['file'].replace('{n}', str(n)), params, overwrite, real_file))
+
+    if not entries:
+        print(f"  ✗ 组 {name} 没有定义任何图片")
+    return entries
+
+
+def uses_filename(template):
+    """模板是否需要文件名参数"""
+    return 'filename' in inspect.signature(TEMPLATES[template]).parameters
+
+
+def render_svg(job):
+    """渲染并压缩单个SVG, 在进程池中执行"""
+    template, params = job
+    return minify_svg(TEMPLATES[template](**params))
+
+
+def load_cache(cache_path):
+    """读取上次生成时每个文件的条目哈希"""
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"读取缓存 {cache_path} 失败, 将重新生成: {e}")
+    return {}
+
+
+def plan_jobs(spec, output_dir, cache, groups=None, files=None):
+    """找出需要生成的文件, 返回 (待生成列表, 新缓存, 跳过数量)"""
+    pending = []
+    new_cache = dict(cache)
+    skipped = 0
+    template_hashes = {}
+
+    for name, group in spec['groups'].items():
+        if groups and name not in groups:
+            continue
+        template = group['template']
+        if template not in TEMPLATES:
+            print(f"  ✗ 组 {name} 使用了未知模板: {template}")
+            continue
+        if template not in template_hashes:
+            template_hashes[template] = template_hash(template)
+
+        for filename, params, overwrite, real_file in expand_group(name, group):
+            if files is not None and filename not in files:
+                continue
+            # 已经有真实图片时不需要占位图
+            if real_file and (output_dir / real_file).exists():
+                skipped += 1
+                continue
+            target = output_dir / filename
+            entry_hash = hashlib.md5(json.dumps(
+                [template, template_hashes[template], params], sort_keys=True).encode('utf-8')).hexdigest()
+
+            # 没有生成记录的已有文件 (手工绘制的图片) 只有 overwrite 为true时才覆盖
+            cached = cache.get(filename)
+            if target.exists() and (cached == entry_hash or (cached is None and not overwrite)):
+                skipped += 1
+                continue
+
+            pending.append((filename, template, params))
+            new_cache[filename] = entry_hash
+
+    return pending, new_cache, skipped
+
+
+def render_all(pending, workers=None):
+    """渲染所有待生成的文件, 相同的 (模板, 参数) 只渲染一次"""
+    jobs = {}
+    for filename, template, params in pending:
+        # 使用 filename 参数的模板每个文件单独渲染
+        if uses_filename(template):
+            params = dict(params, filename=filename)
+        key = (template, json.dumps(params, sort_keys=True))
+        jobs.setdefault(key, []).append(filename)
+
+    keys = list(jobs)
+    render_jobs = [(template, json.loads(params)) for template, params in keys]
+    if len(render_jobs) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(render_svg, render_jobs, chunksize=32))
+    else:
+        results = [render_svg(job) for job in render_jobs]
+
+    rendered = {}
+    for key, svg in zip(keys, results):
+        for filename in jobs[key]:
+            rendered[filename] = svg
+    return rendered, len(keys)
+
+
+def generate_svgs(spec_path=SPEC_FILE, groups=None, files=None, workers=None):
+    """按配置生成SVG, 返回实际写入的文件名列表"""
+    spec_path = Path(spec_path)
+    spec = load_spec(spec_path)
+    output_dir = spec_path.parent / spec.get('output_dir', 'images')
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = spec_path.parent / CACHE_FILE
+
+    cache = load_cache(cache_path)
+    pending, new_cache, skipped = plan_jobs(spec, output_dir, cache, groups, files)
+    rendered, render_count = render_all(pending, workers)
+
+    written = []
+    for filename, svg in rendered.items():
+        target = output_dir / filename
+        # 内容没有变化时不改动文件, 保留修改时间
+        if target.exists() and target.read_text(encoding='utf-8') == svg:
+            continue
+        target.write_text(svg, encoding='utf-8')
+        written.append(filename)
+
+    if new_cache != cache:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(new_cache, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+    print(f"SVG生成: {len(pending)} 个条目需要更新 (渲染 {render_count} 次), "
+          f"写入 {len(written)} 个文件, 跳过 {skipped} 个未变化的文件")
+    return written
+
+
+def main():
+    spec_path = sys.argv[1] if len(sys.argv) > 1 else SPEC_FILE
+    groups = sys.argv[2:] or None
+    for filename in generate_svgs(spec_path, groups):
+        print(f"  ✓ {filename}")
+
+
+if __name__ == '__main__':
+    main()
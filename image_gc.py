@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+未使用图片回收脚本
+对站点发布的文件建立图片引用索引 (根目录页面、articles/ 文章、CSS url()、JS、SVG内部引用、
+XML/webmanifest), 找出没有任何引用的图片,
+移动到 .image-quarantine/<时间>/ 隔离目录并写入 manifest.json, 不直接删除,
+确认无误后再手动删除隔离目录, 发现误判时可以一键恢复
+
+用法:
+  python image_gc.py report [站点目录]        只列出未使用的图片及引用统计
+  python image_gc.py quarantine [站点目录]    把未使用的图片移到隔离目录
+  python image_gc.py restore [站点目录] [批次] 从隔离目录恢复 (默认最近一次)
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import unquote
+
+QUARANTINE_DIR = '.image-quarantine'
+MANIFEST_NAME = 'manifest.json'
+IMAGE_EXTENSIONS = ['.svg', '.webp', '.jpg', '.jpeg', '.png', '.gif', '.ico', '.avif']
+
+# 站点发布的、会引用图片的文本文件; 构建脚本、规格文件和缓存 (例如 .image-metadata-cache.json
+# 列出了所有图片) 不是页面实际使用的引用, 不参与索引
+REFERENCE_SUFFIXES = {'.html', '.css', '.js', '.xml', '.webmanifest', '.svg'}
+
+# 不参与索引的目录 (备份、发布目录、隔离目录)
+EXCLUDED_DIRS = {'.git', '__pycache__', 'dist', QUARANTINE_DIR}
+EXCLUDED_DIR_PATTERNS = ['articles_backup_*']
+
+# 即使没有被引用也始终保留的图片 (浏览器或第三方按约定路径请求)
+ALWAYS_KEEP_PATTERNS = ['favicon*', 'apple-touch-icon*', 'logo.*', 'og-*', 'icons-sprite.svg']
+
+EXTENSION_GROUP = '|'.join(ext.lstrip('.') for ext in IMAGE_EXTENSIONS)
+
+# 先定位扩展名再向前回溯文件名, 比直接用正则匹配整个文件名快得多
+EXTENSION_PATTERN = re.compile(r'\.(?:' + EXTENSION_GROUP + r')(?![\w-])', re.IGNORECASE)
+
+# 文件名中允许出现的字符: 空格和括号 (例如 "blackbackpack (12).webp")、%20,
+# 以及动态拼接文件名时的占位符 {i} / ${i}
+NAME_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-.()%+ {}$')
+MAX_NAME_LENGTH = 120
+
+# JS 字符串拼接: 'images/xxx-' + i + '.webp'
+CONCAT_NAME_PATTERN = re.compile(
+    r'["\']([^"\'\n]*?)["\']\s*\+\s*[\w.\[\]()]+\s*\+\s*["\']([^"\'\n]*?\.(?:' + EXTENSION_GROUP + r'))["\']',
+    re.IGNORECASE)
+
+
+def iter_reference_files(site_root):
+    """遍历站点中所有可能引用图片的文本文件"""
+    for dirpath, dirnames, filenames in os.walk(site_root):
+        current = Path(dirpath)
+        dirnames[:] = [name for name in dirnames
+                       if name not in EXCLUDED_DIRS and not name.startswith('.')
+                       and not any(Path(name).match(pattern) for pattern in EXCLUDED_DIR_PATTERNS)]
+        for filename in filenames:
+            # 点号开头的文件是缓存和配置, 不会被发布
+            if filename.startswith('.'):
+                continue
+            if Path(filename).suffix.lower() in REFERENCE_SUFFIXES:
+                yield current / filename
+
+
+def wildcard_to_regex(template):
+    """把动态文件名模板转换为正则: blackbackpack ({i}).webp -> blackbackpack \\(.+\\)\\.webp"""
+    parts = re.split(r'\$?\{[^{}]*\}', template)
+    return re.compile('^' + '.+'.join(re.escape(part) for part in parts) + '$', re.IGNORECASE)
+
+
+def extract_image_names(content):
+    """提取文本中出现的图片文件名, 返回 (文件名集合, 动态文件名模板集合)"""
+    names = set()
+    dynamic = set()
+    for match in EXTENSION_PATTERN.finditer(content):
+        start = match.start()
+        limit = max(0, start - MAX_NAME_LENGTH)
+        while start > limit and content[start - 1] in NAME_CHARS:
+            start -= 1
+        candidate = unquote(content[start:match.end()]).strip()
+
+        # 向前回溯可能带上前面的单词, 所有以空格分隔的后缀都记为引用, 宁可多保留
+        words = candidate.split(' ')
+        for i in range(len(words)):
+            name = ' '.join(words[i:]).strip()
+            if not name or name.startswith('.'):
+                continue
+            if '{' in name:
+                dynamic.add(name)
+            else:
+                names.add(name)
+
+    for match in CONCAT_NAME_PATTERN.finditer(content):
+        dynamic.add(unquote(match.group(1).rsplit('/', 1)[-1] + '{}' + match.group(2)))
+    return names, dynamic
+
+
+def build_reference_index(site_root, images_dir):
+    """建立 图片文件名 -> 引用它的文件列表 的索引, 同时返回动态引用模板"""
+    index = {}
+    dynamic = {}
+    images_dir = images_dir.resolve()
+
+    for ref_file in iter_reference_files(site_root):
+        try:
+            content = ref_file.read_text(encoding='utf-8', errors='ignore')
+        except OSError as e:
+            print(f"读取文件 {ref_file} 时出错: {e}")
+            continue
+
+        relative = ref_file.relative_to(site_root).as_posix()
+        names, templates = extract_image_names(content)
+        for name in names:
+            # 图片文件中出现自己的文件名不算作引用
+            if ref_file.name == name and ref_file.parent.resolve() == images_dir:
+                continue
+            index.setdefault(name, []).append(relative)
+        for template in templates:
+            dynamic.setdefault(template, []).append(relative)
+
+    patterns = [(wildcard_to_regex(template), files) for template, files in dynamic.items()]
+    return index, patterns
+
+
+def get_all_image_files(images_dir):
+    """获取images目录下的所有图片文件"""
+    if not images_dir.exists():
+        return []
+    return sorted(entry.name for entry in os.scandir(images_dir)
+                  if entry.is_file() and Path(entry.name).suffix.lower() in IMAGE_EXTENSIONS)
+
+
+def find_unused_images(site_root):
+    """返回 (所有图片, 未使用的图片, 引用索引)"""
+    images_dir = site_root / 'images'
+    index, dynamic = build_reference_index(site_root, images_dir)
+    all_images = get_all_image_files(images_dir)
+
+    lowered = {name.lower() for name in index}
+    unused = []
+    for name in all_images:
+        if name in index or name.lower() in lowered:
+            continue
+        if any(Path(name).match(pattern) for pattern in ALWAYS_KEEP_PATTERNS):
+            continue
+        if any(pattern.match(name) for pattern, _ in dynamic):
+            continue
+        unused.append(name)
+
+    return all_images, unused, index
+
+
+def file_hash(file_path):
+    """计算文件内容哈希, 写入隔离清单便于核对"""
+    md5 = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def quarantine_images(site_root, names):
+    """把图片移动到隔离目录并写入清单, 返回本次隔离批次目录"""
+    batch_dir = site_root / QUARANTINE_DIR / datetime.now().strftime('%Y%m%d_%H%M%S')
+    batch_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for name in names:
+        source = site_root / 'images' / name
+        try:
+            entry = {
+                'file': f'images/{name}',
+                'bytes': source.stat().st_size,
+                'hash': file_hash(source),
+            }
+            shutil.move(str(source), str(batch_dir / name))
+        except OSError as e:
+            print(f"  ✗ 隔离 {name} 失败: {e}")
+            continue
+        entries.append(entry)
+
+    manifest = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'reason': 'no references found in site-wide image index',
+        'files': entries,
+    }
+    with open(batch_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return batch_dir, entries
+
+
+def restore_images(site_root, batch=None):
+    """按清单把隔离的图片恢复到原位置, 返回恢复的文件数"""
+    quarantine_root = site_root / QUARANTINE_DIR
+    batches = sorted(path for path in quarantine_root.glob('*') if (path / MANIFEST_NAME).exists())
+    if batch:
+        batches = [path for path in batches if path.name == batch]
+    if not batches:
+        print("没有找到可以恢复的隔离批次")
+        return 0
+
+    batch_dir = batches[-1]
+    with open(batch_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    restored = 0
+    for entry in manifest['files']:
+        source = batch_dir / Path(entry['file']).name
+        target = site_root / entry['file']
+        if target.exists():
+            print(f"  ✗ {entry['file']} 已存在, 跳过恢复")
+            continue
+        if not source.exists():
+            print(f"  ✗ 隔离目录中缺少 {source.name}")
+            continue
+        shutil.move(str(source), str(target))
+        restored += 1
+
+    if not any(path.name != MANIFEST_NAME for path in batch_dir.iterdir()):
+        shutil.rmtree(batch_dir)
+    print(f"已从 {batch_dir.name} 恢复 {restored} 个图片文件")
+    return restored
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'report'
+    site_root = Path(sys.argv[2] if len(sys.argv) > 2 else '.').resolve()
+
+    if command == 'restore':
+        restore_images(site_root, sys.argv[3] if len(sys.argv) > 3 else None)
+        return
+    if command not in ('report', 'quarantine'):
+        print(__doc__)
+        sys.exit(1)
+
+    print("开始建立全站图片引用索引...")
+    all_images, unused, index = find_unused_images(site_root)
+    used_count = len(all_images) - len(unused)
+    unused_bytes = sum((site_root / 'images' / name).stat().st_size for name in unused)
+
+    print(f"\n发现 {len(all_images)} 个图片文件, 其中 {used_count} 个被引用")
+    print(f"索引中共有 {len(index)} 个不同的图片文件名引用")
+    print(f"未使用的图片文件 ({len(unused)} 个, {unused_bytes / 1024:.1f} KB):")
+    for name in unused:
+        print(f"  - {name}")
+
+    if command == 'quarantine' and unused:
+        batch_dir, entries = quarantine_images(site_root, unused)
+        print(f"\n已把 {len(entries)} 个图片移到 {batch_dir.relative_to(site_root)}")
+        print(f"确认无误后可删除该目录, 需要恢复时运行: python image_gc.py restore . {batch_dir.name}")
+    elif not unused:
+        print("所有图片文件都在使用中，无需清理")
+
+
+if __name__ == '__main__':
+    main()
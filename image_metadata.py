@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图片元数据缓存
+只读取图片文件头获取尺寸和格式 (WebP/PNG/JPEG/GIF/SVG), 连同文件大小一起缓存到
+.image-metadata-cache.json, 以 (大小, 修改时间ns) 判断文件是否变化, 变化时才重新读取文件头,
+供文章优化脚本和博客生成脚本输出正确的 width/height 属性
+
+内容哈希需要读取整个文件, 只在调用 get_hash 时计算并缓存, 文件变化后重新计算
+
+用法: python image_metadata.py   (刷新缓存并输出统计)
+"""
+
+import os
+import re
+import json
+import struct
+import hashlib
+from pathlib import Path
+
+CACHE_FILE = '.image-metadata-cache.json'
+IMAGE_EXTENSIONS = ['.svg', '.webp', '.jpg', '.jpeg', '.png', '.gif']
+
+# SVG只读取开头部分查找根元素
+SVG_HEADER_BYTES = 4096
+
+
+def _read_webp_size(header):
+    """解析WebP文件头 (VP8 / VP8L / VP8X)"""
+    if header[:4] != b'RIFF' or header[8:12] != b'WEBP':
+        return None
+    chunk = header[12:16]
+    if chunk == b'VP8X' and len(header) >= 30:
+        width = int.from_bytes(header[24:27], 'little') + 1
+        height = int.from_bytes(header[27:30], 'little') + 1
+        return width, height
+    if chunk == b'VP8L' and len(header) >= 25:
+        bits = int.from_bytes(header[21:25], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8 ' and len(header) >= 30:
+        width, height = struct.unpack('<HH', header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    return None
+
+
+def _read_png_size(header):
+    """解析PNG文件头 (IHDR)"""
+    if header[:8] != b'\x89PNG\r\n\x1a\n' or len(header) < 24:
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def _read_gif_size(header):
+    """解析GIF文件头"""
+    if header[:6] not in (b'GIF87a', b'GIF89a') or len(header) < 10:
+        return None
+    return struct.unpack('<HH', header[6:10])
+
+
+def _read_jpeg_size(f):
+    """逐段扫描JPEG直到SOF标记, 不读取图像数据"""
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        # 填充字节
+        while code == 0xFF:
+            padding = f.read(1)
+            if not padding:
+                return None
+            code = padding[0]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        # 段长度包含长度字段本身, 小于2说明文件已损坏
+        if length < 2:
+            return None
+        if code in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack('>HH', data[1:5])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _parse_svg_length(value):
+    """解析SVG长度属性, 只接受无单位或px"""
+    if not value:
+        return None
+    match = re.match(r'^\s*([\d.]+)\s*(px)?\s*$', value)
+    return round(float(match.group(1))) if match else None
+
+
+def _read_svg_size(header):
+    """从SVG根元素读取 width/height 和 viewBox"""
+    text = header.decode('utf-8', errors='ignore')
+    root_match = re.search(r'<svg\b[^>]*>', text, re.DOTALL)
+    if not root_match:
+        return None, None
+
+    root = root_match.group(0)
+    attrs = dict(re.findall(r'([\w:-]+)\s*=\s*["\']([^"\']*)["\']', root))
+
+    view_box = attrs.get('viewBox')
+    width = _parse_svg_length(attrs.get('width'))
+    height = _parse_svg_length(attrs.get('height'))
+
+    if view_box and (not width or not height):
+        parts = re.split(r'[\s,]+', view_box.strip())
+        if len(parts) == 4:
+            width = width or round(float(parts[2]))
+            height = height or round(float(parts[3]))
+
+    return (width, height) if width and height else None, view_box
+
+
+def read_image_header(image_path):
+    """只读取文件头, 返回 (格式, (宽, 高), viewBox)"""
+    suffix = image_path.suffix.lower()
+    with open(image_path, 'rb') as f:
+        if suffix == '.svg':
+            size, view_box = _read_svg_size(f.read(SVG_HEADER_BYTES))
+            return 'svg', size, view_box
+
+        header = f.read(32)
+        if header[:4] == b'RIFF':
+            return 'webp', _read_webp_size(header), None
+        if header[:8] == b'\x89PNG\r\n\x1a\n':
+            return 'png', _read_png_size(header), None
+        if header[:3] == b'GIF':
+            return 'gif', _read_gif_size(header), None
+        if header[:2] == b'\xff\xd8':
+            return 'jpeg', _read_jpeg_size(f), None
+
+    return suffix.lstrip('.'), None, None
+
+
+def file_hash(image_path):
+    """计算文件内容哈希"""
+    md5 = hashlib.md5()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class ImageMetadataCache:
+    def __init__(self, images_dir='images', cache_file=None):
+        self.images_dir = Path(images_dir)
+        self.cache_path = Path(cache_file) if cache_file else self.images_dir.parent / CACHE_FILE
+        self.entries = self._load()
+        self.dirty = False
+
+    def _load(self):
+        """读取缓存文件"""
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"读取图片元数据缓存失败, 将重新生成: {e}")
+        return {}
+
+    def get(self, filename):
+        """获取单个图片的元数据, 文件不存在时返回None"""
+        image_path = self.images_dir / filename
+        try:
+            stat = image_path.stat()
+        except OSError:
+            return None
+
+        entry = self.entries.get(filename)
+        if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry['bytes'] == stat.st_size:
+            return entry
+
+        image_format, size, view_box = read_image_header(image_path)
+        entry = {
+            'format': image_format,
+            'width': size[0] if size else None,
+            'height': size[1] if size else None,
+            'view_box': view_box,
+            'bytes': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        self.entries[filename] = entry
+        self.dirty = True
+        return entry
+
+    def get_hash(self, filename):
+        """图片内容哈希, 文件大小和修改时间不变时使用缓存的值"""
+        entry = self.get(filename)
+        if entry is None:
+            return None
+        if 'hash' not in entry:
+            entry['hash'] = file_hash(self.images_dir / filename)
+            self.dirty = True
+        return entry['hash']
+
+    def get_size(self, filename):
+        """返回图片的 (宽, 高), 无法确定时返回None"""
+        entry = self.get(filename)
+        if entry and entry['width'] and entry['height']:
+            return entry['width'], entry['height']
+        return None
+
+    def size_attributes(self, filename):
+        """生成 img 标签使用的 width/height 属性字符串"""
+        size = self.get_size(filename)
+        return f' width="{size[0]}" height="{size[1]}"' if size else ''
+
+    def refresh(self):
+        """扫描images目录, 更新所有图片并移除已删除的条目"""
+        names = set()
+        if self.images_dir.exists():
+            for image_file in self.images_dir.iterdir():
+                if image_file.is_file() and image_file.suffix.lower() in IMAGE_EXTENSIONS:
+                    names.add(image_file.name)
+                    self.get(image_file.name)
+
+        for removed in set(self.entries) - names:
+            del self.entries[removed]
+            self.dirty = True
+        return self.entries
+
+    def save(self):
+        """有变化时写回缓存文件"""
+        if not self.dirty:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False, sort_keys=True)
+        self.dirty = False
+
+
+def main():
+    cache = ImageMetadataCache('images')
+    entries = cache.refresh()
+    cache.save()
+
+    formats = {}
+    total_bytes = 0
+    unknown = []
+    for name, entry in sorted(entries.items()):
+        formats[entry['format']] = formats.get(entry['format'], 0) + 1
+        total_bytes += entry['bytes']
+        if not entry['width']:
+            unknown.append(name)
+
+    print(f"图片元数据缓存: {len(entries)} 个图片, 共 {total_bytes / 1024 / 1024:.2f} MB")
+    for image_format, count in sorted(formats.items()):
+        print(f"  - {image_format}: {count} 个")
+    if unknown:
+        print(f"\n无法确定尺寸的图片 ({len(unknown)} 个):")
+        for name in unknown:
+            print(f"  - {name}")
+
+
+if __name__ == '__main__':
+    main()
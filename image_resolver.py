@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+缺失图片解析脚本
+按文件名分词为 images/ 中的现有图片建立倒排索引, 为页面中引用但不存在的图片
+自动选择最合适的替代图片, 取代原来手工维护的映射表:
+  1. 同名不同扩展名 (logo.png -> logo.svg)
+  2. 文件名分词相似度最高的图片 (按IDF加权, 只比较共享词的候选)
+  3. 页面或文章卡片所属分类的图片
+  4. 按文件名哈希固定选取一张 blackbackpack (N).webp 产品图
+
+一次遍历根目录页面、articles/ 和 css/ 完成全站替换
+
+用法: python image_resolver.py [站点目录]
+"""
+
+import re
+import sys
+import math
+import hashlib
+from bisect import bisect_right
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from fingerprint_assets import SITE_DOMAINS
+
+IMAGE_EXTENSIONS = ['.svg', '.webp', '.jpg', '.jpeg', '.png', '.gif']
+
+# 产品分类, 用于根据页面或文章卡片选择同类图片
+CATEGORIES = ['business', 'sports', 'outdoor', 'school', 'laptop', 'tactical', 'travel']
+
+# 分词时忽略的词
+STOP_TOKENS = {'the', 'and', 'of', 'for', 'a', 'in', 'to', 'image', 'img', 'jpg', 'jpeg', 'png', 'webp', 'svg', 'gif'}
+
+# 图标、头像、证书等小图只和同类图片互相替代
+SMALL_IMAGE_PATTERNS = ['*-icon.*', 'author-*', '*-avatar.*', 'client-logo-*', '*-cert.*', 'logo.*']
+
+# 产品图文件名格式, 作为最后的通用替代
+GENERIC_IMAGE_PATTERN = re.compile(r'^blackbackpack \(\d+\)\.webp$')
+
+# 相似度低于这个值时不采用分词匹配结果
+MIN_SCORE = 0.35
+
+# 图片路径前缀: 站点域名的绝对地址或相对路径; 其他域名和协议相对地址 (//cdn...) 不处理
+SITE_PREFIX = r'(?:' + '|'.join(re.escape(domain) for domain in SITE_DOMAINS) + r')?(?![a-z][a-z0-9+.-]*:|//)'
+
+ATTR_REF_PATTERN = re.compile(
+    r'\b(src|href|content|data-src|poster)=(["\'])(' + SITE_PREFIX + r'[^"\'\s]*?images/)([^"\'?#]+)([^"\']*)\2',
+    re.IGNORECASE)
+CSS_REF_PATTERN = re.compile(
+    r'url\((["\']?)(' + SITE_PREFIX + r'[^"\')\s]*?images/)([^"\')?#]+)([^"\')]*)\1\)', re.IGNORECASE)
+CARD_PATTERN = re.compile(r'<article class="article-card"[^>]*>.*?</article>', re.DOTALL)
+CARD_CATEGORY_PATTERN = re.compile(r'<div class="article-category">([^<]+)</div>')
+
+
+def tokenize(filename):
+    """文件名分词: custom-backpacks-design.jpg -> ['custom', 'backpack', 'design']"""
+    stem = filename.rsplit('.', 1)[0].lower()
+    tokens = []
+    for token in re.split(r'[^a-z0-9]+', stem):
+        if not token or token in STOP_TOKENS or token.isdigit():
+            continue
+        # 简单去掉复数
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def is_small_image(filename):
+    """判断是否为图标类小图"""
+    return any(Path(filename).match(pattern) for pattern in SMALL_IMAGE_PATTERNS)
+
+
+def category_of(text):
+    """从文本 (文件名或分类名) 中识别产品分类, 返回分类对应的词"""
+    tokens = set(tokenize(text))
+    for category in CATEGORIES:
+        token = tokenize(category)[0]
+        if token in tokens:
+            return token
+    return None
+
+
+class ImageResolver:
+    def __init__(self, images_dir='images'):
+        self.images_dir = Path(images_dir)
+        self.existing = set()
+        self.by_stem = {}
+        self.postings = {}
+        self.tokens = {}
+        self.generic = []
+        self.resolved = {}
+        self._build_index()
+
+    def _build_index(self):
+        """建立 文件名主干 -> 文件 和 词 -> 文件集合 的索引"""
+        if not self.images_dir.exists():
+            return
+        for image_file in sorted(self.images_dir.iterdir()):
+            if not image_file.is_file() or image_file.suffix.lower() not in IMAGE_EXTENSIONS:
+                continue
+            name = image_file.name
+            self.existing.add(name)
+            self.by_stem.setdefault(name.rsplit('.', 1)[0].lower(), name)
+
+            if GENERIC_IMAGE_PATTERN.match(name):
+                self.generic.append(name)
+                continue
+            tokens = set(tokenize(name))
+            self.tokens[name] = tokens
+            for token in tokens:
+                self.postings.setdefault(token, set()).add(name)
+
+        total = max(len(self.tokens), 1)
+        self.idf = {token: math.log(1 + total / len(names)) for token, names in self.postings.items()}
+
+    def exists(self, filename):
+        return filename in self.existing
+
+    def _best_match(self, filename, category=None):
+        """按共享词的IDF加权相似度选择候选图片"""
+        query = set(tokenize(filename))
+        small = is_small_image(filename)
+
+        candidates = set()
+        for token in query:
+            candidates |= self.postings.get(token, set())
+
+        best, best_score = None, 0
+        query_weight = sum(self.idf.get(token, 0) for token in query) or 1
+        for candidate in sorted(candidates):
+            if is_small_image(candidate) != small:
+                continue
+            tokens = self.tokens[candidate]
+            shared = sum(self.idf[token] for token in query & tokens)
+            candidate_weight = sum(self.idf[token] for token in tokens) or 1
+            score = shared / math.sqrt(query_weight * candidate_weight)
+            # 同一分类的候选略微加分
+            if category and category in tokens:
+                score += 0.05
+            if score > best_score:
+                best, best_score = candidate, score
+
+        return best if best_score >= MIN_SCORE else None
+
+    def _category_match(self, category):
+        """选择文件名中带有分类名的内容图片"""
+        names = [name for name in sorted(self.postings.get(category, ())) if not is_small_image(name)]
+        return names[0] if names else None
+
+    def _generic_match(self, filename):
+        """按文件名哈希固定选择一张产品图, 同一个缺失文件每次结果相同"""
+        if not self.generic:
+            return None
+        index = int(hashlib.md5(filename.encode('utf-8')).hexdigest(), 16) % len(self.generic)
+        return self.generic[index]
+
+    def resolve(self, filename, category=None):
+        """为缺失的图片选择替代文件, 图片存在时原样返回, 找不到时返回None"""
+        if filename in self.existing:
+            return filename
+
+        key = (filename, category)
+        if key in self.resolved:
+            return self.resolved[key]
+
+        stem = filename.rsplit('.', 1)[0].lower()
+        replacement = (self.by_stem.get(stem)
+                       or self._best_match(filename, category)
+                       or (category and self._category_match(category))
+                       or self._generic_match(filename))
+        self.resolved[key] = replacement
+        return replacement
+
+
+def card_spans(content):
+    """blog页面中每张文章卡片的位置和分类"""
+    spans = []
+    for match in CARD_PATTERN.finditer(content):
+        category_match = CARD_CATEGORY_PATTERN.search(match.group(0))
+        spans.append((match.start(), match.end(), category_of(category_match.group(1)) if category_match else None))
+    return spans
+
+
+def resolve_references(content, resolver, page_category=None, pattern=ATTR_REF_PATTERN, cards=()):
+    """替换一段文本中所有缺失的图片引用, 返回 (新内容, 替换列表)"""
+    starts = [start for start, _, _ in cards]
+    changes = []
+
+    def replace_ref(match):
+        groups = list(match.groups())
+        name_index = 3 if pattern is ATTR_REF_PATTERN else 2
+        filename = unquote(groups[name_index])
+        if resolver.exists(filename):
+            return match.group(0)
+
+        category = page_category
+        position = bisect_right(starts, match.start()) - 1
+        if position >= 0 and match.start() < cards[position][1] and cards[position][2]:
+            category = cards[position][2]
+
+        replacement = resolver.resolve(filename, category)
+        if not replacement:
+            return match.group(0)
+
+        # 文件名中的空格和括号按URL编码写入, og:image 等绝对地址中也是合法的URL
+        encoded = quote(replacement)
+        changes.append((filename, replacement))
+        return match.group(0).replace(groups[name_index], encoded, 1)
+
+    return pattern.sub(replace_ref, content), changes
+
+
+def resolve_file(file_path, resolver):
+    """修复单个页面或样式表中的缺失图片引用, 返回替换列表"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if file_path.suffix == '.css':
+        new_content, changes = resolve_references(content, resolver, pattern=CSS_REF_PATTERN)
+    else:
+        page_category = category_of(file_path.stem)
+        new_content, changes = resolve_references(content, resolver, page_category, cards=card_spans(content))
+        # 页面内联样式中的 url()
+        new_content, css_changes = resolve_references(new_content, resolver, page_category, pattern=CSS_REF_PATTERN)
+        changes += css_changes
+
+    if new_content != content:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+    return changes
+
+
+def resolve_site(site_root='.'):
+    """一次遍历全站页面和样式表, 替换所有缺失的图片引用"""
+    site_root = Path(site_root)
+    resolver = ImageResolver(site_root / 'images')
+    files = (sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+             + sorted(site_root.glob('css/*.css')) + sorted(site_root.glob('articles/*.css')))
+
+    results = {}
+    for file_path in files:
+        try:
+            changes = resolve_file(file_path, resolver)
+        except Exception as e:
+            print(f"✗ 处理 {file_path} 时出错: {e}")
+            continue
+        if changes:
+            results[file_path] = changes
+    return results
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.')
+    print("开始解析缺失的图片引用...")
+
+    results = resolve_site(site_root)
+    mapping = {}
+    for file_path, changes in results.items():
+        print(f"✓ {file_path.relative_to(site_root)}: 替换 {len(changes)} 处缺失图片")
+        for filename, replacement in changes:
+            mapping[filename] = replacement
+
+    if mapping:
+        print("\n使用的替代图片:")
+        for filename, replacement in sorted(mapping.items()):
+            print(f"  {filename} -> {replacement}")
+    print(f"\n完成! 共修复 {sum(len(changes) for changes in results.values())} 处引用, "
+          f"涉及 {len(results)} 个文件")
+
+
+if __name__ == '__main__':
+    main()
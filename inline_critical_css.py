@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+首屏关键CSS内联脚本
+按页面模板(普通页面、分类页、文章页、博客页)计算 header/nav/hero 区域需要的CSS规则,
+内联到 <head> 中, 并把完整样式表改为异步加载, 缩短首次内容绘制时间
+
+用法: python inline_critical_css.py [发布目录]
+会原地改写页面, 只能在发布目录 (默认 dist/) 上运行, 不接受站点源目录;
+在 prune_unused_css.py 之后、fingerprint_assets.py 之前执行
+"""
+
+import re
+import sys
+
+from fingerprint_assets import DEFAULT_OUTPUT_DIR, require_build_dir
+from prune_unused_css import (
+    ALWAYS_USED_TAGS, HREF_PATTERN, STYLESHEET_LINK_PATTERN,
+    collect_tokens, get_linked_stylesheets, get_page_group,
+    parse_css, prune_nodes, resolve_stylesheet, serialize_css,
+)
+
+CRITICAL_STYLE_ID = 'critical-css'
+
+# 首屏范围: header之后第一个section结束为止, 最多取这么多字符
+ABOVE_FOLD_CHARS = 8000
+
+# 首屏中不需要的@规则 (字体和动画随完整样式表加载)
+NON_CRITICAL_AT_RULES = ('@font-face', '@import', '@page')
+
+
+def extract_above_fold(content):
+    """截取页面首屏部分的HTML: header、nav 以及第一个 hero/section"""
+    body_match = re.search(r'<body[^>]*>', content, re.IGNORECASE)
+    body = content[body_match.end():] if body_match else content
+
+    header_end = body.find('</header>')
+    header_end = header_end + len('</header>') if header_end != -1 else 0
+
+    section_end = body.find('</section>', header_end)
+    limit = header_end + ABOVE_FOLD_CHARS
+    if section_end != -1:
+        limit = min(limit, section_end + len('</section>'))
+
+    return body[:limit]
+
+
+def minify_css(css):
+    """压缩CSS文本中的空白"""
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+def build_critical_css(stylesheets, used):
+    """从页面模板使用的样式表中提取首屏规则"""
+    critical = []
+    for stylesheet in stylesheets:
+        with open(stylesheet, 'r', encoding='utf-8') as f:
+            nodes = parse_css(f.read())
+
+        kept, _ = prune_nodes(nodes, used)
+        kept = [node for node in kept
+                if node[0] != 'raw' or not node[1].lower().startswith(NON_CRITICAL_AT_RULES)]
+        critical.append(serialize_css(kept))
+
+    return minify_css('\n'.join(critical))
+
+
+def is_local_link(link):
+    """判断样式表链接是否指向站点内的文件"""
+    href_match = HREF_PATTERN.search(link)
+    return bool(href_match) and not re.match(r'^(https?:)?//', href_match.group(1))
+
+
+def make_async_link(link):
+    """把阻塞渲染的样式表链接改为 preload + onload 异步加载"""
+    href = HREF_PATTERN.search(link).group(1)
+    return (f'<link rel="preload" href="{href}" as="style" '
+            f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+
+def inline_critical_css(html_file, critical_css):
+    """把关键CSS写入页面头部并异步加载完整样式表"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    style_tag = f'<style id="{CRITICAL_STYLE_ID}">{critical_css}</style>'
+    existing = re.search(rf'<style id="{CRITICAL_STYLE_ID}">.*?</style>', content, re.DOTALL)
+
+    if existing:
+        # 重复运行时只更新关键CSS内容
+        new_content = content[:existing.start()] + style_tag + content[existing.end():]
+    else:
+        head_end = content.find('</head>')
+        head = content[:head_end] if head_end != -1 else content
+        rest = content[len(head):]
+
+        local_links = [match for match in STYLESHEET_LINK_PATTERN.finditer(head) if is_local_link(match.group(0))]
+        if not local_links:
+            return False
+        first_link = local_links[0]
+
+        def replace_link(match):
+            return make_async_link(match.group(0)) if is_local_link(match.group(0)) else match.group(0)
+
+        before = head[:first_link.start()]
+        after = STYLESHEET_LINK_PATTERN.sub(replace_link, head[first_link.start():])
+        new_content = before + style_tag + '\n' + after + rest
+
+    if new_content == content:
+        return False
+
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(new_content)
+    return True
+
+
+def main():
+    site_root = require_build_dir(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR)
+    html_files = list(site_root.glob('*.html')) + list(site_root.glob('articles/*.html'))
+
+    # 按页面模板 (分组 + 引用的样式表) 收集首屏使用的选择器
+    templates = {}
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        stylesheets = []
+        for href in get_linked_stylesheets(content):
+            stylesheet = resolve_stylesheet(site_root, html_file, href)
+            if stylesheet and stylesheet not in stylesheets:
+                stylesheets.append(stylesheet)
+
+        template = templates.setdefault((get_page_group(html_file), tuple(stylesheets)), {
+            'pages': [],
+            'used': {'tags': set(ALWAYS_USED_TAGS), 'classes': set(), 'ids': set()},
+        })
+        template['pages'].append(html_file)
+        collect_tokens(extract_above_fold(content), template['used'])
+
+    print("开始提取并内联首屏关键CSS...")
+
+    for (group, stylesheets), template in sorted(templates.items()):
+        if not stylesheets:
+            continue
+        critical_css = build_critical_css(stylesheets, template['used'])
+        updated = sum(1 for html_file in template['pages'] if inline_critical_css(html_file, critical_css))
+        names = ', '.join(stylesheet.name for stylesheet in stylesheets)
+        print(f"  [{group}] {names}: 关键CSS {len(critical_css.encode('utf-8')) / 1024:.1f} KB, "
+              f"已更新 {updated}/{len(template['pages'])} 个页面")
+
+    print("\n关键CSS内联完成!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文章内链引擎
+从每篇文章的标题中提取 2-4 个词的短语, 建立 短语 -> 目标文章 的倒排索引
+(出现在太多标题中的泛用短语不作为锚文本), 再用按词构建的前缀树一次扫描每篇文章正文的
+文本节点 (只处理段落、列表和表格中的文字, 跳过已有链接、标题、脚本等), 为每页挑选
+得分最高的若干个目标插入链接, 每个目标每页只链接一次, 不链接到自己
+
+插入的链接带有 class="internal-link", 重复运行时先移除旧的再重新选择;
+旧版 ArticleOptimizer.enhance_seo_elements 用正则插入到 <title>、meta 和标题中的链接
+也会被还原为纯文本
+
+用法: python internal_links.py [站点目录]
+"""
+
+import re
+import sys
+import html
+import math
+from pathlib import Path
+
+# 每页最多插入的内链数量
+MAX_LINKS_PER_PAGE = 5
+
+# 短语在超过这么多篇文章标题中出现时太泛, 不作为锚文本
+MAX_PHRASE_TARGETS = 3
+
+MIN_PHRASE_WORDS = 2
+MAX_PHRASE_WORDS = 4
+
+LINK_CLASS = 'internal-link'
+
+# 固定的锚文本 -> 目标文章 (原 enhance_seo_elements 中手工维护的四条)
+PINNED_TARGETS = {
+    'backpack manufacturing': 'custom-backpack-manufacturing-b2b-complete-guide.html',
+    'quality control': 'quality-control-backpack-production-standards.html',
+    'sustainable materials': 'eco-friendly-materials-sustainable-backpack-production.html',
+    'supply chain': 'supply-chain-management-backpack-manufacturing.html',
+}
+
+# 短语中不能包含这些词 (连接词会产生 "marketing and brand" 这样不完整的锚文本)
+PHRASE_STOP_WORDS = {'a', 'an', 'and', 'the', 'of', 'in', 'for', 'to', 'with', 'on', 'by', 'vs', 'from',
+                     'guide', 'complete', 'ultimate', 'best', 'top', 'amp'}
+
+# 在这么多篇文章中完全相同的文本节点视为模板文字 (供应商推荐等), 不在其中插入链接
+BOILERPLATE_PAGES = 5
+
+# 这些元素中的文字不插入链接
+SKIP_TAGS = {'a', 'head', 'title', 'script', 'style', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'nav', 'header',
+             'footer', 'button', 'code', 'pre', 'label', 'select', 'option', 'textarea', 'svg', 'figcaption'}
+
+# 只在这些元素中的文字插入链接
+TEXT_CONTAINERS = {'p', 'li', 'td', 'dd', 'blockquote'}
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+TOKEN_PATTERN = re.compile(r'[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*')
+MARKUP_PATTERN = re.compile(r'<!--.*?-->|<[^>]+>', re.DOTALL)
+TAG_NAME_PATTERN = re.compile(r'<\s*(/?)\s*([a-zA-Z][\w-]*)')
+HREF_PATTERN = re.compile(r'<a\b[^>]*\bhref=["\']([^"\'#?]+)', re.IGNORECASE)
+GENERATED_LINK_PATTERN = re.compile(
+    r'<a href="[^"]*" class="' + LINK_CLASS + r'">(.*?)</a>', re.DOTALL)
+ESCAPED_LINK_PATTERN = re.compile(r'&lt;a href=(?:&quot;|")[^"&]*(?:&quot;|")&gt;(.*?)&lt;/a&gt;', re.DOTALL)
+
+# 插入到 alt/content 属性中的链接被HTML解析器拆散后的标签:
+# <img ..="" alt="Professional &lt;a href=" articles="" x.html"="" src="..."/>Backpack Manufacturing" class="..."&gt;
+MANGLED_TAG_PATTERN = re.compile(
+    r'<(img|meta)\b([^>]*?)\s\.\.=""([^>]*?)\s(alt|content)="([^"]*?)&lt;a href="\s([^>]*?)/>([^"<]*)"([^<>]*?)&gt;')
+# 同样的标签被HTML解析器重新序列化过 (属性排序, alt/content 已被其他脚本改写),
+# 链接的剩余部分作为文本泄漏到标签之后:
+# <meta ..="" articles="" content='...' x.html"="" name="description"/>supply chain."&gt;
+RESERIALIZED_TAG_PATTERN = re.compile(r'<(img|meta)\b([^<>]*?)\s\.\.=""([^<>]*?)/>[^<>\n]*?"&gt;')
+ATTR_PATTERN = re.compile(r'([a-zA-Z][\w:-]*)=(?:"([^"]*)"|\'([^\']*)\')')
+
+
+def normalize(word):
+    """词形归一: 小写并去掉简单复数"""
+    word = word.lower()
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+    return word
+
+
+def article_title(content, filename):
+    """文章标题: <h1> 或 <title> 中站点名之前的部分"""
+    match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.DOTALL) or \
+        re.search(r'<title>(.*?)</title>', content, re.DOTALL)
+    if not match:
+        return filename.rsplit('.', 1)[0].replace('-', ' ')
+    text = html.unescape(ESCAPED_LINK_PATTERN.sub(r'\1', match.group(1)))
+    text = re.sub(r'<[^>]+>', '', html.unescape(text))
+    return re.split(r'\s+\|\s+', text)[0].strip()
+
+
+def title_phrases(title):
+    """标题中所有 2-4 个词的短语 (不含停用词), 返回归一化后的词元组"""
+    words = [normalize(word) for word in TOKEN_PATTERN.findall(title)]
+    phrases = set()
+    for size in range(MIN_PHRASE_WORDS, MAX_PHRASE_WORDS + 1):
+        for i in range(len(words) - size + 1):
+            phrase = tuple(words[i:i + size])
+            if any(word in PHRASE_STOP_WORDS for word in phrase):
+                continue
+            if phrase[0].isdigit() or phrase[-1].isdigit():
+                continue
+            phrases.add(phrase)
+    return phrases
+
+
+class InternalLinker:
+    def __init__(self, articles_dir='articles'):
+        self.articles_dir = Path(articles_dir)
+        self.titles = {}
+        self.index = {}
+        self.trie = {}
+        self.boilerplate = set()
+        self._build_index()
+
+    def _build_index(self):
+        """建立 短语 -> [(目标文章, 得分)] 的倒排索引和按词的前缀树"""
+        text_pages = {}
+        for article_file in sorted(self.articles_dir.glob('*.html')):
+            with open(article_file, 'r', encoding='utf-8') as f:
+                content = clean_links(f.read())
+            self.titles[article_file.name] = article_title(content, article_file.name)
+            for text in {content[start:end].strip() for start, end in iter_text_nodes(content)}:
+                text_pages[text] = text_pages.get(text, 0) + 1
+        self.boilerplate = {text for text, pages in text_pages.items() if pages >= BOILERPLATE_PAGES}
+
+        postings = {}
+        for name, title in self.titles.items():
+            for phrase in title_phrases(title):
+                postings.setdefault(phrase, []).append(name)
+
+        total = max(len(self.titles), 1)
+        for phrase, names in postings.items():
+            if len(names) > MAX_PHRASE_TARGETS:
+                continue
+            # 越长、越少见的短语越具体; 标题越短的文章越聚焦于这个短语
+            score = len(phrase) * math.log(1 + total / len(names))
+            self.index[phrase] = [(name, score) for name in
+                                  sorted(names, key=lambda name: (len(self.titles[name]), name))]
+
+        for text, name in PINNED_TARGETS.items():
+            if name in self.titles:
+                phrase = tuple(normalize(word) for word in TOKEN_PATTERN.findall(text))
+                self.index[phrase] = [(name, len(phrase) * math.log(1 + total))]
+
+        for phrase in self.index:
+            node = self.trie
+            for word in phrase:
+                node = node.setdefault(word, {})
+            node[None] = phrase
+
+    def match_text(self, text):
+        """在一段文字中查找所有短语, 返回 [(开始, 结束, 短语)], 同一位置取最长的短语"""
+        tokens = [(m.start(), m.end(), normalize(m.group(0))) for m in TOKEN_PATTERN.finditer(text)]
+        matches = []
+        i = 0
+        while i < len(tokens):
+            node = self.trie
+            best = None
+            j = i
+            while j < len(tokens) and tokens[j][2] in node:
+                # 短语中的词之间只允许空白
+                if j > i and not text[tokens[j - 1][1]:tokens[j][0]].isspace():
+                    break
+                node = node[tokens[j][2]]
+                j += 1
+                if None in node:
+                    best = (j, node[None])
+            if best:
+                end_index, phrase = best
+                matches.append((tokens[i][0], tokens[end_index - 1][1], phrase))
+                i = end_index
+            else:
+                i += 1
+        return matches
+
+    def link_content(self, content, page_name):
+        """为一篇文章插入内链, 返回 (新内容, 插入的目标列表)"""
+        content = clean_links(content)
+        linked = {Path(href).name for href in HREF_PATTERN.findall(content)}
+
+        # 一次遍历所有文本节点, 记录每个目标第一次出现的位置
+        candidates = {}
+        for node_start, node_end in iter_text_nodes(content):
+            text = content[node_start:node_end]
+            if text.strip() in self.boilerplate:
+                continue
+            for start, end, phrase in self.match_text(text):
+                for name, score in self.index[phrase]:
+                    if name == page_name or name in linked:
+                        continue
+                    if name not in candidates or score > candidates[name][0]:
+                        candidates[name] = (score, node_start, node_start + start, node_start + end)
+                    break
+
+        # 按得分选择目标, 同一个文本节点中只插入一个链接
+        chosen = []
+        used_nodes = set()
+        for name, (score, node, start, end) in sorted(candidates.items(), key=lambda item: (-item[1][0], item[1][2])):
+            if len(chosen) >= MAX_LINKS_PER_PAGE:
+                break
+            if node in used_nodes:
+                continue
+            chosen.append((start, end, name))
+            used_nodes.add(node)
+
+        for start, end, name in sorted(chosen, reverse=True):
+            content = (content[:start] + f'<a href="../articles/{name}" class="{LINK_CLASS}">'
+                       + content[start:end] + '</a>' + content[end:])
+        return content, [name for _, _, name in sorted(chosen)]
+
+    def link_file(self, file_path):
+        """处理单个文章文件, 返回 (插入的目标列表, 是否修改)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content, targets = self.link_content(content, Path(file_path).name)
+        changed = new_content != content
+        if changed:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+        return targets, changed
+
+
+def iter_text_nodes(content):
+    """遍历可以插入链接的文本节点, 返回 (开始, 结束) 位置"""
+    skip_depth = 0
+    container_depth = 0
+    last = 0
+    for markup in MARKUP_PATTERN.finditer(content):
+        if skip_depth == 0 and container_depth > 0 and markup.start() > last:
+            yield last, markup.start()
+        last = markup.end()
+
+        tag_match = TAG_NAME_PATTERN.match(markup.group(0))
+        if not tag_match or markup.group(0).endswith('/>'):
+            continue
+        tag = tag_match.group(2).lower()
+        if tag in VOID_TAGS:
+            continue
+        step = -1 if tag_match.group(1) == '/' else 1
+        if tag in SKIP_TAGS:
+            skip_depth = max(0, skip_depth + step)
+        elif tag in TEXT_CONTAINERS:
+            container_depth = max(0, container_depth + step)
+
+
+def repair_mangled_tag(match):
+    """还原被拆散的 img/meta 标签, 链接只保留锚文本"""
+    tag, before, middle, text_attr, text, junk, anchor, after = match.groups()
+    attrs = parse_mangled_attrs(before, middle, junk, after)
+    attrs[text_attr] = text + anchor
+    return format_tag(tag, attrs)
+
+
+def repair_reserialized_tag(match):
+    """还原重新序列化过的拆散标签, 去掉多余的属性和泄漏到标签后的文字"""
+    tag, before, after = match.groups()
+    return format_tag(tag, parse_mangled_attrs(before, after))
+
+
+def parse_mangled_attrs(*parts):
+    """从拆散的标签片段中取出真正的属性, 跳过链接路径留下的空属性"""
+    attrs = {}
+    for part in parts:
+        for name, double_quoted, single_quoted in ATTR_PATTERN.findall(part):
+            value = double_quoted or single_quoted
+            if name == 'articles' and not value:
+                continue
+            if name == 'class' and 'class' in attrs:
+                value = ' '.join(dict.fromkeys(attrs['class'].split() + value.split()))
+            attrs[name] = value
+    return attrs
+
+
+def format_tag(tag, attrs):
+    """按属性字典输出自闭合标签, 属性值统一使用双引号"""
+    attrs = {name: value.replace('"', '&quot;') for name, value in attrs.items()}
+    return f'<{tag} ' + ' '.join(f'{name}="{value}"' for name, value in attrs.items()) + '/>'
+
+
+def clean_links(content):
+    """移除之前生成的内链, 以及旧版脚本插入到标题、属性中的链接"""
+    content = MANGLED_TAG_PATTERN.sub(repair_mangled_tag, content)
+    content = RESERIALIZED_TAG_PATTERN.sub(repair_reserialized_tag, content)
+    content = GENERATED_LINK_PATTERN.sub(r'\1', content)
+    content = ESCAPED_LINK_PATTERN.sub(r'\1', content)
+    for text, name in PINNED_TARGETS.items():
+        # 旧版插入的链接没有标记, 只还原锚文本和固定短语完全一致的
+        pattern = re.compile(r'<a href="\.\./articles/' + re.escape(name) + r'">(' + re.escape(text) + r')</a>',
+                             re.IGNORECASE)
+        content = pattern.sub(r'\1', content)
+    return content
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.')
+    linker = InternalLinker(site_root / 'articles')
+    print(f"已建立内链索引: {len(linker.titles)} 篇文章, {len(linker.index)} 个短语")
+
+    total_links = 0
+    updated = 0
+    for article_file in sorted((site_root / 'articles').glob('*.html')):
+        targets, changed = linker.link_file(article_file)
+        total_links += len(targets)
+        updated += changed
+        if changed:
+            print(f"  ✓ {article_file.name}: {len(targets)} 个内链")
+
+    print(f"\n完成! 更新了 {updated} 篇文章, 共 {total_links} 个内链")
+
+
+if __name__ == '__main__':
+    main()
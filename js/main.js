@@ -31,18 +31,6 @@ document.querySelectorAll('a[href^="#"]').forEach(anchor => {
     });
 });
 
-// Header Scroll Effect
-window.addEventListener('scroll', () => {
-    const header = document.querySelector('.header');
-    if (window.scrollY > 100) {
-        header.style.background = 'rgba(26, 26, 26, 0.95)';
-        header.style.backdropFilter = 'blur(10px)';
-    } else {
-        header.style.background = 'linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%)';
-        header.style.backdropFilter = 'none';
-    }
-});
-
 // Intersection Observer for Animations
 const observerOptions = {
     threshold: 0.1,
@@ -168,15 +156,40 @@ backToTopButton.style.cssText = `
 
 document.body.appendChild(backToTopButton);
 
+// Scroll Effects (header background and back-to-top button)
+// A single passive listener schedules one requestAnimationFrame per frame; the frame reads
+// scrollY once and only writes styles when a threshold is crossed.
+const scrollHeader = document.querySelector('.header');
+const scrollState = { headerScrolled: null, backToTopVisible: null };
+let scrollFramePending = false;
+
+function applyScrollEffects() {
+    scrollFramePending = false;
+    const scrollY = window.scrollY;
+    const headerScrolled = scrollY > 100;
+    const backToTopVisible = scrollY > 300;
+
+    if (scrollHeader && headerScrolled !== scrollState.headerScrolled) {
+        scrollHeader.style.background = headerScrolled
+            ? 'rgba(26, 26, 26, 0.95)'
+            : 'linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%)';
+        scrollHeader.style.backdropFilter = headerScrolled ? 'blur(10px)' : 'none';
+    }
+    scrollState.headerScrolled = headerScrolled;
+
+    if (backToTopVisible !== scrollState.backToTopVisible) {
+        backToTopButton.style.opacity = backToTopVisible ? '1' : '0';
+        backToTopButton.style.visibility = backToTopVisible ? 'visible' : 'hidden';
+        scrollState.backToTopVisible = backToTopVisible;
+    }
+}
+
 window.addEventListener('scroll', () => {
-    if (window.scrollY > 300) {
-        backToTopButton.style.opacity = '1';
-        backToTopButton.style.visibility = 'visible';
-    } else {
-        backToTopButton.style.opacity = '0';
-        backToTopButton.style.visibility = 'hidden';
+    if (!scrollFramePending) {
+        scrollFramePending = true;
+        requestAnimationFrame(applyScrollEffects);
     }
-});
+}, { passive: true });
 
 backToTopButton.addEventListener('click', () => {
     window.scrollTo({
@@ -204,25 +217,28 @@ if ('IntersectionObserver' in window) {
 }
 
 // Blog Category Filter
+// Clicking a category only sets data-filter on the article grids; the generated rules below
+// hide non-matching cards, so a click costs the same no matter how many cards the blog has.
 const categoryButtons = document.querySelectorAll('.category-btn');
-const articleCards = document.querySelectorAll('.article-card');
+const articleGrids = document.querySelectorAll('.articles-grid, .featured-grid');
+const categoryRules = [];
 
 if (categoryButtons.length > 0) {
     categoryButtons.forEach(button => {
+        const category = button.getAttribute('data-category');
+        if (category !== 'all') {
+            categoryRules.push(
+                `[data-filter="${category}"] > .article-card:not([data-category="${category}"]) { display: none; }`
+            );
+        }
+
         button.addEventListener('click', () => {
-            // Remove active class from all buttons
-            categoryButtons.forEach(btn => btn.classList.remove('active'));
-            // Add active class to clicked button
-            button.classList.add('active');
-            
-            const category = button.getAttribute('data-category');
-            
-            articleCards.forEach(card => {
-                if (category === 'all' || card.getAttribute('data-category') === category) {
-                    card.style.display = 'block';
-                    card.style.animation = 'fadeIn 0.5s ease';
+            categoryButtons.forEach(btn => btn.classList.toggle('active', btn === button));
+            articleGrids.forEach(grid => {
+                if (category === 'all') {
+                    delete grid.dataset.filter;
                 } else {
-                    card.style.display = 'none';
+                    grid.dataset.filter = category;
                 }
             });
         });
@@ -230,63 +246,61 @@ if (categoryButtons.length > 0) {
 }
 
 // Load More Articles Functionality
-let articlesVisible = 6; // Initially show 6 articles
+// Cards past the first batch are hidden by an nth-child rule; each click marks only the
+// next batch as revealed instead of scanning every card for hidden ones.
+// The button can override the batch sizes with data-initial / data-batch.
 const loadMoreBtn = document.querySelector('.load-more-btn');
-const allArticles = document.querySelectorAll('.article-card');
+const initialArticles = Number(loadMoreBtn && loadMoreBtn.dataset.initial) || 6; // Initially show 6 articles
+const articlesPerBatch = Number(loadMoreBtn && loadMoreBtn.dataset.batch) || 3;
+const loadMoreGrid = loadMoreBtn ? document.querySelector('.articles-grid') : null;
+const loadMoreCards = loadMoreGrid ? loadMoreGrid.getElementsByClassName('article-card') : [];
+let articlesVisible = initialArticles;
 
-if (loadMoreBtn && allArticles.length > 0) {
-    // Initially hide articles beyond the first 6
-    allArticles.forEach((article, index) => {
-        if (index >= articlesVisible) {
-            article.style.display = 'none';
-        }
-    });
-    
-    // Hide load more button if there are 6 or fewer articles
-    if (allArticles.length <= articlesVisible) {
-        loadMoreBtn.style.display = 'none';
+if (loadMoreBtn && loadMoreCards.length > 0) {
+    categoryRules.push(
+        `.articles-grid[data-load-more]:not([data-filter]) > .article-card:nth-child(n+${initialArticles + 1}):not(.is-revealed) { display: none; }`,
+        `.article-card.is-revealed { animation: fadeInUp 0.6s ease both; }`,
+        `.load-more-btn.is-finished { animation: fadeOut 0.5s ease forwards; pointer-events: none; }`
+    );
+    loadMoreGrid.dataset.loadMore = '';
+
+    // Hide load more button if every article is already visible
+    if (loadMoreCards.length <= articlesVisible) {
+        loadMoreBtn.hidden = true;
     }
-    
+
     loadMoreBtn.addEventListener('click', () => {
         // Add loading state
         const originalText = loadMoreBtn.textContent;
         loadMoreBtn.textContent = 'Loading...';
         loadMoreBtn.disabled = true;
-        loadMoreBtn.style.opacity = '0.7';
-        
+
         setTimeout(() => {
-            const hiddenArticles = Array.from(allArticles).filter(article => 
-                article.style.display === 'none' || 
-                getComputedStyle(article).display === 'none'
-            );
-            
-            // Show next 3 articles
-            const articlesToShow = hiddenArticles.slice(0, 3);
-            
-            articlesToShow.forEach((article, index) => {
-                setTimeout(() => {
-                    article.style.display = 'block';
-                    article.style.animation = 'fadeInUp 0.6s ease';
-                }, index * 150); // Stagger the animation
-            });
-            
-            articlesVisible += 3;
-            
+            // Reveal the next batch, staggering the animation
+            const articlesToShow = [];
+            const batchEnd = Math.min(articlesVisible + articlesPerBatch, loadMoreCards.length);
+            for (let i = articlesVisible; i < batchEnd; i++) {
+                const article = loadMoreCards[i];
+                article.style.animationDelay = `${(i - articlesVisible) * 150}ms`;
+                article.classList.add('is-revealed');
+                articlesToShow.push(article);
+            }
+            articlesVisible = batchEnd;
+
             // Reset button state
             loadMoreBtn.textContent = originalText;
             loadMoreBtn.disabled = false;
-            loadMoreBtn.style.opacity = '1';
-            
+
             // Hide load more button if no more articles to show
-            if (hiddenArticles.length <= 3) {
+            if (articlesVisible >= loadMoreCards.length) {
                 setTimeout(() => {
-                    loadMoreBtn.style.animation = 'fadeOut 0.5s ease';
+                    loadMoreBtn.classList.add('is-finished');
                     setTimeout(() => {
-                        loadMoreBtn.style.display = 'none';
+                        loadMoreBtn.hidden = true;
                     }, 500);
                 }, 600);
             }
-            
+
             // Smooth scroll to show new articles
             if (articlesToShow.length > 0) {
                 setTimeout(() => {
@@ -300,6 +314,18 @@ if (loadMoreBtn && allArticles.length > 0) {
     });
 }
 
+// Service Worker: build_service_worker.py generates sw.js in the built site and marks every page
+// with <meta name="service-worker">; unbuilt pages have no marker and never request sw.js
+const serviceWorkerMeta = document.querySelector('meta[name="service-worker"]');
+if ('serviceWorker' in navigator && serviceWorkerMeta) {
+    const serviceWorkerUrl = new URL(serviceWorkerMeta.content, document.baseURI);
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(serviceWorkerUrl).catch(error => {
+            console.warn('Service worker registration failed:', error);
+        });
+    });
+}
+
 // Add CSS animations for article loading
 const style = document.createElement('style');
 style.textContent = `
@@ -332,7 +358,14 @@ style.textContent = `
     
     .load-more-btn:disabled {
         cursor: not-allowed;
+        opacity: 0.7;
         transform: none !important;
     }
+    
+    [data-filter] > .article-card {
+        animation: fadeIn 0.5s ease;
+    }
+    
+    ${categoryRules.join('\n    ')}
 `;
 document.head.appendChild(style);
\ No newline at end of file
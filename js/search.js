@@ -0,0 +1,189 @@
+// Client-side article search
+// Reads the sharded index written by build_search_index.py: search/manifest.json lists the
+// term shards (by word prefix) and document shards, which are fetched only when a query needs them.
+class ArticleSearch {
+    constructor(form) {
+        this.form = form;
+        this.input = form.querySelector('input[type="search"]');
+        this.results = document.getElementById(form.dataset.results || 'search-results');
+        this.indexUrl = new URL(form.dataset.index || 'search/', document.baseURI);
+        this.siteRoot = new URL('../', this.indexUrl);
+        this.maxResults = 10;
+        this.shards = new Map();
+        this.manifest = null;
+        this.queryId = 0;
+        this.timer = null;
+        this.init();
+    }
+
+    init() {
+        if (!this.input || !this.results) return;
+
+        this.input.addEventListener('input', () => {
+            clearTimeout(this.timer);
+            this.timer = setTimeout(() => this.search(this.input.value), 150);
+        });
+
+        this.input.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape') {
+                this.input.value = '';
+                this.clear();
+            }
+        });
+
+        this.form.addEventListener('submit', (e) => {
+            e.preventDefault();
+            this.search(this.input.value);
+        });
+
+        // Warm the manifest as soon as the user shows interest
+        this.input.addEventListener('focus', () => this.loadManifest().catch(() => {}), { once: true });
+    }
+
+    loadManifest() {
+        if (!this.manifest) {
+            this.manifest = this.fetchJson('manifest.json').then(manifest => {
+                manifest.stopWordSet = new Set(manifest.stopWords);
+                return manifest;
+            });
+            this.manifest.catch(() => { this.manifest = null; });
+        }
+        return this.manifest;
+    }
+
+    fetchJson(path) {
+        if (!this.shards.has(path)) {
+            const request = fetch(new URL(path, this.indexUrl)).then(response => {
+                if (!response.ok) throw new Error(`${response.status} ${path}`);
+                return response.json();
+            });
+            request.catch(() => this.shards.delete(path));
+            this.shards.set(path, request);
+        }
+        return this.shards.get(path);
+    }
+
+    // Same rules as build_search_index.tokenize
+    tokenize(text, manifest) {
+        return (text.toLowerCase().match(/[a-z0-9]+/g) || [])
+            .filter(word => word.length >= 2 && !manifest.stopWordSet.has(word))
+            .map(word => (word.length > 3 && word.endsWith('s') && !word.endsWith('ss')) ? word.slice(0, -1) : word);
+    }
+
+    // Score documents for one query word; the last word of the query also matches as a prefix
+    async scoreWord(word, isPrefix, manifest) {
+        const scores = new Map();
+        const shardPath = manifest.terms[word.slice(0, manifest.prefixLength)];
+        if (!shardPath || word.length < manifest.prefixLength) return scores;
+
+        const shard = await this.fetchJson(shardPath);
+        const terms = isPrefix ? Object.keys(shard).filter(term => term.startsWith(word)) : [word];
+        terms.forEach(term => {
+            const postings = shard[term];
+            if (!postings) return;
+            const idf = Math.log(1 + manifest.docCount / (postings.length / 2));
+            let doc = 0;
+            for (let i = 0; i < postings.length; i += 2) {
+                doc += postings[i];
+                const score = postings[i + 1] * idf;
+                if (score > (scores.get(doc) || 0)) scores.set(doc, score);
+            }
+        });
+        return scores;
+    }
+
+    async search(query) {
+        const queryId = ++this.queryId;
+        let manifest;
+        try {
+            manifest = await this.loadManifest();
+        } catch (error) {
+            this.showMessage('Search is not available right now.');
+            return;
+        }
+
+        const words = this.tokenize(query, manifest);
+        if (words.length === 0) {
+            if (queryId === this.queryId) this.clear();
+            return;
+        }
+
+        const wordScores = await Promise.all(
+            words.map((word, index) => this.scoreWord(word, index === words.length - 1 && !/\s$/.test(query), manifest))
+        );
+
+        // Every query word must match
+        const [first, ...rest] = wordScores.sort((a, b) => a.size - b.size);
+        const ranked = [];
+        first.forEach((score, doc) => {
+            let total = score;
+            for (const scores of rest) {
+                if (!scores.has(doc)) return;
+                total += scores.get(doc);
+            }
+            ranked.push([doc, total]);
+        });
+        ranked.sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+
+        const top = ranked.slice(0, this.maxResults);
+        const docShards = await Promise.all(
+            [...new Set(top.map(([doc]) => Math.floor(doc / manifest.docsPerShard)))]
+                .map(index => this.fetchJson(manifest.docs[index]).then(docs => [index, docs]))
+        );
+        if (queryId !== this.queryId) return;
+
+        const shardMap = new Map(docShards);
+        const docs = top.map(([doc]) => shardMap.get(Math.floor(doc / manifest.docsPerShard))[doc % manifest.docsPerShard]);
+        this.render(docs, ranked.length, query.trim());
+    }
+
+    render(docs, total, query) {
+        this.results.innerHTML = '';
+        if (docs.length === 0) {
+            this.showMessage(`No articles found for "${query}".`);
+            return;
+        }
+
+        const summary = document.createElement('p');
+        summary.className = 'search-summary';
+        summary.textContent = `${total} article${total === 1 ? '' : 's'} found`;
+        const list = document.createElement('ul');
+        list.className = 'search-result-list';
+
+        docs.forEach(([path, title, snippet, category]) => {
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = new URL(path, this.siteRoot).href;
+            link.className = 'search-result-title';
+            link.textContent = title;
+            const meta = document.createElement('span');
+            meta.className = 'search-result-category';
+            meta.textContent = category;
+            const text = document.createElement('p');
+            text.textContent = snippet;
+            item.append(link, meta, text);
+            list.appendChild(item);
+        });
+
+        this.results.append(summary, list);
+        this.results.hidden = false;
+    }
+
+    showMessage(message) {
+        this.results.innerHTML = '';
+        const text = document.createElement('p');
+        text.className = 'search-summary';
+        text.textContent = message;
+        this.results.appendChild(text);
+        this.results.hidden = false;
+    }
+
+    clear() {
+        this.results.innerHTML = '';
+        this.results.hidden = true;
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.querySelectorAll('form.blog-search').forEach(form => new ArticleSearch(form));
+});
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+深色区块标记脚本
+根据页面引用的样式表 (以及页面内的 <style> 和 style 属性) 计算每个类的背景颜色亮度,
+给背景为深色的区块加上 nav-dark 类. 只标记分区元素 (section、footer 等)、页面顶层的 div
+和样式中宽度为 100% 的 div (例如 hero 的遮罩层), 已经在深色区块内的元素不再标记,
+色块、进度条这样的小装饰不会让导航栏切换颜色
+
+js/navigation.js 只需要用 IntersectionObserver 观察这些带标记的区块, 区块经过导航栏时
+切换导航栏的 dark-bg 样式, 滚动时不再调用 elementFromPoint / getComputedStyle
+
+templates/ 中的布局和局部模板也会处理, 重新生成的页面直接带有标记
+修改样式表的背景颜色后需要重新运行本脚本
+
+用法: python mark_dark_sections.py [站点目录]
+"""
+
+import re
+import sys
+from pathlib import Path
+
+from site_templates import DEFAULT_STYLESHEETS, TEMPLATES_DIR
+
+NAV_DARK_CLASS = 'nav-dark'
+
+# 平均亮度低于这个值的背景按深色处理 (与原来 navigation.js 中的阈值相同)
+LUMINANCE_THRESHOLD = 0.5
+
+# 透明度低于这个值的颜色不计入背景亮度
+MIN_ALPHA = 0.5
+
+# 只有背景图片没有颜色时, 类名包含这些词的按深色处理
+DARK_NAME_HINTS = ['dark', 'black', 'night']
+
+# 会被标记的分区元素; 导航栏本身 (.header) 除外
+SECTION_TAGS = {'section', 'footer', 'header', 'main', 'article', 'aside'}
+
+# div 直接位于这些元素中 (页面顶层的整宽容器), 或者类的宽度为 100% 时才标记
+TOP_LEVEL_PARENTS = {'html', 'body', 'main'}
+FULL_WIDTH_PATTERN = re.compile(r'(?:^|;)\s*width\s*:\s*100(?:%|vw)\s*(?:;|$)', re.IGNORECASE)
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+# 脚本、样式和注释整体跳过, 其中的标签文字不参与嵌套计算
+TAG_PATTERN = re.compile(
+    r'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->|<(/?)([a-zA-Z][\w-]*)\b([^>]*)>',
+    re.IGNORECASE | re.DOTALL)
+CLASS_ATTR_PATTERN = re.compile(r'\sclass=(["\'])(.*?)\1', re.DOTALL)
+STYLE_ATTR_PATTERN = re.compile(r'\sstyle=(["\'])(.*?)\1', re.DOTALL)
+STYLE_BLOCK_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+STYLESHEET_LINK_PATTERN = re.compile(r'<link[^>]+rel=["\']stylesheet["\'][^>]*>', re.IGNORECASE)
+HREF_PATTERN = re.compile(r'href=["\']([^"\']+)["\']')
+
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_RULE_PATTERN = re.compile(r'([^{}]+)\{([^{}]*)\}')
+BACKGROUND_PATTERN = re.compile(r'background(?:-color|-image)?\s*:\s*([^;]+)', re.IGNORECASE)
+# 单个类选择器, 可以带标签名: .footer / section.cta; 伪类、组合选择器不算
+SIMPLE_CLASS_SELECTOR = re.compile(r'^[a-z]*\.([\w-]+)$', re.IGNORECASE)
+
+COLOR_PATTERN = re.compile(
+    r'#([0-9a-f]{6}|[0-9a-f]{3})\b|rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)|\b(white|black)\b',
+    re.IGNORECASE)
+
+
+def parse_colors(value):
+    """提取背景值中的颜色, 返回 [(r, g, b, alpha)]"""
+    colors = []
+    for match in COLOR_PATTERN.finditer(value):
+        hex_value, r, g, b, alpha, name = match.groups()
+        if hex_value:
+            if len(hex_value) == 3:
+                hex_value = ''.join(ch * 2 for ch in hex_value)
+            colors.append((int(hex_value[0:2], 16), int(hex_value[2:4], 16), int(hex_value[4:6], 16), 1.0))
+        elif name:
+            level = 255 if name.lower() == 'white' else 0
+            colors.append((level, level, level, 1.0))
+        else:
+            colors.append((int(r), int(g), int(b), float(alpha) if alpha else 1.0))
+    return colors
+
+
+def is_dark_background(value, name=''):
+    """判断背景是否为深色; 无法判断 (透明、只有图片) 时返回None"""
+    colors = [color for color in parse_colors(value) if color[3] >= MIN_ALPHA]
+    if colors:
+        luminance = sum((0.299 * r + 0.587 * g + 0.114 * b) / 255 for r, g, b, _ in colors) / len(colors)
+        return luminance < LUMINANCE_THRESHOLD
+    if 'url(' in value and any(hint in name.lower() for hint in DARK_NAME_HINTS):
+        return True
+    return None
+
+
+def background_classes(css):
+    """按层叠顺序计算样式表中每个类的背景是否为深色和是否整宽, 返回 {类名: bool}, {类名: bool}"""
+    dark_result = {}
+    width_result = {}
+    for match in CSS_RULE_PATTERN.finditer(CSS_COMMENT_PATTERN.sub('', css)):
+        declarations = match.group(2)
+        backgrounds = BACKGROUND_PATTERN.findall(declarations)
+        has_width = re.search(r'(?:^|[;\s])width\s*:', declarations, re.IGNORECASE)
+        if not backgrounds and not has_width:
+            continue
+        for selector in match.group(1).split(','):
+            selector_match = SIMPLE_CLASS_SELECTOR.match(selector.strip())
+            if not selector_match:
+                continue
+            name = selector_match.group(1)
+            if backgrounds:
+                dark = is_dark_background(backgrounds[-1], name)
+                if dark is not None:
+                    dark_result[name] = dark
+            if has_width:
+                width_result[name] = bool(FULL_WIDTH_PATTERN.search(declarations.strip()))
+    return dark_result, width_result
+
+
+class DarkSectionMarker:
+    def __init__(self, site_root):
+        self.site_root = Path(site_root)
+        self._stylesheets = {}
+
+    def stylesheet_classes(self, css_file):
+        """读取并缓存单个样式表的计算结果"""
+        if css_file not in self._stylesheets:
+            css = css_file.read_text(encoding='utf-8') if css_file.exists() else ''
+            self._stylesheets[css_file] = background_classes(css)
+        return self._stylesheets[css_file]
+
+    def page_classes(self, content, page_dir, stylesheets=None):
+        """页面中深色背景的类和整宽的类: 按引用顺序合并样式表, 页面内 <style> 最后生效"""
+        if stylesheets is None:
+            stylesheets = []
+            for link in STYLESHEET_LINK_PATTERN.findall(content):
+                href_match = HREF_PATTERN.search(link)
+                if href_match and not re.match(r'^[a-z]+:|^//', href_match.group(1)):
+                    stylesheets.append((page_dir / href_match.group(1).split('?', 1)[0]).resolve())
+
+        dark_classes = {}
+        full_width = {}
+        sources = [self.stylesheet_classes(css_file) for css_file in stylesheets]
+        sources += [background_classes(block) for block in STYLE_BLOCK_PATTERN.findall(content)]
+        for dark, width in sources:
+            dark_classes.update(dark)
+            full_width.update(width)
+        return ({name for name, dark in dark_classes.items() if dark},
+                {name for name, wide in full_width.items() if wide})
+
+    def mark(self, content, dark_classes, full_width_classes=()):
+        """给深色区块加上标记类, 去掉已经不是深色或不应标记的元素上的标记"""
+        parts = []
+        last = 0
+        stack = []  # [(标签名, 是否在深色区块内)]
+        for match in TAG_PATTERN.finditer(content):
+            closing, tag, attrs = match.groups()
+            if tag is None:
+                continue
+            tag = tag.lower()
+            if closing:
+                # 容错: 关闭到最近的同名元素, 没有对应的开始标签时忽略
+                for index in range(len(stack) - 1, -1, -1):
+                    if stack[index][0] == tag:
+                        del stack[index:]
+                        break
+                continue
+            if tag in VOID_TAGS or attrs.rstrip().endswith('/'):
+                continue
+
+            inside_dark = bool(stack) and stack[-1][1]
+            candidate = tag in SECTION_TAGS or (tag == 'div' and (
+                all(parent in TOP_LEVEL_PARENTS for parent, _ in stack)
+                or any(name in full_width_classes for name in self.classes(attrs))))
+            dark = candidate and not inside_dark and self.is_dark_block(attrs, dark_classes)
+            stack.append((tag, inside_dark or dark))
+
+            new_attrs = self.update_marker(attrs, dark)
+            if new_attrs != attrs:
+                parts.append(content[last:match.start()])
+                parts.append(f'<{match.group(2)}{new_attrs}>')
+                last = match.end()
+
+        parts.append(content[last:])
+        return ''.join(parts)
+
+    @staticmethod
+    def classes(attrs):
+        class_match = CLASS_ATTR_PATTERN.search(attrs)
+        return class_match.group(2).split() if class_match else []
+
+    @staticmethod
+    def is_dark_block(attrs, dark_classes):
+        """元素的背景是否为深色: style 属性中能判断的背景优先, 否则看类名"""
+        classes = DarkSectionMarker.classes(attrs)
+        if 'header' in classes:
+            return False
+
+        style_match = STYLE_ATTR_PATTERN.search(attrs)
+        inline = BACKGROUND_PATTERN.findall(style_match.group(2)) if style_match else []
+        if inline and is_dark_background(inline[-1]) is not None:
+            return is_dark_background(inline[-1])
+        return any(name in dark_classes for name in classes)
+
+    @staticmethod
+    def update_marker(attrs, dark):
+        """按需加上或去掉 nav-dark 类, 返回新的属性字符串"""
+        class_match = CLASS_ATTR_PATTERN.search(attrs)
+        classes = class_match.group(2).split() if class_match else []
+        if dark == (NAV_DARK_CLASS in classes):
+            return attrs
+        if dark:
+            classes.append(NAV_DARK_CLASS)
+        else:
+            classes = [name for name in classes if name != NAV_DARK_CLASS]
+
+        if class_match:
+            new_attr = f' class="{" ".join(classes)}"' if classes else ''
+            return attrs[:class_match.start()] + new_attr + attrs[class_match.end():]
+        return f' class="{NAV_DARK_CLASS}"' + attrs
+
+    def mark_file(self, html_file, stylesheets=None):
+        """处理单个页面或模板, 返回是否修改"""
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        dark_classes, full_width_classes = self.page_classes(content, html_file.parent, stylesheets)
+        new_content = self.mark(content, dark_classes, full_width_classes)
+        if new_content == content:
+            return False
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        return True
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.').resolve()
+    marker = DarkSectionMarker(site_root)
+    html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+
+    print(f"开始标记 {len(html_files)} 个页面中的深色区块...")
+    updated = 0
+    for html_file in html_files:
+        if marker.mark_file(html_file):
+            updated += 1
+            print(f"  ✓ {html_file.relative_to(site_root)}")
+
+    # 布局模板使用默认样式表
+    default_stylesheets = [(site_root / href).resolve() for href in DEFAULT_STYLESHEETS]
+    templates = sorted(TEMPLATES_DIR.glob('*.html')) + sorted(TEMPLATES_DIR.glob('partials/*.html'))
+    for template in templates:
+        if marker.mark_file(template, default_stylesheets):
+            updated += 1
+            print(f"  ✓ templates/{template.relative_to(TEMPLATES_DIR).as_posix()}")
+
+    print(f"\n完成! 更新了 {updated} 个文件")
+
+
+if __name__ == '__main__':
+    main()
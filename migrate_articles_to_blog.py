@@ -2,13 +2,18 @@
 # -*- coding: utf-8 -*-
 """
 Migrate Articles to Blog Script
-Moves all articles from articles.html to blog.html with pagination support
+Moves all articles from articles.html to blog.html with category filtering and load-more support
 """
 
 import re
 import os
 from datetime import datetime
 
+from site_templates import DEFAULT_SCRIPTS, RenderCache, render_page
+
+# Cards shown before the first load-more click, and per click
+ARTICLES_PER_BATCH = 12
+
 def extract_articles_from_html(file_path):
     """Extract all article cards from articles.html"""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -21,67 +26,9 @@ def extract_articles_from_html(file_path):
     return articles
 
 def create_enhanced_blog_html(articles):
-    """Create enhanced blog.html with all articles and pagination"""
+    """Create enhanced blog.html with all articles, filtered and revealed in batches by js/main.js"""
     
-    # Split articles into pages (12 articles per page)
-    articles_per_page = 12
-    total_pages = (len(articles) + articles_per_page - 1) // articles_per_page
-    
-    html_content = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Backpack Industry Blog | blackbackpack.co.uk - Expert Insights & Guides</title>
-    <meta name="description" content="Explore our comprehensive blog covering backpack industry trends, manufacturing insights, design guides, and expert advice for businesses and professionals.">
-    <meta name="keywords" content="backpack blog, industry insights, manufacturing guides, design trends, B2B backpack knowledge, custom backpack tips">
-    <link rel="stylesheet" href="css/style.css">
-    <link rel="canonical" href="https://blackbackpack.co.uk/blog.html">
-</head>
-<body>
-    <!-- Header -->
-    <header class="header">
-        <nav class="navbar">
-            <div class="nav-container">
-                <div class="nav-logo">
-                    <a href="index.html" class="logo-link">
-                        <i class="fas fa-backpack"></i>
-                        <span class="logo-text">BlackBackpack</span>
-                    </a>
-                </div>
-                <ul class="nav-menu">
-                    <li class="nav-item">
-                        <a href="products.html" class="nav-link">Products</a>
-                    </li>
-                    <li class="nav-item">
-                        <a href="services.html" class="nav-link">Services</a>
-                    </li>
-                    <li class="nav-item">
-                        <a href="about.html" class="nav-link">About</a>
-                    </li>
-                    <li class="nav-item">
-                        <a href="portfolio.html" class="nav-link">Portfolio</a>
-                    </li>
-                    <li class="nav-item">
-                        <a href="blog.html" class="nav-link active">Blog</a>
-                    </li>
-                    <li class="nav-item">
-                        <a href="contact.html" class="nav-link">Contact</a>
-                    </li>
-                </ul>
-                <div class="nav-actions">
-                    <a href="contact.html" class="btn btn-primary">Get Free Quote</a>
-                    <div class="nav-toggle" id="mobile-menu">
-                        <span class="bar"></span>
-                        <span class="bar"></span>
-                        <span class="bar"></span>
-                    </div>
-                </div>
-            </div>
-        </nav>
-    </header>
-
-    <!-- Page Header -->
+    content = '''    <!-- Page Header -->
     <section class="page-header">
         <div class="container">
             <h1>Industry Insights & Expert Guides</h1>
@@ -92,6 +39,10 @@ def create_enhanced_blog_html(articles):
     <!-- Blog Categories -->
     <section class="blog-categories">
         <div class="container">
+            <form class="blog-search" role="search" data-index="search/" data-results="search-results">
+                <input type="search" id="blog-search-input" placeholder="Search articles..." aria-label="Search articles" autocomplete="off">
+            </form>
+            <div class="search-results" id="search-results" aria-live="polite" hidden></div>
             <div class="categories-filter">
                 <button class="category-btn active" data-category="all">All Articles ({total_articles})</button>
                 <button class="category-btn" data-category="manufacturing">Manufacturing</button>
@@ -112,41 +63,23 @@ def create_enhanced_blog_html(articles):
             <div class="articles-header">
                 <h2>All Articles</h2>
                 <div class="articles-count">
-                    <span>Showing <span id="showing-start">1</span>-<span id="showing-end">12</span> of {total_articles} articles</span>
+                    <span>{total_articles} articles</span>
                 </div>
             </div>
             
             <div class="articles-grid" id="articles-grid">
 '''.format(total_articles=len(articles))
     
-    # Add first page of articles
-    for i, article in enumerate(articles[:articles_per_page]):
-        html_content += f"                {article}\n\n"
+    # All cards are in the page; js/main.js filters them by category and
+    # reveals them in batches with the load-more button
+    for article in articles:
+        content += f"                {article}\n\n"
     
-    html_content += '''            </div>
+    content += '''            </div>
 
-            <!-- Pagination -->
-            <div class="pagination-container">
-                <div class="pagination">
-                    <button class="pagination-btn" id="prev-page" disabled>← Previous</button>
-                    <div class="pagination-numbers" id="pagination-numbers">
-'''
-    
-    # Add pagination numbers
-    for page in range(1, min(6, total_pages + 1)):
-        active_class = " active" if page == 1 else ""
-        html_content += f'                        <button class="pagination-number{active_class}" data-page="{page}">{page}</button>\n'
-    
-    if total_pages > 5:
-        html_content += '                        <span class="pagination-dots">...</span>\n'
-        html_content += f'                        <button class="pagination-number" data-page="{total_pages}">{total_pages}</button>\n'
-    
-    html_content += '''                    </div>
-                    <button class="pagination-btn" id="next-page">Next →</button>
-                </div>
-                <div class="pagination-info">
-                    <span>Page <span id="current-page">1</span> of <span id="total-pages">{total_pages}</span></span>
-                </div>
+            <!-- Load More -->
+            <div class="load-more-container">
+                <button class="load-more-btn" data-initial="{per_batch}" data-batch="{per_batch}">Load More Articles</button>
             </div>
         </div>
     </section>
@@ -177,153 +110,17 @@ def create_enhanced_blog_html(articles):
         </div>
     </section>
 
-    <!-- Footer -->
-    <footer class="footer">
-        <div class="container">
-            <div class="footer-content">
-                <div class="footer-section">
-                    <h3>Black Backpack</h3>
-                    <p>Leading custom backpack manufacturer specializing in B2B solutions worldwide.</p>
-                    <div class="contact-info">
-                        <p>Email: <a href="mailto:cco@junyuanbags.com">cco@junyuanbags.com</a></p>
-                    </div>
-                </div>
-                <div class="footer-section">
-                    <h4>Quick Links</h4>
-                    <ul>
-                        <li><a href="products.html">Products</a></li>
-                        <li><a href="services.html">Services</a></li>
-                        <li><a href="about.html">About Us</a></li>
-                        <li><a href="contact.html">Contact</a></li>
-                    </ul>
-                </div>
-                <div class="footer-section">
-                    <h4>Resources</h4>
-                    <ul>
-                        <li><a href="blog.html">Blog</a></li>
-                    </ul>
-                </div>
-            </div>
-            <div class="footer-bottom">
-                <p>&copy; 2024 Black Backpack. All rights reserved.</p>
-            </div>
-        </div>
-    </footer>
+'''.format(per_batch=ARTICLES_PER_BATCH)
 
-    <!-- Hidden Articles Data for Pagination -->
-    <script>
-        const allArticles = ['''.format(total_pages=total_pages)
-    
-    # Add all articles as JavaScript data
-    for i, article in enumerate(articles):
-        # Escape quotes and newlines for JavaScript
-        escaped_article = article.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '')
-        html_content += f'            "{escaped_article}"'
-        if i < len(articles) - 1:
-            html_content += ',\n'
-        else:
-            html_content += '\n'
-    
-    html_content += '''        ];
-        
-        const articlesPerPage = 12;
-        const totalPages = Math.ceil(allArticles.length / articlesPerPage);
-        let currentPage = 1;
-        
-        function showPage(page) {
-            const startIndex = (page - 1) * articlesPerPage;
-            const endIndex = Math.min(startIndex + articlesPerPage, allArticles.length);
-            
-            const articlesGrid = document.getElementById('articles-grid');
-            articlesGrid.innerHTML = '';
-            
-            for (let i = startIndex; i < endIndex; i++) {
-                articlesGrid.innerHTML += allArticles[i];
-            }
-            
-            // Update pagination
-            document.getElementById('current-page').textContent = page;
-            document.getElementById('total-pages').textContent = totalPages;
-            document.getElementById('showing-start').textContent = startIndex + 1;
-            document.getElementById('showing-end').textContent = endIndex;
-            
-            // Update pagination buttons
-            document.getElementById('prev-page').disabled = page === 1;
-            document.getElementById('next-page').disabled = page === totalPages;
-            
-            // Update active page number
-            document.querySelectorAll('.pagination-number').forEach(btn => {
-                btn.classList.remove('active');
-                if (parseInt(btn.dataset.page) === page) {
-                    btn.classList.add('active');
-                }
-            });
-            
-            currentPage = page;
-            
-            // Scroll to top of articles section
-            document.querySelector('.articles-section').scrollIntoView({ behavior: 'smooth' });
-        }
-        
-        // Event listeners
-        document.getElementById('prev-page').addEventListener('click', () => {
-            if (currentPage > 1) showPage(currentPage - 1);
-        });
-        
-        document.getElementById('next-page').addEventListener('click', () => {
-            if (currentPage < totalPages) showPage(currentPage + 1);
-        });
-        
-        document.querySelectorAll('.pagination-number').forEach(btn => {
-            btn.addEventListener('click', () => {
-                const page = parseInt(btn.dataset.page);
-                showPage(page);
-            });
-        });
-        
-        // Category filtering
-        document.querySelectorAll('.category-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
-                document.querySelectorAll('.category-btn').forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
-                
-                const category = btn.dataset.category;
-                if (category === 'all') {
-                    showPage(1);
-                } else {
-                    // Filter articles by category
-                    const filteredArticles = allArticles.filter(article => 
-                        article.includes(`data-category="${category}"`) || 
-                        article.includes(`<div class="article-category">${category.charAt(0).toUpperCase() + category.slice(1)}</div>`) ||
-                        article.includes(`<div class="article-category">Manufacturing</div>`) && category === 'manufacturing' ||
-                        article.includes(`<div class="article-category">Design & Innovation</div>`) && category === 'design' ||
-                        article.includes(`<div class="article-category">Materials & Quality</div>`) && category === 'materials' ||
-                        article.includes(`<div class="article-category">Business Insights</div>`) && category === 'business' ||
-                        article.includes(`<div class="article-category">Industry Trends</div>`) && category === 'trends' ||
-                        article.includes(`<div class="article-category">Sustainability</div>`) && category === 'sustainability' ||
-                        article.includes(`<div class="article-category">Technology</div>`) && category === 'technology' ||
-                        article.includes(`<div class="article-category">How-to Guides</div>`) && category === 'guides'
-                    );
-                    
-                    const articlesGrid = document.getElementById('articles-grid');
-                    articlesGrid.innerHTML = '';
-                    filteredArticles.forEach(article => {
-                        articlesGrid.innerHTML += article;
-                    });
-                    
-                    // Hide pagination for filtered results
-                    document.querySelector('.pagination-container').style.display = 'none';
-                }
-            });
-        });
-    </script>
-    
-    <script src="js/script.js"></script>
-    <script src="js/navigation.js"></script>
-</body>
-</html>'''
-    
-    return html_content
+    return render_page(
+        'blog.html',
+        'Backpack Industry Blog | blackbackpack.co.uk - Expert Insights & Guides',
+        content,
+        description='Explore our comprehensive blog covering backpack industry trends, manufacturing insights, design guides, and expert advice for businesses and professionals.',
+        keywords='backpack blog, industry insights, manufacturing guides, design trends, B2B backpack knowledge, custom backpack tips',
+        head='    <link rel="canonical" href="https://blackbackpack.co.uk/blog.html">',
+        scripts=DEFAULT_SCRIPTS + ['js/search.js'],
+    )
 
 def remove_articles_navigation():
     """Remove articles navigation from other pages"""
@@ -361,21 +158,20 @@ def main():
     articles = extract_articles_from_html('articles.html')
     print(f"Found {len(articles)} articles to migrate")
     
-    # Create enhanced blog.html
-    blog_content = create_enhanced_blog_html(articles)
-    
-    # Write new blog.html
-    with open('blog.html', 'w', encoding='utf-8') as f:
-        f.write(blog_content)
-    
-    print(f"Created enhanced blog.html with {len(articles)} articles and pagination")
+    # Create enhanced blog.html, skipped when the articles and layout are unchanged
+    cache = RenderCache('.')
+    if cache.build('blog.html', create_enhanced_blog_html, articles, overwrite=True):
+        print(f"Created enhanced blog.html with {len(articles)} articles")
+    else:
+        print("blog.html is up to date")
+    cache.save()
     
     # Remove articles navigation from other pages
     remove_articles_navigation()
     
     print("Migration completed successfully!")
     print(f"- Blog now contains {len(articles)} articles")
-    print("- Pagination implemented (12 articles per page)")
+    print(f"- Load more implemented ({ARTICLES_PER_BATCH} articles per batch)")
     print("- Category filtering available")
     print("- Articles navigation removed from other pages")
 
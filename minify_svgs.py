@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG压缩和规范化脚本
+删除注释和多余空白, 缩短数字和颜色, 把 stop 的 style 改为属性, 转义裸露的 &,
+合并重复的渐变定义并删除未被引用的定义, 把 images/ 中的SVG写回为压缩版本并统计节省的体积
+
+其他生成SVG的脚本可以直接调用 minify_svg() 在写文件前压缩
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# 可以合并或删除的定义元素
+DEF_ELEMENTS = ['linearGradient', 'radialGradient', 'pattern', 'filter', 'clipPath', 'mask', 'marker']
+
+# 值为颜色的属性
+COLOR_ATTRIBUTES = {'fill', 'stroke', 'stop-color', 'color', 'flood-color', 'lighting-color'}
+
+# 值中可能包含数字的属性 (id、href、class 以及文本内容不处理)
+SKIP_NUMBER_ATTRIBUTES = {'id', 'href', 'xlink:href', 'class', 'xmlns', 'xmlns:xlink', 'font-family'}
+
+ATTRIBUTE_PATTERN = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"|([\w:-]+)\s*=\s*\'([^\']*)\'')
+
+
+def shorten_numbers(value):
+    """去掉数字中多余的0: 1.50 -> 1.5, 0.5 -> .5, 2.0 -> 2"""
+    value = re.sub(r'(?<![\w#.])(-?\d+\.\d*?)0+(?!\d)', r'\1', value)
+    value = re.sub(r'(?<![\w#.])(-?\d+)\.(?!\d)', r'\1', value)
+    value = re.sub(r'(?<![\w#.\d])(-?)0+(\.\d)', r'\1\2', value)
+    return value
+
+
+def shorten_colors(value):
+    """缩短十六进制颜色: #ffffff -> #fff"""
+    return re.sub(r'#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3(?![0-9a-fA-F])',
+                  lambda m: f'#{m.group(1)}{m.group(2)}{m.group(3)}'.lower(), value)
+
+
+def minify_style_text(css):
+    """压缩 <style> 或 style 属性中的CSS"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css)
+    css = css.replace(';}', '}')
+    return shorten_colors(shorten_numbers(css)).strip().rstrip(';')
+
+
+def canonicalize_tag(tag_match):
+    """规范化单个开始标签的属性"""
+    name = tag_match.group(1)
+    attrs_text = tag_match.group(2)
+    closing = '/' if tag_match.group(3) else ''
+
+    attrs = []
+    for match in ATTRIBUTE_PATTERN.finditer(attrs_text):
+        attr = match.group(1) or match.group(3)
+        value = match.group(2) if match.group(1) else match.group(4)
+        attrs.append([attr, value])
+
+    # <stop style="stop-color:x;stop-opacity:1"> -> <stop stop-color="x">
+    if name == 'stop':
+        for attr, value in list(attrs):
+            if attr != 'style':
+                continue
+            attrs.remove([attr, value])
+            for declaration in value.split(';'):
+                if ':' not in declaration:
+                    continue
+                prop, prop_value = [part.strip() for part in declaration.split(':', 1)]
+                if prop == 'stop-opacity' and prop_value in ('1', '1.0'):
+                    continue
+                attrs.append([prop, prop_value])
+
+    parts = [name]
+    for attr, value in attrs:
+        if attr == 'style':
+            value = minify_style_text(value)
+            if not value:
+                continue
+        elif attr not in SKIP_NUMBER_ATTRIBUTES:
+            value = shorten_numbers(re.sub(r'\s+', ' ', value).strip())
+        if attr in COLOR_ATTRIBUTES or attr == 'style':
+            value = shorten_colors(value)
+        quote = "'" if '"' in value else '"'
+        parts.append(f'{attr}={quote}{value}{quote}')
+
+    return '<' + ' '.join(parts) + closing + '>'
+
+
+def dedupe_defs(svg):
+    """合并内容相同的定义元素, 删除没有被引用的定义"""
+    pattern = re.compile(
+        r'<(' + '|'.join(DEF_ELEMENTS) + r')\b([^>]*?)\bid="([^"]+)"([^>]*?)(/>|>.*?</\1>)', re.DOTALL)
+
+    seen = {}
+    renames = {}
+
+    def replace_def(match):
+        element_id = match.group(3)
+        key = (match.group(1), match.group(2) + match.group(4), match.group(5))
+        if key in seen:
+            renames[element_id] = seen[key]
+            return ''
+        seen[key] = element_id
+        return match.group(0)
+
+    svg = pattern.sub(replace_def, svg)
+    for old_id, new_id in renames.items():
+        svg = re.sub(rf'url\(#{re.escape(old_id)}\)', f'url(#{new_id})', svg)
+        svg = re.sub(rf'href="#{re.escape(old_id)}"', f'href="#{new_id}"', svg)
+
+    # 删除没有任何引用的定义
+    def remove_unused(match):
+        element_id = match.group(3)
+        if re.search(rf'url\(#{re.escape(element_id)}\)|href="#{re.escape(element_id)}"', svg):
+            return match.group(0)
+        return ''
+
+    svg = pattern.sub(remove_unused, svg)
+    return re.sub(r'<defs>\s*</defs>|<defs/>', '', svg)
+
+
+def minify_svg(svg):
+    """压缩单个SVG文本"""
+    # 删除XML注释
+    svg = re.sub(r'<!--.*?-->', '', svg, flags=re.DOTALL)
+
+    # 转义文本中未转义的 &, 否则浏览器会把整个SVG当作无效XML
+    svg = re.sub(r'&(?!#?\w+;)', '&amp;', svg)
+
+    # 压缩 <style> 内容
+    svg = re.sub(r'(<style[^>]*>)(.*?)(</style>)',
+                 lambda m: m.group(1) + minify_style_text(m.group(2)) + m.group(3), svg, flags=re.DOTALL)
+
+    # 规范化每个开始标签
+    svg = re.sub(r'<([a-zA-Z][\w:-]*)((?:\s+[\w:-]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*)\s*(/?)>',
+                 canonicalize_tag, svg)
+
+    # 文本元素首尾空白在SVG中会被忽略
+    svg = re.sub(r'(<text[^>]*>)\s*([^<]*?)\s*(</text>)', r'\1\2\3', svg)
+
+    # 标签之间的空白
+    svg = re.sub(r'>\s+<', '><', svg)
+    svg = dedupe_defs(svg)
+    return svg.strip() + '\n'
+
+
+def minify_file(svg_file):
+    """压缩单个SVG文件, 返回 (原大小, 新大小)"""
+    with open(svg_file, 'r', encoding='utf-8') as f:
+        original = f.read()
+
+    minified = minify_svg(original)
+    if minified != original:
+        with open(svg_file, 'w', encoding='utf-8') as f:
+            f.write(minified)
+
+    return len(original.encode('utf-8')), len(minified.encode('utf-8'))
+
+
+def main():
+    images_dir = Path(sys.argv[1] if len(sys.argv) > 1 else 'images')
+    svg_files = sorted(images_dir.glob('*.svg'))
+
+    print(f"开始压缩 {len(svg_files)} 个SVG文件...")
+
+    total_before = 0
+    total_after = 0
+    for svg_file in svg_files:
+        try:
+            before, after = minify_file(svg_file)
+        except Exception as e:
+            print(f"  ✗ 压缩 {svg_file.name} 失败: {e}")
+            continue
+        total_before += before
+        total_after += after
+        if before != after:
+            print(f"  ✓ {svg_file.name}: {before} -> {after} 字节 (-{(before - after) / before * 100:.0f}%)")
+
+    saved = total_before - total_after
+    print(f"\nSVG压缩完成: {total_before / 1024:.1f} KB -> {total_after / 1024:.1f} KB, "
+          f"节省 {saved / 1024:.1f} KB ({saved / max(total_before, 1) * 100:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,9 @@ import os
 import re
 import random
 from pathlib import Path
+from image_metadata import ImageMetadataCache
+from internal_links import InternalLinker
+from related_articles import RelatedArticles
 
 class ArticleOptimizer:
     def __init__(self):
@@ -18,6 +21,9 @@ class ArticleOptimizer:
         # 获取所有可用的背包图片
         self.backpack_images = [f for f in os.listdir(self.images_dir) 
                                if f.startswith('blackbackpack') and f.endswith('.webp')]
+        self.image_metadata = ImageMetadataCache(self.images_dir)
+        self.linker = InternalLinker(self.articles_dir)
+        self.related = RelatedArticles(self.articles_dir)
         
         # 视频链接模板
         self.video_links = [
@@ -179,7 +185,8 @@ class ArticleOptimizer:
             additional_images_needed = 3 - len(existing_imgs)
             for i in range(additional_images_needed):
                 if i < len(new_images):
-                    img_html = f'<img src="../images/{new_images[i]}" alt="Professional Backpack Manufacturing" class="article-image">'
+                    size_attrs = self.image_metadata.size_attributes(new_images[i])
+                    img_html = f'<img src="../images/{new_images[i]}" alt="Professional Backpack Manufacturing" class="article-image"{size_attrs}>'
                     
                     # 在不同位置插入图片
                     if i == 0:
@@ -203,20 +210,9 @@ class ArticleOptimizer:
         
         return content, used_images
     
-    def enhance_seo_elements(self, content, title):
-        """增强SEO元素"""
-        # 添加更多的内部链接
-        seo_keywords = [
-            (r'\b(backpack manufacturing)\b', r'<a href="../articles/custom-backpack-manufacturing-b2b-complete-guide.html">\1</a>'),
-            (r'\b(quality control)\b', r'<a href="../articles/quality-control-backpack-production-standards.html">\1</a>'),
-            (r'\b(sustainable materials)\b', r'<a href="../articles/eco-friendly-materials-sustainable-backpack-production.html">\1</a>'),
-            (r'\b(supply chain)\b', r'<a href="../articles/supply-chain-management-backpack-manufacturing.html">\1</a>'),
-        ]
-        
-        for pattern, replacement in seo_keywords:
-            # 只替换第一次出现，避免过度优化
-            content = re.sub(pattern, replacement, content, count=1, flags=re.IGNORECASE)
-        
+    def enhance_seo_elements(self, content, page_name):
+        """增强SEO元素: 由内链引擎在正文文本中插入内部链接"""
+        content, _ = self.linker.link_content(content, page_name)
         return content
     
     def optimize_article(self, file_path):
@@ -244,9 +240,10 @@ class ArticleOptimizer:
         content = self.add_supplier_section(content, article_type)
         
         # 增强SEO元素
-        title_match = re.search(r'<title>([^<]+)</title>', content)
-        title = title_match.group(1) if title_match else article_type
-        content = self.enhance_seo_elements(content, title)
+        content = self.enhance_seo_elements(content, file_path.name)
+        
+        # 相关阅读区块
+        content = self.related.inject(content, file_path.name)
         
         # 保存优化后的文章
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -266,6 +263,9 @@ class ArticleOptimizer:
             if self.optimize_article(file_path):
                 optimized_count += 1
         
+        self.image_metadata.save()
+        self.related.save()
+        
         print(f"\n优化完成！共优化了 {optimized_count} 篇文章")
         return optimized_count
 
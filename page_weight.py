@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+页面体积预算检查脚本
+统计每个页面的HTML字节数, 以及页面引用的CSS、JS、图片字节数 (同一页面内重复引用只算一次),
+请求数和压缩后的传输大小 (文本资源按gzip计算, 图片按原始大小), 结果按运行记录保存在
+.page-weight-history.json 中
+首屏体积 (initial) 不包括 loading="lazy" 的图片, 总体积 (transfer) 包括页面引用的全部资源
+
+以下情况检查失败, 脚本以退出码 1 结束, 可以放在优化脚本之后作为发布前的检查:
+  - 页面超过所在分组的预算 (BUDGETS: 首屏体积、首屏请求数和总体积)
+  - 页面首屏体积或总体积比上一次通过检查的运行增加超过 MAX_REGRESSION_PERCENT
+
+不包括样式表中 url() 引用的背景图片和字体 (是否下载取决于选择器是否匹配), 也不包括 prefetch 的页面
+
+用法: python page_weight.py [站点目录] [--no-save]
+"""
+
+import re
+import sys
+import json
+import zlib
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+from fingerprint_assets import resolve_reference
+from prune_unused_css import get_page_group
+
+HISTORY_FILE = '.page-weight-history.json'
+
+# 历史记录最多保留的运行次数
+HISTORY_LIMIT = 30
+
+# 各分组页面的预算 (压缩后): 首屏体积 (KB)、首屏请求数、包括延迟加载图片的总体积 (KB)
+# 按目前各分组最重的页面留出余量设置, 页面变重时再有意识地调整
+BUDGETS = {
+    'articles': {'initial_kb': 400, 'initial_requests': 12, 'transfer_kb': 4096},
+    'blog': {'initial_kb': 200, 'initial_requests': 12, 'transfer_kb': 4096},
+    'category': {'initial_kb': 200, 'initial_requests': 12, 'transfer_kb': 512},
+    'pages': {'initial_kb': 250, 'initial_requests': 12, 'transfer_kb': 1024},
+}
+
+# 检查退化的指标
+REGRESSION_METRICS = {'initial': '首屏', 'transfer': '总体积'}
+
+# 比上次通过检查时增加超过这个百分比视为退化
+MAX_REGRESSION_PERCENT = 10
+
+# 增加量小于这个字节数时不算退化, 避免小页面上的正常改动被拦下
+MIN_REGRESSION_BYTES = 2048
+
+# 按gzip压缩计算传输大小的文件类型
+COMPRESSIBLE_EXTENSIONS = {'.html', '.css', '.js', '.svg', '.json', '.xml', '.txt'}
+
+RESOURCE_KINDS = {
+    '.css': 'css',
+    '.js': 'js',
+}
+
+LINK_TAG_PATTERN = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+SCRIPT_SRC_PATTERN = re.compile(r'<script\b[^>]*\ssrc=(["\'])([^"\']+)\1', re.IGNORECASE)
+IMG_TAG_PATTERN = re.compile(r'<(?:img|source|video|input)\b[^>]*>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'\s([\w:-]+)\s*=\s*(["\'])(.*?)\2', re.DOTALL)
+CSS_URL_PATTERN = re.compile(r'url\((["\']?)([^"\')]+)\1\)')
+STYLE_CONTEXT_PATTERN = re.compile(r'<style[^>]*>.*?</style>|\sstyle=(["\']).*?\1', re.DOTALL | re.IGNORECASE)
+
+# 页面加载时会下载的 <link rel>; prefetch 等提示不计入
+LOADED_LINK_RELS = {'stylesheet', 'icon', 'shortcut', 'apple-touch-icon', 'preload', 'modulepreload', 'manifest'}
+
+
+def tag_attrs(tag):
+    """标签属性字典 (属性名小写)"""
+    return {name.lower(): value for name, _, value in ATTR_PATTERN.findall(tag)}
+
+
+def page_references(content):
+    """页面加载时请求的资源引用, 返回 [(引用, 是否延迟加载)]"""
+    refs = []
+    for tag in LINK_TAG_PATTERN.findall(content):
+        attrs = tag_attrs(tag)
+        if set(attrs.get('rel', '').lower().split()) & LOADED_LINK_RELS and attrs.get('href'):
+            refs.append(attrs['href'])
+    refs += [match.group(2) for match in SCRIPT_SRC_PATTERN.finditer(content)]
+    lazy = set()
+    for tag in IMG_TAG_PATTERN.findall(content):
+        attrs = tag_attrs(tag)
+        # 浏览器只下载 srcset 中的一个候选, 按 src 或第一个候选计算
+        src = attrs.get('src') or attrs.get('srcset', '').split(',')[0].strip().split(' ')[0]
+        if src:
+            if attrs.get('loading', '').lower() == 'lazy':
+                lazy.add(src)
+            else:
+                refs.append(src)
+        if attrs.get('poster'):
+            refs.append(attrs['poster'])
+    for match in STYLE_CONTEXT_PATTERN.finditer(content):
+        refs += [url for _, url in CSS_URL_PATTERN.findall(match.group(0))]
+
+    # 同一个文件在页面中也有立即加载的引用时, 不算延迟加载
+    eager = set(refs)
+    return [(ref, False) for ref in refs] + [(ref, True) for ref in sorted(lazy - eager)]
+
+
+class PageWeigher:
+    def __init__(self, site_root):
+        self.site_root = Path(site_root)
+        self._sizes = {}
+
+    def file_sizes(self, relative):
+        """文件的 (原始大小, 传输大小), 结果缓存"""
+        if relative not in self._sizes:
+            path = self.site_root / relative
+            data = path.read_bytes()
+            if path.suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+                transfer = len(zlib.compress(data, 6))
+            else:
+                transfer = len(data)
+            self._sizes[relative] = (len(data), transfer)
+        return self._sizes[relative]
+
+    def weigh(self, html_file):
+        """统计单个页面, 返回各项指标"""
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        page = html_file.relative_to(self.site_root).as_posix()
+        html_bytes, html_transfer = self.file_sizes(page)
+        result = {'html': html_bytes, 'css': 0, 'js': 0, 'images': 0, 'other': 0,
+                  'transfer': html_transfer, 'lazy': 0, 'requests': 1, 'initial_requests': 1, 'missing': 0}
+
+        resources = {}
+        for ref, lazy in page_references(content):
+            if ref.startswith('data:'):
+                continue
+            resolved = resolve_reference(self.site_root, html_file.parent, ref)
+            # 外部资源无法统计大小, 只计请求数
+            if resolved is None:
+                if re.match(r'^(https?:)?//', ref):
+                    resources[ref] = resources.get(ref, True) and lazy
+                continue
+            resources[resolved] = resources.get(resolved, True) and lazy
+
+        for resource, lazy in resources.items():
+            result['requests'] += 1
+            if not lazy:
+                result['initial_requests'] += 1
+            if not (self.site_root / resource).is_file():
+                if '://' not in resource and not resource.startswith('//'):
+                    result['missing'] += 1
+                continue
+            raw, transfer = self.file_sizes(resource)
+            kind = RESOURCE_KINDS.get(Path(resource).suffix.lower())
+            if kind is None:
+                kind = 'images' if resource.startswith('images/') or Path(resource).suffix.lower() in (
+                    '.svg', '.webp', '.jpg', '.jpeg', '.png', '.gif', '.ico', '.avif') else 'other'
+            result[kind] += raw
+            result['transfer'] += transfer
+            if lazy:
+                result['lazy'] += transfer
+        result['initial'] = result['transfer'] - result['lazy']
+        return result
+
+
+def load_history(site_root):
+    history_path = site_root / HISTORY_FILE
+    if history_path.exists():
+        try:
+            with open(history_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"读取历史记录 {history_path} 失败, 将重新开始记录: {e}")
+    return []
+
+
+def save_history(site_root, history):
+    with open(site_root / HISTORY_FILE, 'w', encoding='utf-8') as f:
+        json.dump(history[-HISTORY_LIMIT:], f, ensure_ascii=False)
+
+
+def current_commit(site_root):
+    """站点目录当前的git提交, 不是git仓库时返回None"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=site_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def check_page(page, group, metrics, baseline):
+    """返回页面违反预算或退化的说明列表"""
+    problems = []
+    budget = BUDGETS.get(group, BUDGETS['pages'])
+    if metrics['initial'] > budget['initial_kb'] * 1024:
+        problems.append(f"首屏 {metrics['initial'] / 1024:.1f} KB 超过预算 {budget['initial_kb']} KB")
+    if metrics['initial_requests'] > budget['initial_requests']:
+        problems.append(f"首屏请求数 {metrics['initial_requests']} 超过预算 {budget['initial_requests']}")
+    if metrics['transfer'] > budget['transfer_kb'] * 1024:
+        problems.append(f"总体积 {metrics['transfer'] / 1024:.1f} KB 超过预算 {budget['transfer_kb']} KB")
+
+    previous = baseline.get(page)
+    if previous:
+        for metric, label in REGRESSION_METRICS.items():
+            # 旧的记录中可能没有这个指标
+            if metric not in previous:
+                continue
+            increase = metrics[metric] - previous[metric]
+            if increase > MIN_REGRESSION_BYTES and increase > previous[metric] * MAX_REGRESSION_PERCENT / 100:
+                problems.append(f"{label} {previous[metric] / 1024:.1f} KB -> {metrics[metric] / 1024:.1f} KB "
+                                f"(+{increase / max(previous[metric], 1) * 100:.1f}%)")
+    return problems
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    site_root = Path(args[0] if args else '.').resolve()
+    html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+
+    print(f"开始统计 {len(html_files)} 个页面的体积...")
+    weigher = PageWeigher(site_root)
+    pages = {html_file.relative_to(site_root).as_posix(): weigher.weigh(html_file) for html_file in html_files}
+    groups = {html_file.relative_to(site_root).as_posix(): get_page_group(html_file) for html_file in html_files}
+
+    history = load_history(site_root)
+    passing = [run for run in history if run.get('passed')]
+    baseline = passing[-1]['pages'] if passing else {}
+
+    failures = {}
+    for page, metrics in pages.items():
+        problems = check_page(page, groups[page], metrics, baseline)
+        if problems:
+            failures[page] = problems
+
+    # 按分组汇总
+    print(f"\n{'分组':<10}{'页面':>6}{'平均HTML':>12}{'平均首屏':>12}{'最大首屏':>12}{'最大总体积':>12}{'平均请求':>10}")
+    for group in BUDGETS:
+        members = [metrics for page, metrics in pages.items() if groups[page] == group]
+        if not members:
+            continue
+        print(f"{group:<10}{len(members):>6}"
+              f"{sum(m['html'] for m in members) / len(members) / 1024:>10.1f}KB"
+              f"{sum(m['initial'] for m in members) / len(members) / 1024:>10.1f}KB"
+              f"{max(m['initial'] for m in members) / 1024:>10.1f}KB"
+              f"{max(m['transfer'] for m in members) / 1024:>10.1f}KB"
+              f"{sum(m['requests'] for m in members) / len(members):>10.1f}")
+
+    heaviest = sorted(pages.items(), key=lambda item: -item[1]['initial'])[:5]
+    print("\n首屏最重的页面:")
+    for page, metrics in heaviest:
+        print(f"  - {page}: 首屏 {metrics['initial'] / 1024:.1f} KB / {metrics['initial_requests']} 个请求, "
+              f"总体积 {metrics['transfer'] / 1024:.1f} KB / {metrics['requests']} 个请求 "
+              f"(HTML {metrics['html'] / 1024:.1f} KB, CSS {metrics['css'] / 1024:.1f} KB, "
+              f"JS {metrics['js'] / 1024:.1f} KB, 图片 {metrics['images'] / 1024:.1f} KB)")
+
+    if baseline:
+        before = sum(baseline[page]['transfer'] for page in pages if page in baseline)
+        after = sum(pages[page]['transfer'] for page in pages if page in baseline)
+        print(f"\n与上次通过检查的运行 ({passing[-1]['time']}) 相比: "
+              f"{before / 1024:.1f} KB -> {after / 1024:.1f} KB ({(after - before) / 1024:+.1f} KB)")
+
+    missing = sum(metrics['missing'] for metrics in pages.values())
+    if missing:
+        print(f"\n注意: 有 {missing} 个引用的资源文件不存在, 未计入体积")
+
+    if '--no-save' not in sys.argv:
+        history.append({
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'commit': current_commit(site_root),
+            'passed': not failures,
+            'pages': pages,
+        })
+        save_history(site_root, history)
+
+    if failures:
+        print(f"\n✗ {len(failures)} 个页面未通过体积检查:")
+        for page, problems in failures.items():
+            print(f"  - {page}: {'; '.join(problems)}")
+        sys.exit(1)
+
+    print(f"\n✓ {len(pages)} 个页面都在预算之内")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+未使用CSS裁剪脚本
+按页面分组(文章页、分类页、博客页、其他页面)收集实际使用的 class/id/标签,
+删除样式表中匹配不到的规则, 为每个分组输出独立的样式表并更新页面链接,
+减少每个页面加载时阻塞渲染的CSS体积
+
+用法: python prune_unused_css.py [发布目录]
+会原地改写页面和样式表, 只能在发布目录 (默认 dist/) 上运行, 不接受站点源目录;
+在 fingerprint_assets.py 指纹化之前执行
+"""
+
+import re
+import sys
+
+from fingerprint_assets import DEFAULT_OUTPUT_DIR, require_build_dir
+
+# 页面分组: 分组名 -> (匹配函数)
+PAGE_GROUPS = {
+    'articles': lambda path: path.parent.name == 'articles',
+    'blog': lambda path: path.name == 'blog.html',
+    'category': lambda path: path.parent.name != 'articles' and path.name.endswith('-backpacks.html'),
+    'pages': lambda path: True,
+}
+
+# 始终保留的标签, 以及总是保留的@规则
+ALWAYS_USED_TAGS = {'html', 'body', '*'}
+KEEP_AT_RULES = ('@font-face', '@keyframes', '@-webkit-keyframes', '@import', '@charset', '@page')
+
+STYLESHEET_LINK_PATTERN = re.compile(r'<link\b[^>]*\brel=["\']stylesheet["\'][^>]*>', re.IGNORECASE)
+HREF_PATTERN = re.compile(r'\bhref=["\']([^"\']+)["\']')
+
+TAG_PATTERN = re.compile(r'<([a-zA-Z][a-zA-Z0-9-]*)')
+CLASS_ATTR_PATTERN = re.compile(r'\bclass=["\']([^"\']*)["\']')
+ID_ATTR_PATTERN = re.compile(r'\bid=["\']([^"\']*)["\']')
+# JavaScript中动态添加的类名和元素
+JS_CLASS_PATTERN = re.compile(r'classList\.(?:add|toggle|remove|contains|replace)\(\s*([^)]*)\)')
+JS_CLASSNAME_PATTERN = re.compile(r'className\s*\+?=\s*[`"\']([^`"\']*)[`"\']')
+JS_CREATE_PATTERN = re.compile(r'createElement\(\s*["\']([a-zA-Z][a-zA-Z0-9-]*)["\']')
+JS_STRING_PATTERN = re.compile(r'["\']([\w-]+)["\']')
+
+
+def strip_comments(css):
+    """移除CSS注释"""
+    return re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+
+
+def parse_css(css):
+    """
+    把CSS解析为节点列表
+    普通规则: ('rule', 选择器, 声明)
+    嵌套@规则 (@media/@supports): ('block', 前缀, 子节点列表)
+    其他@规则 (@keyframes/@font-face/@import): ('raw', 完整文本)
+    """
+    css = strip_comments(css)
+    nodes = []
+    pos = 0
+    length = len(css)
+
+    while pos < length:
+        # 跳过空白
+        while pos < length and css[pos].isspace():
+            pos += 1
+        if pos >= length:
+            break
+
+        # 读取前缀直到 { 或 ;
+        start = pos
+        quote = None
+        while pos < length:
+            char = css[pos]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in '"\'':
+                quote = char
+            elif char in '{;':
+                break
+            pos += 1
+
+        prelude = css[start:pos].strip()
+        if pos >= length:
+            break
+
+        if css[pos] == ';':
+            # 没有块的@规则, 如 @import
+            nodes.append(('raw', prelude + ';'))
+            pos += 1
+            continue
+
+        # 找到与之匹配的 }
+        depth = 0
+        body_start = pos + 1
+        quote = None
+        while pos < length:
+            char = css[pos]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in '"\'':
+                quote = char
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            pos += 1
+
+        body = css[body_start:pos]
+        pos += 1
+
+        lowered = prelude.lower()
+        if lowered.startswith(('@media', '@supports')):
+            nodes.append(('block', prelude, parse_css(body)))
+        elif lowered.startswith('@'):
+            nodes.append(('raw', f'{prelude} {{{body}}}'))
+        else:
+            nodes.append(('rule', prelude, body.strip()))
+
+    return nodes
+
+
+def serialize_css(nodes, indent=''):
+    """把节点列表序列化为CSS文本"""
+    output = []
+    for node in nodes:
+        if node[0] == 'rule':
+            declarations = '; '.join(d.strip() for d in node[2].split(';') if d.strip())
+            output.append(f'{indent}{node[1]} {{ {declarations}; }}')
+        elif node[0] == 'block':
+            inner = serialize_css(node[2], indent + '    ')
+            if inner:
+                output.append(f'{indent}{node[1]} {{\n{inner}\n{indent}}}')
+        else:
+            output.append(indent + node[1])
+    return '\n'.join(output)
+
+
+def split_selectors(selector_text):
+    """按逗号拆分选择器列表 (忽略括号内的逗号)"""
+    selectors = []
+    depth = 0
+    current = ''
+    for char in selector_text:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == ',' and depth == 0:
+            selectors.append(current.strip())
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        selectors.append(current.strip())
+    return selectors
+
+
+def selector_matches(selector, used):
+    """判断单个选择器在使用的 标签/class/id 集合下是否可能匹配"""
+    # 去掉伪类/伪元素 (包括 :not(...) 等带参数的) 和属性选择器
+    simplified = re.sub(r'::?[a-zA-Z-]+(\([^)]*\))?', '', selector)
+    simplified = re.sub(r'\[[^\]]*\]', '', simplified)
+
+    for compound in re.split(r'\s*[>+~]\s*|\s+', simplified.strip()):
+        if not compound:
+            continue
+
+        tag_match = re.match(r'^([a-zA-Z][a-zA-Z0-9-]*)', compound)
+        if tag_match and tag_match.group(1).lower() not in used['tags']:
+            return False
+
+        for class_name in re.findall(r'\.([\w-]+)', compound):
+            if class_name not in used['classes']:
+                return False
+
+        for id_name in re.findall(r'#([\w-]+)', compound):
+            if id_name not in used['ids']:
+                return False
+
+    return True
+
+
+def prune_nodes(nodes, used):
+    """删除匹配不到的规则, 返回 (保留的节点, 删除的规则数)"""
+    kept = []
+    removed = 0
+
+    for node in nodes:
+        if node[0] == 'rule':
+            selectors = [s for s in split_selectors(node[1]) if selector_matches(s, used)]
+            if selectors:
+                kept.append(('rule', ', '.join(selectors), node[2]))
+            else:
+                removed += 1
+        elif node[0] == 'block':
+            children, child_removed = prune_nodes(node[2], used)
+            removed += child_removed
+            if children:
+                kept.append(('block', node[1], children))
+        elif node[1].lower().startswith(KEEP_AT_RULES):
+            kept.append(node)
+
+    return kept, removed
+
+
+def collect_tokens(text, used):
+    """从HTML或JavaScript文本中收集使用的 标签/class/id"""
+    used['tags'].update(tag.lower() for tag in TAG_PATTERN.findall(text))
+
+    for class_value in CLASS_ATTR_PATTERN.findall(text):
+        used['classes'].update(class_value.split())
+    for id_value in ID_ATTR_PATTERN.findall(text):
+        used['ids'].update(id_value.split())
+
+    for args in JS_CLASS_PATTERN.findall(text):
+        used['classes'].update(JS_STRING_PATTERN.findall(args))
+    for class_value in JS_CLASSNAME_PATTERN.findall(text):
+        used['classes'].update(class_value.split())
+    used['tags'].update(tag.lower() for tag in JS_CREATE_PATTERN.findall(text))
+
+
+def get_page_group(html_file):
+    """返回页面所属的分组"""
+    for group, matcher in PAGE_GROUPS.items():
+        if matcher(html_file):
+            return group
+
+
+def get_linked_stylesheets(content):
+    """返回页面中引用的本地样式表 href 列表"""
+    hrefs = []
+    for link in STYLESHEET_LINK_PATTERN.findall(content):
+        href_match = HREF_PATTERN.search(link)
+        if href_match and not re.match(r'^(https?:)?//', href_match.group(1)):
+            hrefs.append(href_match.group(1))
+    return hrefs
+
+
+def resolve_stylesheet(site_root, html_file, href):
+    """把样式表 href 解析为站点内的文件路径"""
+    path = href.split('?', 1)[0]
+    target = site_root / path.lstrip('/') if path.startswith('/') else html_file.parent / path
+    target = target.resolve()
+    return target if target.exists() else None
+
+
+def pruned_stylesheet_path(stylesheet, group):
+    """style.css -> style-articles.css; 已经是分组样式表时原地裁剪, 重复运行不会叠加后缀"""
+    if stylesheet.stem.endswith(f'-{group}'):
+        return stylesheet
+    return stylesheet.with_name(f'{stylesheet.stem}-{group}{stylesheet.suffix}')
+
+
+def main():
+    site_root = require_build_dir(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR)
+
+    html_files = list(site_root.glob('*.html')) + list(site_root.glob('articles/*.html'))
+    js_text = ''
+    for js_file in site_root.glob('js/*.js'):
+        with open(js_file, 'r', encoding='utf-8') as f:
+            js_text += f.read()
+
+    # 按分组收集页面和使用的选择器
+    groups = {}
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        group = groups.setdefault(get_page_group(html_file), {
+            'pages': [],
+            'stylesheets': set(),
+            'used': {'tags': set(ALWAYS_USED_TAGS), 'classes': set(), 'ids': set()},
+        })
+        group['pages'].append(html_file)
+        collect_tokens(content, group['used'])
+
+        for href in get_linked_stylesheets(content):
+            stylesheet = resolve_stylesheet(site_root, html_file, href)
+            if stylesheet:
+                group['stylesheets'].add(stylesheet)
+
+    print("开始裁剪未使用的CSS规则...")
+
+    for group_name, group in sorted(groups.items()):
+        collect_tokens(js_text, group['used'])
+        replacements = {}
+
+        for stylesheet in sorted(group['stylesheets']):
+            with open(stylesheet, 'r', encoding='utf-8') as f:
+                original = f.read()
+
+            nodes, removed = prune_nodes(parse_css(original), group['used'])
+            pruned = serialize_css(nodes) + '\n'
+
+            output_path = pruned_stylesheet_path(stylesheet, group_name)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(pruned)
+
+            replacements[stylesheet.name] = output_path.name
+            saved = len(original.encode('utf-8')) - len(pruned.encode('utf-8'))
+            print(f"  [{group_name}] {stylesheet.relative_to(site_root)} -> {output_path.name}: "
+                  f"删除 {removed} 条规则, 节省 {saved / 1024:.1f} KB "
+                  f"({saved / max(len(original.encode('utf-8')), 1) * 100:.0f}%)")
+
+        # 更新分组内页面的样式表链接
+        for html_file in group['pages']:
+            with open(html_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            def replace_link(match):
+                link = match.group(0)
+                href_match = HREF_PATTERN.search(link)
+                if not href_match:
+                    return link
+                href = href_match.group(1)
+                name = href.split('?', 1)[0].rsplit('/', 1)[-1]
+                if name in replacements:
+                    return link.replace(href, href.replace(name, replacements[name]))
+                return link
+
+            new_content = STYLESHEET_LINK_PATTERN.sub(replace_link, content)
+            if new_content != content:
+                with open(html_file, 'w', encoding='utf-8') as f:
+                    f.write(new_content)
+
+        print(f"  [{group_name}] 已更新 {len(group['pages'])} 个页面的样式表链接")
+
+    print("\nCSS裁剪完成!")
+
+
+if __name__ == '__main__':
+    main()
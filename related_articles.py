@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相关文章推荐脚本
+对 articles/ 中每篇文章的正文分词一次, 计算TF-IDF向量, 用余弦相似度为每篇文章找出
+最相近的几篇, 在文章末尾写入 "Related Reading" 区块 (重复运行时替换原来的区块)
+
+安装了 NumPy 时向量化计算相似度矩阵 (有 SciPy 时使用稀疏矩阵), 否则用倒排索引
+只累加共享词的点积; 每篇文章的词频按内容哈希缓存在 .related-articles-cache.json,
+内容没有变化的文章不再重新分词
+
+用法: python related_articles.py [站点目录]
+"""
+
+import re
+import sys
+import json
+import html
+import math
+import heapq
+import hashlib
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+CACHE_FILE = '.related-articles-cache.json'
+
+# 每篇文章推荐的相关文章数量
+TOP_K = 4
+
+# 相似度低于这个值的文章不推荐
+MIN_SIMILARITY = 0.05
+
+# NumPy 分块计算时每块的文章数, 控制相似度矩阵的内存占用
+BLOCK_SIZE = 512
+
+# 没有 SciPy 时稠密矩阵最多这么多个元素, 超过时改用倒排索引计算
+MAX_DENSE_CELLS = 20_000_000
+
+BLOCK_START = '<!-- related-reading -->'
+BLOCK_END = '<!-- /related-reading -->'
+BLOCK_PATTERN = re.compile(re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END), re.DOTALL)
+
+STOP_WORDS = {
+    'a', 'about', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'but', 'by', 'can',
+    'could', 'do', 'each', 'for', 'from', 'has', 'have', 'how', 'if', 'in', 'into', 'is', 'it', 'its',
+    'may', 'more', 'most', 'must', 'need', 'not', 'of', 'on', 'or', 'our', 'should', 'such', 'than',
+    'that', 'the', 'their', 'them', 'these', 'they', 'this', 'those', 'through', 'to', 'up', 'was',
+    'we', 'were', 'what', 'when', 'which', 'while', 'will', 'with', 'within', 'without', 'you', 'your',
+}
+
+# 这些元素中的文字不参与计算 (站点导航、侧栏、已有的推荐区块等)
+EXCLUDED_BLOCK_PATTERN = re.compile(
+    r'<(head|script|style|nav|header|footer|aside)\b.*?</\1>',
+    re.DOTALL | re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WORD_PATTERN = re.compile(r'[a-z][a-z0-9]+')
+
+
+def article_text(content):
+    """提取文章正文文字"""
+    body = EXCLUDED_BLOCK_PATTERN.sub(' ', BLOCK_PATTERN.sub(' ', content))
+    return html.unescape(TAG_PATTERN.sub(' ', body)).lower()
+
+
+def tokenize(text):
+    """分词并统计词频, 去掉停用词和简单复数"""
+    counts = {}
+    for word in WORD_PATTERN.findall(text):
+        if word in STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+def article_title(content, filename):
+    """文章标题: <h1> 或 <title> 中站点名之前的部分"""
+    match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.DOTALL) or \
+        re.search(r'<title>(.*?)</title>', content, re.DOTALL)
+    if not match:
+        return filename.rsplit('.', 1)[0].replace('-', ' ').title()
+    text = html.unescape(TAG_PATTERN.sub('', match.group(1)))
+    return re.split(r'\s+\|\s+', text)[0].strip()
+
+
+class RelatedArticles:
+    def __init__(self, articles_dir='articles', cache_file=None):
+        self.articles_dir = Path(articles_dir)
+        self.cache_path = Path(cache_file) if cache_file else self.articles_dir.parent / CACHE_FILE
+        self.cache = self._load_cache()
+        self.changed = False
+        self.names = []
+        self.titles = {}
+        self.related = {}
+        self._build()
+
+    def _load_cache(self):
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"读取缓存 {self.cache_path} 失败, 将重新分词: {e}")
+        return {}
+
+    def _term_counts(self, article_file):
+        """读取文章词频, 内容哈希没有变化时使用缓存"""
+        with open(article_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        # 推荐区块本身不影响词频, 写入区块后缓存仍然有效
+        digest = hashlib.md5(BLOCK_PATTERN.sub('', content).encode('utf-8')).hexdigest()
+        entry = self.cache.get(article_file.name)
+        if not entry or entry['hash'] != digest:
+            entry = {
+                'hash': digest,
+                'title': article_title(content, article_file.name),
+                'terms': tokenize(article_text(content)),
+            }
+            self.cache[article_file.name] = entry
+            self.changed = True
+        return entry
+
+    def _build(self):
+        """计算所有文章的TF-IDF向量和相关文章"""
+        documents = []
+        for article_file in sorted(self.articles_dir.glob('*.html')):
+            entry = self._term_counts(article_file)
+            self.names.append(article_file.name)
+            self.titles[article_file.name] = entry['title']
+            documents.append(entry['terms'])
+
+        # 删除已经不存在的文章的缓存
+        for name in set(self.cache) - set(self.names):
+            del self.cache[name]
+            self.changed = True
+
+        vectors = tfidf_vectors(documents)
+        vocabulary_size = len({term for vector in vectors for term in vector})
+        if np is not None and (sparse is not None or len(vectors) * vocabulary_size <= MAX_DENSE_CELLS):
+            self.related = self._neighbors_numpy(vectors)
+        else:
+            self.related = self._neighbors_python(vectors)
+
+    def _neighbors_python(self, vectors):
+        """倒排索引累加点积, 只比较有共享词的文章"""
+        postings = {}
+        for index, vector in enumerate(vectors):
+            for term, weight in vector.items():
+                postings.setdefault(term, []).append((index, weight))
+
+        related = {}
+        for index, vector in enumerate(vectors):
+            scores = {}
+            for term, weight in vector.items():
+                for other, other_weight in postings[term]:
+                    if other != index:
+                        scores[other] = scores.get(other, 0.0) + weight * other_weight
+            best = heapq.nlargest(TOP_K, scores.items(), key=lambda item: (item[1], -item[0]))
+            related[self.names[index]] = [(self.names[other], score) for other, score in best
+                                          if score >= MIN_SIMILARITY]
+        return related
+
+    def _neighbors_numpy(self, vectors):
+        """用矩阵乘法计算余弦相似度, 分块取每行的前 TOP_K 个"""
+        vocabulary = {}
+        rows, cols, values = [], [], []
+        for index, vector in enumerate(vectors):
+            for term, weight in vector.items():
+                rows.append(index)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                values.append(weight)
+
+        shape = (len(vectors), max(len(vocabulary), 1))
+        if sparse is not None:
+            matrix = sparse.csr_matrix((values, (rows, cols)), shape=shape)
+        else:
+            matrix = np.zeros(shape)
+            matrix[rows, cols] = values
+
+        related = {}
+        for start in range(0, len(vectors), BLOCK_SIZE):
+            block = matrix[start:start + BLOCK_SIZE] @ matrix.T
+            block = block.toarray() if sparse is not None else np.asarray(block)
+            for offset, similarities in enumerate(block):
+                index = start + offset
+                similarities[index] = -1.0
+                count = min(TOP_K, len(similarities) - 1)
+                if count <= 0:
+                    related[self.names[index]] = []
+                    continue
+                top = np.argpartition(-similarities, count - 1)[:count]
+                top = sorted(top, key=lambda other: (-similarities[other], other))
+                related[self.names[index]] = [(self.names[other], float(similarities[other])) for other in top
+                                              if similarities[other] >= MIN_SIMILARITY]
+        return related
+
+    def render_block(self, page_name):
+        """生成一篇文章的 Related Reading 区块, 没有相关文章时返回空字符串"""
+        items = self.related.get(page_name, [])
+        if not items:
+            return ''
+        lines = [BLOCK_START, '<section class="related-reading">', '<h2>Related Reading</h2>', '<ul>']
+        for name, _ in items:
+            lines.append(f'<li><a href="{name}">{html.escape(self.titles[name])}</a></li>')
+        lines += ['</ul>', '</section>', BLOCK_END]
+        return '\n'.join(lines)
+
+    def inject(self, content, page_name):
+        """写入或替换文章中的 Related Reading 区块"""
+        block = self.render_block(page_name)
+        existing = BLOCK_PATTERN.search(content)
+        if existing:
+            return content[:existing.start()] + block + content[existing.end():]
+        if not block:
+            return content
+
+        # 放在正文最后: 最后一个 </article> 之前, 其次 </main>、站点页脚或 </body> 之前
+        for marker in ('</article>', '</main>', '<footer class="footer"', '</body>'):
+            position = content.rfind(marker)
+            if position != -1:
+                return content[:position] + block + '\n' + content[position:]
+        return content
+
+    def inject_file(self, file_path):
+        """处理单个文章文件, 返回是否修改"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = self.inject(content, Path(file_path).name)
+        if new_content == content:
+            return False
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        return True
+
+    def save(self):
+        if not self.changed:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, ensure_ascii=False, sort_keys=True)
+        self.changed = False
+
+
+def tfidf_vectors(documents):
+    """词频列表 -> L2归一化的TF-IDF稀疏向量 (字典)"""
+    document_frequency = {}
+    for terms in documents:
+        for term in terms:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+
+    total = len(documents)
+    vectors = []
+    for terms in documents:
+        vector = {}
+        for term, count in terms.items():
+            # 只出现在一篇文章中的词对相似度没有贡献
+            if document_frequency[term] < 2:
+                continue
+            vector[term] = (1 + math.log(count)) * math.log(total / document_frequency[term])
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({term: weight / norm for term, weight in vector.items() if weight > 0})
+    return vectors
+
+
+def main():
+    site_root = Path(sys.argv[1] if len(sys.argv) > 1 else '.')
+    recommender = RelatedArticles(site_root / 'articles')
+    backend = 'NumPy' + (' + SciPy' if sparse is not None else '') if np is not None else '纯Python'
+    print(f"已计算 {len(recommender.names)} 篇文章的TF-IDF向量 ({backend})")
+
+    updated = 0
+    for name in recommender.names:
+        if recommender.inject_file(site_root / 'articles' / name):
+            updated += 1
+            related = ', '.join(other for other, _ in recommender.related[name][:2])
+            print(f"  ✓ {name}: {related}{' ...' if len(recommender.related[name]) > 2 else ''}")
+    recommender.save()
+
+    print(f"\n完成! 更新了 {updated}/{len(recommender.names)} 篇文章的相关阅读")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+页面模板层
+templates/base.html 是全站共用的页面布局, 导航和页脚放在 templates/partials/ 中,
+生成脚本只提供页面内容片段 (文章正文、博客列表等), 由 render_page 套用布局输出完整页面
+
+布局中的局部模板用 <!-- partial:名称 --> ... <!-- /partial:名称 --> 标记,
+修改导航或页脚后运行本脚本, 会重新渲染所有带标记页面中的对应区域,
+不需要再用正则逐个改写几百个页面. 加 --adopt 时先把手工编写页面中的站点导航和页脚
+(或缺少导航/页脚的位置) 换成带标记的区域, 缺少全站样式表的页面同时补上 css/style.css
+
+模板使用 string.Template 语法: $name / ${name}, ${root} 是页面到站点根目录的相对路径前缀
+
+生成脚本通过 RenderCache.build 写入页面, .render-cache.json 记录每个页面的依赖哈希
+(布局、局部模板、片段模板、渲染函数源码、内容数据和数据文件), 依赖没有变化的页面不重新渲染:
+修改导航会重新生成所有页面, 修改一篇文章只重新生成这一页. 缓存不提交到仓库,
+没有缓存记录时根据布局写入的 generator 标记识别生成的页面, 这些页面会重新渲染
+
+用法: python site_templates.py [--adopt] [站点目录]
+"""
+
+import re
+import sys
+import html
+import json
+import inspect
+import hashlib
+from pathlib import Path
+from string import Template
+from functools import lru_cache
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / 'templates'
+
+# 布局中按标记同步的局部模板
+PARTIALS = ['header', 'footer']
+
+PARTIAL_REGION_PATTERN = re.compile(
+    r'(<!-- partial:([\w-]+) -->\n)(.*?)(\n[ \t]*<!-- /partial:\2 -->)', re.DOTALL)
+
+# 手工编写页面中已有的站点导航和页脚, 按顺序尝试, 用于 --adopt
+EXISTING_PARTIAL_PATTERNS = {
+    'header': [
+        # 没有闭合的 <header class="header"> 只替换开始标签, 后面的正文保留
+        re.compile(r'[ \t]*(?:<!-- (?:Header|Navigation) -->\n[ \t]*)?<header class="header">(?!.*</header>)', re.DOTALL),
+        re.compile(r'[ \t]*(?:<!-- (?:Header|Navigation) -->\n[ \t]*)?<header class="header">.*?</header>', re.DOTALL),
+        re.compile(r'[ \t]*(?:<!-- (?:Header|Navigation) -->\n[ \t]*)?<header>\s*<nav class="navbar">.*?</nav>\s*</header>', re.DOTALL),
+        re.compile(r'[ \t]*(?:<!-- (?:Header|Navigation) -->\n[ \t]*)?<nav class="navbar">.*?</nav>', re.DOTALL),
+    ],
+    'footer': [
+        re.compile(r'[ \t]*(?:<!-- Footer -->\n[ \t]*)?<footer(?: class="(?:footer[^"]*|site-footer)")?>.*?</footer>', re.DOTALL),
+    ],
+}
+
+# 没有导航/页脚的页面中插入区域的位置: <body> 之后 / 页面末尾的脚本和 </body> 之前
+PARTIAL_INSERT_PATTERNS = {
+    'header': re.compile(r'<body[^>]*>\n'),
+    'footer': re.compile(r'(?:[ \t]*<script\b[^>]*>(?:(?!</script>).)*</script>\s*)*</body>', re.DOTALL),
+}
+
+SITE_STYLESHEET_PATTERN = re.compile(r'<link[^>]+href="[^"]*css/styles?\.css"')
+STYLESHEET_LINK_PATTERN = re.compile(r'[ \t]*<link[^>]+rel="stylesheet"|</head>')
+
+RENDER_CACHE_FILE = '.render-cache.json'
+
+# templates/base.html 写入的标记, 用来在没有渲染缓存时识别生成的页面
+GENERATOR_MARKER = '<meta name="generator" content="site_templates">'
+
+DEFAULT_STYLESHEETS = ['css/style.css']
+DEFAULT_SCRIPTS = ['js/script.js', 'js/navigation.js']
+
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    """读取 templates/ 下的模板, 例如 'base' 或 'partials/header'"""
+    with open(TEMPLATES_DIR / f'{name}.html', 'r', encoding='utf-8') as f:
+        return Template(f.read().rstrip('\n'))
+
+
+def root_prefix(page):
+    """页面路径 (相对站点根目录) 到根目录的相对前缀: articles/x.html -> ../"""
+    return '../' * Path(page).as_posix().count('/')
+
+
+def page_active_link(page):
+    """根据页面路径推断当前导航栏目, 文章页属于博客栏目"""
+    page = Path(page).as_posix()
+    return 'blog.html' if page.startswith('articles/') else page
+
+
+def mark_active(markup, root, active):
+    """给指向当前栏目的导航链接加上 active 类"""
+    if not active:
+        return markup
+    pattern = re.compile(r'(<a href="' + re.escape(root + active) + r'" class="nav-link)(")')
+    return pattern.sub(r'\1 active\2', markup)
+
+
+def render_partial(name, root='', active=None):
+    """渲染单个局部模板"""
+    markup = load_template(f'partials/{name}').substitute(root=root)
+    return mark_active(markup, root, active)
+
+
+def render_fragment(name, root='', **context):
+    """渲染内容片段模板 (例如文章正文布局)"""
+    return load_template(name).substitute(context, root=root)
+
+
+def render_page(page, title, content, description='', keywords='', active=None,
+                stylesheets=None, scripts=None, head='', body_end=''):
+    """套用基础布局生成完整页面
+
+    page 是页面相对站点根目录的路径, 用于计算资源链接前缀;
+    stylesheets / scripts 是相对站点根目录的路径列表; head 和 body_end 原样插入;
+    active 省略时根据页面路径推断当前导航栏目
+    """
+    root = root_prefix(page)
+    active = page_active_link(page) if active is None else active
+    stylesheets = DEFAULT_STYLESHEETS if stylesheets is None else stylesheets
+    scripts = DEFAULT_SCRIPTS if scripts is None else scripts
+
+    head_lines = [f'    <link rel="stylesheet" href="{root}{href}">' for href in stylesheets]
+    if head:
+        head_lines.append(head.rstrip('\n'))
+    script_lines = [body_end.rstrip('\n')] if body_end else []
+    script_lines += [f'    <script src="{root}{src}"></script>' for src in scripts]
+
+    context = {
+        'title': html.escape(title),
+        'description': html.escape(description),
+        'keywords': html.escape(keywords),
+        'head': '\n'.join(head_lines),
+        'content': content.strip('\n'),
+        'scripts': '\n'.join(script_lines),
+    }
+    for name in PARTIALS:
+        context[name] = render_partial(name, root, active)
+    return load_template('base').substitute(context) + '\n'
+
+
+def file_hash(file_path):
+    """文件内容的哈希"""
+    with open(file_path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def content_hash(value):
+    """内容数据 (字符串、列表、字典) 的哈希"""
+    return hashlib.md5(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def is_generated(html_file):
+    """页面是否由模板布局生成"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        return GENERATOR_MARKER in f.read()
+
+
+class RenderCache:
+    """记录每个生成页面的依赖哈希, 只重新渲染依赖变化的页面"""
+
+    def __init__(self, site_root='.'):
+        self.site_root = Path(site_root)
+        self.cache_path = self.site_root / RENDER_CACHE_FILE
+        self.entries = self._load()
+        self.changed = False
+        self.rendered = 0
+        self.skipped = 0
+        self._hashes = {}
+
+    def _load(self):
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"读取渲染缓存 {self.cache_path} 失败, 将重新渲染: {e}")
+        return {}
+
+    def _template_hash(self, name):
+        if name not in self._hashes:
+            self._hashes[name] = file_hash(TEMPLATES_DIR / f'{name}.html')
+        return self._hashes[name]
+
+    def dependency_key(self, render, args, fragment=None, data_files=()):
+        """页面所有依赖的组合哈希"""
+        templates = ['base'] + [f'partials/{name}' for name in PARTIALS] + ([fragment] if fragment else [])
+        deps = {f'template:{name}': self._template_hash(name) for name in templates}
+        deps['renderer'] = hashlib.md5(inspect.getsource(render).encode('utf-8')).hexdigest()
+        deps['content'] = content_hash(args)
+        for data_file in data_files:
+            data_path = self.site_root / data_file
+            deps[f'file:{data_file}'] = file_hash(data_path) if data_path.exists() else None
+        return content_hash(deps)
+
+    def build(self, page, render, *args, fragment=None, data_files=(), overwrite=False):
+        """依赖变化时调用 render(*args) 重新生成页面, 返回是否重新渲染
+
+        没有渲染记录且不带 generator 标记的已有页面 (手工编写的页面) 只有 overwrite 为True时才覆盖
+        """
+        key = self.dependency_key(render, args, fragment, data_files)
+        target = self.site_root / page
+        cached = self.entries.get(page)
+        if target.exists() and (cached == key or (cached is None and not overwrite
+                                                   and not is_generated(target))):
+            self.skipped += 1
+            return False
+
+        content = render(*args)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if not target.exists() or target.read_text(encoding='utf-8') != content:
+            target.write_text(content, encoding='utf-8')
+        self.entries[page] = key
+        self.changed = True
+        self.rendered += 1
+        return True
+
+    def save(self):
+        if not self.changed:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False, sort_keys=True)
+        self.changed = False
+
+
+def sync_partials(html_file, site_root):
+    """重新渲染页面中所有带标记的局部模板区域, 返回是否修改"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    page = html_file.relative_to(site_root).as_posix()
+    root = root_prefix(page)
+    active = page_active_link(page)
+
+    def replace_region(match):
+        name = match.group(2)
+        if not (TEMPLATES_DIR / 'partials' / f'{name}.html').exists():
+            return match.group(0)
+        return match.group(1) + render_partial(name, root, active) + match.group(4)
+
+    new_content = PARTIAL_REGION_PATTERN.sub(replace_region, content)
+    if new_content == content:
+        return False
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(new_content)
+    return True
+
+
+def adopt_partials(html_file, site_root):
+    """给手工编写的页面加上局部模板标记, 返回是否修改
+
+    已有的站点导航和页脚整体换成带标记的空区域, 没有的在 <body> 之后 / 页面末尾插入,
+    区域内容由随后的 sync_partials 渲染
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    original = content
+
+    for name in PARTIALS:
+        if f'<!-- partial:{name} -->' in content:
+            continue
+        region = f'    <!-- partial:{name} -->\n\n    <!-- /partial:{name} -->'
+        for pattern in EXISTING_PARTIAL_PATTERNS[name]:
+            match = pattern.search(content)
+            if match:
+                content = content[:match.start()] + region + content[match.end():]
+                break
+        else:
+            match = PARTIAL_INSERT_PATTERNS[name].search(content)
+            if not match:
+                print(f"  ✗ {html_file.name}: 找不到插入 {name} 的位置")
+                continue
+            if name == 'header':
+                content = content[:match.end()] + region + '\n' + content[match.end():]
+            else:
+                content = content[:match.start()] + region + '\n' + content[match.start():]
+
+    # 导航和页脚的样式在全站样式表中
+    if not SITE_STYLESHEET_PATTERN.search(content):
+        root = root_prefix(html_file.relative_to(site_root).as_posix())
+        match = STYLESHEET_LINK_PATTERN.search(content)
+        link = f'    <link rel="stylesheet" href="{root}css/style.css">\n'
+        content = content[:match.start()] + link + content[match.start():]
+
+    if content == original:
+        return False
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    site_root = Path(args[0] if args else '.').resolve()
+    html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+
+    if '--adopt' in sys.argv:
+        adopted = [html_file for html_file in html_files if adopt_partials(html_file, site_root)]
+        print(f"给 {len(adopted)} 个页面加上了局部模板标记")
+
+    print(f"开始同步 {len(html_files)} 个页面中的局部模板...")
+    marked = 0
+    updated = 0
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            if '<!-- partial:' not in f.read():
+                continue
+        marked += 1
+        if sync_partials(html_file, site_root):
+            updated += 1
+            print(f"  ✓ {html_file.relative_to(site_root)}")
+
+    print(f"\n完成! {marked} 个页面使用了模板布局, 更新了 {updated} 个")
+
+
+if __name__ == '__main__':
+    main()
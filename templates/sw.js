@@ -0,0 +1,130 @@
+// Service worker generated by build_service_worker.py - do not edit the generated sw.js
+// Template placeholders use string.Template syntax, so this file must not contain other dollar signs.
+// The version changes whenever any precached file changes, so browsers install the new worker
+const VERSION = '$version';
+
+// [url, revision] for every precached file, relative to the site root
+const PRECACHE_MANIFEST = $precache;
+
+const PRECACHE = 'precache';
+const PAGES_CACHE = 'pages';
+const IMAGES_CACHE = 'images';
+const SEARCH_CACHE = 'search';
+const RUNTIME_CACHES = [PRECACHE, PAGES_CACHE, IMAGES_CACHE, SEARCH_CACHE];
+const MAX_IMAGE_ENTRIES = $max_images;
+const OFFLINE_PAGE = '$offline_page';
+
+const scopeUrl = new URL(self.registration.scope);
+
+// Precache entries are keyed by URL plus revision, so a deploy only downloads files whose
+// revision changed; every other entry is kept from the previous version.
+function cacheKey(url, revision) {
+    const key = new URL(url, scopeUrl);
+    key.searchParams.set('__rev', revision);
+    return key.href;
+}
+
+const precacheKeys = new Map(
+    PRECACHE_MANIFEST.map(([url, revision]) => [new URL(url, scopeUrl).href, cacheKey(url, revision)])
+);
+if (precacheKeys.has(new URL('index.html', scopeUrl).href)) {
+    precacheKeys.set(scopeUrl.href, precacheKeys.get(new URL('index.html', scopeUrl).href));
+}
+
+function matchPrecache(url) {
+    const key = precacheKeys.get(url);
+    return key ? caches.match(key) : Promise.resolve(undefined);
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(PRECACHE).then(cache => Promise.all(
+            PRECACHE_MANIFEST.map(([url, revision]) => {
+                const key = cacheKey(url, revision);
+                return cache.match(key).then(cached => {
+                    if (cached) return undefined;
+                    return fetch(new URL(url, scopeUrl), { cache: 'no-cache' }).then(response => {
+                        if (!response.ok) throw new Error('Precache failed: ' + url);
+                        return cache.put(key, response);
+                    });
+                });
+            })
+        )).then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    const currentKeys = new Set(precacheKeys.values());
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(
+                names.filter(name => !RUNTIME_CACHES.includes(name)).map(name => caches.delete(name))
+            ))
+            .then(() => caches.open(PRECACHE))
+            .then(cache => cache.keys().then(requests => Promise.all(
+                requests.filter(request => !currentKeys.has(request.url)).map(request => cache.delete(request))
+            )))
+            .then(() => self.clients.claim())
+    );
+});
+
+function trimCache(name, maxEntries) {
+    return caches.open(name).then(cache => cache.keys().then(requests => {
+        if (requests.length <= maxEntries) return undefined;
+        return Promise.all(requests.slice(0, requests.length - maxEntries).map(request => cache.delete(request)));
+    }));
+}
+
+function networkFirst(request, cacheName) {
+    return fetch(request).then(response => {
+        if (response.ok) {
+            const copy = response.clone();
+            caches.open(cacheName).then(cache => cache.put(request, copy));
+        }
+        return response;
+    }).catch(() => {
+        const url = new URL(request.url);
+        return caches.match(request)
+            .then(cached => cached || matchPrecache(url.origin + url.pathname))
+            .then(cached => cached || (request.mode === 'navigate' ? matchPrecache(new URL(OFFLINE_PAGE, scopeUrl).href) : undefined))
+            .then(cached => cached || Response.error());
+    });
+}
+
+function cacheFirst(request, cacheName, maxEntries) {
+    return caches.match(request).then(cached => {
+        if (cached) return cached;
+        return fetch(request).then(response => {
+            if (response.ok) {
+                const copy = response.clone();
+                caches.open(cacheName)
+                    .then(cache => cache.put(request, copy))
+                    .then(() => maxEntries ? trimCache(cacheName, maxEntries) : undefined);
+            }
+            return response;
+        });
+    });
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    if (url.origin !== scopeUrl.origin || !url.href.startsWith(scopeUrl.href)) return;
+
+    const path = url.pathname.slice(scopeUrl.pathname.length);
+    const resourceUrl = url.origin + url.pathname;
+
+    if (request.mode === 'navigate' || path.endsWith('.html') || path === '') {
+        // Pages (including articles) stay fresh; the cached copy is used when offline
+        event.respondWith(networkFirst(request, PAGES_CACHE));
+    } else if (precacheKeys.has(resourceUrl)) {
+        event.respondWith(matchPrecache(resourceUrl).then(cached => cached || fetch(request)));
+    } else if (path.startsWith('images/')) {
+        event.respondWith(cacheFirst(request, IMAGES_CACHE, MAX_IMAGE_ENTRIES));
+    } else if (path.startsWith('search/') && !path.endsWith('manifest.json')) {
+        // Search shards have content hashes in their names and never change
+        event.respondWith(cacheFirst(request, SEARCH_CACHE));
+    }
+});
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The build scripts live in the repository root and import each other by module name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
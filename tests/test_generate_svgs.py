@@ -0,0 +1,32 @@
+import json
+import shutil
+from pathlib import Path
+
+from fix_missing_images import fix_images
+from generate_svgs import expand_group
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_expand_group_entries_carry_real_file():
+    group = {'template': 'backpack', 'range': [1, 2], 'file': 'bp-{n}.svg',
+             'unless_exists': 'bp ({n}).webp', 'params': {'number': '{n}'}}
+
+    entries = expand_group('bp', group)
+
+    assert entries == [('bp-1.svg', {'number': 1}, False, 'bp (1).webp'),
+                       ('bp-2.svg', {'number': 2}, False, 'bp (2).webp')]
+
+
+def test_fix_images_rewrites_jpg_references(tmp_path, monkeypatch):
+    shutil.copy(REPO_ROOT / 'svg_spec.json', tmp_path / 'svg_spec.json')
+    spec = json.loads((tmp_path / 'svg_spec.json').read_text(encoding='utf-8'))
+    author = next(iter(spec['groups']['authors']['images']))
+    page = tmp_path / 'index.html'
+    page.write_text(f'<img src="images/{author.replace(".svg", ".jpg")}">', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+
+    fix_images()
+
+    assert page.read_text(encoding='utf-8') == f'<img src="images/{author}">'
+    assert (tmp_path / 'images' / author).exists()
@@ -0,0 +1,35 @@
+import io
+
+import pytest
+
+from image_metadata import _read_jpeg_size
+
+SOF_HEADER = b'\xff\xd8\xff\xc0\x00\x11\x08\x01\x00\x02\x00\x03'
+
+
+def test_reads_size_from_start_of_frame():
+    assert _read_jpeg_size(io.BytesIO(SOF_HEADER)) == (512, 256)
+
+
+@pytest.mark.parametrize('data', [
+    b'\xff\xd8\xff\xff',                      # padding bytes up to EOF
+    SOF_HEADER[:8],                           # start-of-frame segment cut short
+    b'\xff\xd8\xff\xe0\x00\x01',              # segment length smaller than its own field
+])
+def test_truncated_jpeg_returns_none(data):
+    assert _read_jpeg_size(io.BytesIO(data)) is None
+
+
+def test_cache_reads_headers_only_and_hashes_on_demand(tmp_path, monkeypatch):
+    import image_metadata
+
+    (tmp_path / 'photo.jpg').write_bytes(SOF_HEADER + b'\0' * 1024)
+    hashed = []
+    monkeypatch.setattr(image_metadata, 'file_hash', lambda path: hashed.append(path) or 'digest')
+    cache = image_metadata.ImageMetadataCache(tmp_path, cache_file=tmp_path / 'cache.json')
+
+    assert cache.get_size('photo.jpg') == (512, 256)
+    assert hashed == []
+    assert cache.get_hash('photo.jpg') == 'digest'
+    assert cache.get_hash('photo.jpg') == 'digest'
+    assert len(hashed) == 1
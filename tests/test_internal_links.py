@@ -0,0 +1,15 @@
+from internal_links import clean_links
+
+# From articles/quality-control-backpack-production-standards.html
+RESERIALIZED_META = (
+    '<meta ..="" articles="" content=\'Professional quality control in backpack production: industry '
+    'standards | black backpack guide.\' custom-backpack-manufacturing-b2b-complete-guide.html"="" '
+    'name="description"/>backpack manufacturing. Learn about industry best practices and quality assurance."&gt;\n'
+    '    <meta content="backpack manufacturing" name="keywords"/>')
+
+
+def test_reserialized_meta_tag_is_rebuilt_without_leaked_text():
+    assert clean_links(RESERIALIZED_META) == (
+        '<meta content="Professional quality control in backpack production: industry '
+        'standards | black backpack guide." name="description"/>\n'
+        '    <meta content="backpack manufacturing" name="keywords"/>')
@@ -0,0 +1,33 @@
+from mark_dark_sections import DarkSectionMarker, background_classes
+
+CSS = '''
+.cta { background: #1a1a1a; }
+.hero-overlay { width: 100%; background: rgba(26, 26, 26, 0.6); }
+.color-swatch { width: 40px; background: #000; }
+'''
+
+
+def mark(markup):
+    dark_classes, full_width = background_classes(CSS)
+    dark = {name for name, value in dark_classes.items() if value}
+    wide = {name for name, value in full_width.items() if value}
+    return DarkSectionMarker('.').mark(markup, dark, wide)
+
+
+def test_small_dark_decorations_are_not_marked():
+    markup = '<section class="intro"><div class="color-swatch nav-dark"></div></section>'
+
+    assert mark(markup) == '<section class="intro"><div class="color-swatch"></div></section>'
+
+
+def test_sections_and_full_width_overlays_are_marked():
+    markup = '<section class="hero"><div class="hero-overlay"></div></section><section class="cta"></section>'
+
+    assert mark(markup) == ('<section class="hero"><div class="hero-overlay nav-dark"></div></section>'
+                            '<section class="cta nav-dark"></section>')
+
+
+def test_blocks_inside_a_dark_section_are_not_marked():
+    markup = '<section class="cta"><section class="cta"></section></section>'
+
+    assert mark(markup) == '<section class="cta nav-dark"><section class="cta"></section></section>'
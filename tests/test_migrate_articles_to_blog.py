@@ -0,0 +1,61 @@
+from html.parser import HTMLParser
+
+from migrate_articles_to_blog import create_enhanced_blog_html
+
+
+class ScriptCollector(HTMLParser):
+    """Collects the <script> elements of a page and any left open at the end"""
+
+    def __init__(self):
+        super().__init__()
+        self.scripts = []
+        self.open_scripts = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'script':
+            self.open_scripts += 1
+            self.scripts.append({'src': dict(attrs).get('src'), 'data': ''})
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self.open_scripts -= 1
+
+    def handle_data(self, data):
+        if self.open_scripts:
+            self.scripts[-1]['data'] += data
+
+
+ARTICLES = [
+    '<article class="article-card" data-category="design">\n'
+    '    <h3><a href="articles/one.html">One "quoted"</a></h3>\n'
+    '</article>',
+    '<article class="article-card" data-category="materials">\n'
+    '    <p>Materials</p>\n'
+    '</article>',
+]
+
+
+def parse(page):
+    parser = ScriptCollector()
+    parser.feed(page)
+    parser.close()
+    return parser
+
+
+def test_every_script_is_closed():
+    parser = parse(create_enhanced_blog_html(ARTICLES))
+
+    assert parser.open_scripts == 0
+    assert [script['src'] for script in parser.scripts if script['src']] == [
+        'js/script.js', 'js/navigation.js', 'js/search.js']
+    assert all(not script['data'].strip() for script in parser.scripts if script['src'])
+
+
+def test_cards_are_markup_not_script_data():
+    page = create_enhanced_blog_html(ARTICLES)
+    parser = parse(page)
+
+    assert not [script for script in parser.scripts if not script['src']]
+    assert 'articles/one.html' in page.split('id="articles-grid"', 1)[1].split('<!-- Load More -->', 1)[0]
+    assert 'class="load-more-btn"' in page
+    assert 'allArticles' not in page
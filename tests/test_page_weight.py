@@ -0,0 +1,13 @@
+from page_weight import page_references
+
+
+def test_lazy_image_repeated_eagerly_counts_as_initial():
+    refs = page_references('<img src="a.png" loading="lazy"><img src="a.png">')
+
+    assert refs == [('a.png', False)]
+
+
+def test_lazy_only_image_is_deferred():
+    refs = page_references('<img src="hero.png"><img src="below.png" loading="lazy">')
+
+    assert sorted(refs) == [('below.png', True), ('hero.png', False)]
@@ -0,0 +1,52 @@
+from site_templates import RenderCache, adopt_partials, render_page, sync_partials
+
+
+def adopt(tmp_path, page, markup):
+    html_file = tmp_path / page
+    html_file.parent.mkdir(parents=True, exist_ok=True)
+    html_file.write_text(markup, encoding='utf-8')
+    adopt_partials(html_file, tmp_path)
+    sync_partials(html_file, tmp_path)
+    return html_file.read_text(encoding='utf-8')
+
+
+def test_hand_written_nav_and_footer_become_partials(tmp_path):
+    page = adopt(tmp_path, 'articles/a.html', (
+        '<html><head>\n<link rel="stylesheet" href="../css/article.css">\n</head>\n<body>\n'
+        '<!-- Header -->\n<header class="header">\n</header>\n<main>Body</main>\n'
+        '<footer class="site-footer"><p>Old footer</p></footer>\n'
+        '<script src="../js/main.js"></script>\n</body></html>\n'))
+
+    assert '<!-- partial:header -->' in page and '<!-- partial:footer -->' in page
+    assert '<a href="../blog.html" class="nav-link active">Blog</a>' in page
+    assert 'Old footer' not in page
+    assert page.index('css/style.css') < page.index('css/article.css')
+    assert page.index('<!-- /partial:footer -->') < page.index('<script src="../js/main.js">')
+
+
+def test_unclosed_header_keeps_following_content(tmp_path):
+    page = adopt(tmp_path, 'b.html', (
+        '<html><head>\n<link rel="stylesheet" href="css/style.css">\n</head>\n<body>\n'
+        '<header class="header">\n<section>Article</section>\n</body></html>\n'))
+
+    assert page.count('<header class="header">') == 1
+    assert '<!-- /partial:header -->\n<section>Article</section>' in page
+    assert '<!-- partial:footer -->' in page
+
+
+def render_stub(title):
+    return render_page('c.html', title, '<main>Content</main>')
+
+
+def test_generated_page_without_cache_entry_is_rerendered(tmp_path):
+    (tmp_path / 'c.html').write_text(render_stub('Old'), encoding='utf-8')
+
+    assert RenderCache(tmp_path).build('c.html', render_stub, 'New')
+    assert '<title>New</title>' in (tmp_path / 'c.html').read_text(encoding='utf-8')
+
+
+def test_hand_written_page_without_cache_entry_is_kept(tmp_path):
+    (tmp_path / 'c.html').write_text('<html>Hand written</html>', encoding='utf-8')
+
+    assert not RenderCache(tmp_path).build('c.html', render_stub, 'New')
+    assert (tmp_path / 'c.html').read_text(encoding='utf-8') == '<html>Hand written</html>'
@@ -5,11 +5,88 @@ Update blog.html with all articles from the articles directory
 
 import os
 import re
-from datetime import datetime, timedelta
-import random
+import math
+import subprocess
+from datetime import datetime
+from image_metadata import ImageMetadataCache
+from related_articles import article_text
 
-def extract_article_info(file_path):
-    """Extract article information from HTML file"""
+image_metadata = ImageMetadataCache('images')
+
+# Average adult reading speed used for the "min read" estimate
+WORDS_PER_MINUTE = 200
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:['\u2019-][a-z0-9]+)*")
+CARD_PATTERN = re.compile(r'[ \t]*<article class="article-card".*?</article>', re.DOTALL)
+CARD_LINK_PATTERN = re.compile(r'<a href="articles/([^"]+)"')
+META_TAG_PATTERN = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'([\w:-]+)=(["\'])(.*?)\2', re.DOTALL)
+
+# Image loading hints are added afterwards by apply_loading_hints.py and are not card data
+HINT_ATTR_PATTERN = re.compile(r'\s(?:loading|decoding|fetchpriority)="[^"]*"')
+
+# Date sources inside an article, most specific first
+DATE_PATTERNS = [
+    (re.compile(r'<time[^>]+datetime="(\d{4}-\d{2}-\d{2})'), '%Y-%m-%d'),
+    (re.compile(r'class="article-date">\s*([A-Z][a-z]+ \d{1,2}, \d{4})'), '%B %d, %Y'),
+    (re.compile(r'<meta property="article:published_time" content="(\d{4}-\d{2}-\d{2})'), '%Y-%m-%d'),
+    (re.compile(r'"datePublished":\s*"(\d{4}-\d{2}-\d{2})'), '%Y-%m-%d'),
+]
+
+
+def git_added_dates(directory):
+    """Map file name -> date (YYYY-MM-DD) of the commit that first added it, from git history"""
+    try:
+        output = subprocess.run(
+            ['git', '-c', 'core.quotepath=off', 'log', '--diff-filter=A', '--name-only',
+             '--format=%x00%ad', '--date=short', '--', directory],
+            capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    dates = {}
+    # git log lists newest commits first, so older commits overwrite newer ones
+    for entry in output.split('\0')[1:]:
+        lines = entry.strip().splitlines()
+        if not lines:
+            continue
+        for path in lines[1:]:
+            if path.strip():
+                dates[os.path.basename(path.strip())] = lines[0]
+    return dates
+
+
+def meta_content(content, attr, value):
+    """Content of the <meta> tag whose attr equals value, regardless of attribute order or quotes"""
+    for tag in META_TAG_PATTERN.findall(content):
+        attrs = {name.lower(): text for name, _, text in ATTR_PATTERN.findall(tag)}
+        if attrs.get(attr) == value and attrs.get('content'):
+            return attrs['content']
+    return None
+
+
+def card_data(card):
+    """Card markup without the loading hints, for comparing old and new cards"""
+    return HINT_ATTR_PATTERN.sub('', card)
+
+
+def extract_date(content):
+    """Publication date from the article's own metadata, or None"""
+    for pattern, date_format in DATE_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            try:
+                return datetime.strptime(match.group(1), date_format).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+    return None
+
+def extract_article_info(file_path, fallback_date=None):
+    """Extract article information from HTML file
+
+    Title, description, image, word count, read time and date come from a single read;
+    the date falls back to fallback_date (e.g. from git history) and then to the file mtime
+    """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -23,23 +100,30 @@ def extract_article_info(file_path):
             title = h1_match.group(1).strip() if h1_match else os.path.basename(file_path).replace('.html', '').replace('-', ' ').title()
         
         # Extract meta description
-        desc_match = re.search(r'<meta name="description" content="([^"]+)"', content)
-        description = desc_match.group(1) if desc_match else f"Learn about {title.lower()} in our comprehensive guide..."
+        description = meta_content(content, 'name', 'description') or \
+            f"Learn about {title.lower()} in our comprehensive guide..."
         
         # Extract image from og:image or first img tag
-        img_match = re.search(r'<meta property="og:image" content="[^"]*images/([^"]+)"', content)
-        if img_match:
-            image = img_match.group(1)
+        og_image = meta_content(content, 'property', 'og:image') or ''
+        if 'images/' in og_image:
+            image = og_image.split('images/', 1)[1]
         else:
             # Look for first img tag
             img_tag_match = re.search(r'<img[^>]+src="[^"]*images/([^"]+)"', content)
             image = img_tag_match.group(1) if img_tag_match else 'blackbackpack (1).webp'
         
+        word_count = len(WORD_PATTERN.findall(article_text(content)))
+        date = extract_date(content) or fallback_date or \
+            datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d')
+        
         return {
             'title': title,
             'description': description[:150] + '...' if len(description) > 150 else description,
             'image': image,
-            'filename': os.path.basename(file_path)
+            'filename': os.path.basename(file_path),
+            'word_count': word_count,
+            'read_time': max(1, math.ceil(word_count / WORDS_PER_MINUTE)),
+            'date': date
         }
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
@@ -86,7 +170,7 @@ def generate_article_card(article_info, date_str, read_time):
     
     return f'''                <article class="article-card" data-category="{category}" data-date="{date_str}">
                     <div class="article-image">
-                        <img src="images/{article_info['image']}" alt="{article_info['title']}">
+                        <img src="images/{article_info['image']}" alt="{article_info['title']}"{image_metadata.size_attributes(article_info['image'])}>
                         <div class="article-category">{category_display}</div>
                     </div>
                     <div class="article-content">
@@ -115,42 +199,52 @@ def main():
     
     # Extract article information
     articles_data = []
-    start_date = datetime(2024, 12, 15)
+    added_dates = git_added_dates(articles_dir)
     
-    for i, filename in enumerate(article_files):
+    for filename in article_files:
         file_path = os.path.join(articles_dir, filename)
-        article_info = extract_article_info(file_path)
+        article_info = extract_article_info(file_path, added_dates.get(filename))
         
         if article_info:
-            # Generate date (going backwards from start_date)
-            article_date = start_date - timedelta(days=i)
-            read_time = random.randint(7, 15)  # Random read time between 7-15 minutes
-            
-            articles_data.append({
-                'info': article_info,
-                'date': article_date.strftime('%Y-%m-%d'),
-                'read_time': read_time
-            })
+            articles_data.append(article_info)
     
-    # Generate article cards HTML
-    article_cards_html = '\n\n'.join([
-        generate_article_card(article['info'], article['date'], article['read_time'])
-        for article in articles_data
-    ])
+    image_metadata.save()
     
     # Read current blog.html
     with open(blog_file, 'r', encoding='utf-8') as f:
         blog_content = f.read()
     
+    # Reuse the existing markup of cards whose data did not change
+    existing_cards = {}
+    for card in CARD_PATTERN.findall(blog_content):
+        link_match = CARD_LINK_PATTERN.search(card)
+        if link_match:
+            existing_cards[link_match.group(1)] = card
+    
+    cards = []
+    changed_cards = 0
+    for article_info in articles_data:
+        card = generate_article_card(article_info, article_info['date'], article_info['read_time'])
+        existing = existing_cards.get(article_info['filename'])
+        if existing is not None and card_data(existing) == card:
+            card = existing
+        else:
+            changed_cards += 1
+        cards.append(card)
+    removed_cards = len(set(existing_cards) - {article_info['filename'] for article_info in articles_data})
+    
+    # Generate article cards HTML
+    article_cards_html = '\n\n'.join(cards)
+    
     # Update article count in the content
     total_articles = len(articles_data)
     blog_content = re.sub(r'collection of \d+ articles', f'collection of {total_articles} articles', blog_content)
     blog_content = re.sub(r'All Articles \(\d+\)', f'All Articles ({total_articles})', blog_content)
-    blog_content = re.sub(r'of \d+ articles', f'of {total_articles} articles', blog_content)
+    blog_content = re.sub(r'<span>\d+ articles</span>', f'<span>{total_articles} articles</span>', blog_content)
     
     # Replace the articles grid content
     start_marker = '<div class="articles-grid" id="articles-grid">'
-    end_marker = '</div>\n\n            <!-- Pagination -->'
+    end_marker = '</div>\n\n            <!-- Load More -->'
     
     start_pos = blog_content.find(start_marker)
     end_pos = blog_content.find(end_marker)
@@ -162,32 +256,16 @@ def main():
             blog_content[end_pos:]
         )
         
-        # Update pagination info
-        articles_per_page = 12
-        total_pages = (total_articles + articles_per_page - 1) // articles_per_page
-        
-        # Update pagination numbers
-        pagination_numbers = '\n'.join([
-            f'                        <button class="pagination-number{" active" if i == 1 else ""}" data-page="{i}">{i}</button>'
-            for i in range(1, min(total_pages + 1, 11))  # Show max 10 page numbers
-        ])
-        
-        new_content = re.sub(
-            r'<div class="pagination-numbers" id="pagination-numbers">.*?</div>',
-            f'<div class="pagination-numbers" id="pagination-numbers">\n{pagination_numbers}\n                    </div>',
-            new_content,
-            flags=re.DOTALL
-        )
-        
-        # Update total pages display
-        new_content = re.sub(r'<span id="total-pages">\d+</span>', f'<span id="total-pages">{total_pages}</span>', new_content)
+        if new_content == blog_content:
+            print(f"{blog_file} is up to date ({total_articles} articles)")
+            return
         
         # Write updated content
         with open(blog_file, 'w', encoding='utf-8') as f:
             f.write(new_content)
         
-        print(f"Successfully updated {blog_file} with {total_articles} articles")
-        print(f"Total pages: {total_pages}")
+        print(f"Successfully updated {blog_file} with {total_articles} articles "
+              f"({changed_cards} cards changed, {removed_cards} removed)")
     else:
         print("Could not find articles grid section in blog.html")
 
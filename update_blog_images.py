@@ -12,6 +12,8 @@ import re
 import glob
 from pathlib import Path
 
+from image_resolver import ImageResolver, category_of
+
 def check_image_exists(image_path, base_dir):
     """Check if an image file exists in the images directory"""
     full_path = os.path.join(base_dir, image_path)
@@ -88,13 +90,9 @@ def update_blog_images():
     print(f"Working directory: {base_dir}")
     print(f"Images directory: {images_dir}")
     
-    # Get list of available images
-    available_images = []
-    if os.path.exists(images_dir):
-        for ext in ['*.webp', '*.svg', '*.jpg', '*.jpeg', '*.png']:
-            available_images.extend(glob.glob(os.path.join(images_dir, ext)))
-        available_images = [os.path.basename(img) for img in available_images]
-        print(f"Found {len(available_images)} images in images directory")
+    # Index available images once; lookups are by name tokens instead of list scans
+    resolver = ImageResolver(images_dir)
+    print(f"Found {len(resolver.existing)} images in images directory")
     
     # Update blog.html
     blog_file = os.path.join(base_dir, "blog.html")
@@ -122,7 +120,7 @@ def update_blog_images():
                 category = get_category_from_article_class(article)
                 
                 # Check if current image exists
-                if current_filename in available_images:
+                if resolver.exists(current_filename):
                     # Image exists, ensure path is correct
                     new_src = f"images/{current_filename}"
                     if current_src != new_src:
@@ -130,29 +128,14 @@ def update_blog_images():
                         images_updated += 1
                         print(f"  ✓ Updated path: {current_src} -> {new_src}")
                 else:
-                    # Image doesn't exist, try to find a suitable replacement
-                    replacement_found = False
-                    
-                    # Try to find category-specific images
-                    category_images = [img for img in available_images if category in img.lower()]
-                    if category_images:
-                        new_src = f"images/{category_images[0]}"
+                    # Image doesn't exist, pick the closest match by name, then category
+                    replacement = resolver.resolve(current_filename, category_of(category))
+                    replacement_found = replacement is not None
+                    if replacement_found:
+                        new_src = f"images/{replacement}"
                         updated_content = updated_content.replace(current_src, new_src)
                         images_updated += 1
-                        print(f"  ✓ Replaced with category image: {current_src} -> {new_src}")
-                        replacement_found = True
-                    
-                    # If no category-specific image, try webp images
-                    if not replacement_found:
-                        webp_images = [img for img in available_images if img.endswith('.webp')]
-                        if webp_images:
-                            # Use a different webp image based on article index
-                            article_index = articles.index(article) % len(webp_images)
-                            new_src = f"images/{webp_images[article_index]}"
-                            updated_content = updated_content.replace(current_src, new_src)
-                            images_updated += 1
-                            print(f"  ✓ Replaced with webp image: {current_src} -> {new_src}")
-                            replacement_found = True
+                        print(f"  ✓ Replaced with matched image: {current_src} -> {new_src}")
                     
                     # If still no replacement, generate SVG
                     if not replacement_found:
@@ -202,22 +185,16 @@ def update_blog_images():
                     filename = os.path.basename(img_src)
                     
                     # Check if image exists
-                    if filename not in available_images:
+                    if not resolver.exists(filename):
                         # Try to find a suitable replacement
-                        replacement_found = False
-                        
-                        # Try webp images first
-                        webp_images = [img for img in available_images if img.endswith('.webp')]
-                        if webp_images:
-                            # Use a random webp image
-                            import random
-                            new_filename = random.choice(webp_images)
-                            new_src = f"images/{new_filename}"
+                        replacement = resolver.resolve(filename)
+                        replacement_found = replacement is not None
+                        if replacement_found:
+                            new_src = f"images/{replacement}"
                             updated_content = updated_content.replace(img_src, new_src)
                             article_images_updated += 1
-                            replacement_found = True
                         
-                        # If no webp, generate SVG
+                        # If no replacement, generate SVG
                         if not replacement_found:
                             svg_filename = f"article-image-{len(images)}.svg"
                             svg_path = os.path.join(images_dir, svg_filename)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地编辑监视脚本
+监视 articles/、images/、css/、js/、templates/ 和根目录页面, 文件变化后等待一小段时间
+(合并保存时连续产生的多个事件), 然后只对变化的文件重新运行受影响的步骤:
+  - templates/ 变化: 重新渲染所有页面中的局部模板区域 (site_templates.py)
+  - 页面或样式表变化: 修复这些文件中的缺失图片引用; images/ 变化时检查全站引用
+  - 页面变化: 标记其中的深色区块; 样式表或模板变化时重新标记所有页面 (mark_dark_sections.py)
+  - articles/ 变化: 重建 blog.html 文章列表 (update_blog_articles.py) 和站内搜索索引
+  - 任何页面变化: 更新 sitemap.xml
+
+Linux 下使用 inotify 接收文件事件, 其他系统或加上 --poll 时定时扫描修改时间
+
+用法: python watch_site.py [站点目录] [--poll]
+"""
+
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+import fnmatch
+from pathlib import Path
+
+from image_resolver import IMAGE_EXTENSIONS, ImageResolver, resolve_file
+from site_templates import sync_partials
+from mark_dark_sections import DarkSectionMarker
+from generate_sitemap import update_sitemap
+from build_search_index import update_search_index
+
+# 监视的目录 (相对站点根目录) 及其中需要关注的文件
+WATCHED = {
+    '': ['*.html'],
+    'articles': ['*.html'],
+    'images': [f'*{ext}' for ext in IMAGE_EXTENSIONS],
+    'css': ['*.css'],
+    'js': ['*.js'],
+    'templates': ['*.html'],
+    'templates/partials': ['*.html'],
+}
+
+# 最后一个事件之后安静这么久才开始重建
+DEBOUNCE_SECONDS = 0.5
+
+# 轮询模式的扫描间隔
+POLL_INTERVAL = 1.0
+
+# inotify 事件: 写入完成、新建、删除、移入移出
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_watched(relative):
+    """判断相对路径是否属于监视范围"""
+    directory, _, name = relative.rpartition('/')
+    patterns = WATCHED.get(directory)
+    return bool(patterns) and any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def scan(site_root):
+    """记录所有监视文件的 (修改时间, 大小)"""
+    snapshot = {}
+    for directory, patterns in WATCHED.items():
+        folder = site_root / directory
+        if not folder.is_dir():
+            continue
+        for entry in os.scandir(folder):
+            if entry.is_file() and any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns):
+                stat = entry.stat()
+                relative = f'{directory}/{entry.name}' if directory else entry.name
+                snapshot[relative] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def file_state(site_root, relative):
+    """单个文件当前的 (修改时间, 大小), 文件不存在时返回None"""
+    try:
+        stat = (site_root / relative).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def detect_changes(site_root, snapshot, candidates):
+    """和快照比较找出真正变化的文件并更新快照; candidates 为None时全量扫描
+
+    重建步骤自己写入的文件在重建后已经记入快照, 随后收到的事件会在这里被过滤掉
+    """
+    if candidates is None:
+        current = scan(site_root)
+        changed = {path for path in set(current) | set(snapshot) if current.get(path) != snapshot.get(path)}
+        snapshot.clear()
+        snapshot.update(current)
+        return changed
+
+    changed = set()
+    for relative in candidates:
+        state = file_state(site_root, relative)
+        if state != snapshot.get(relative):
+            changed.add(relative)
+            if state is None:
+                snapshot.pop(relative, None)
+            else:
+                snapshot[relative] = state
+    return changed
+
+
+class InotifyWatcher:
+    """通过 ctypes 调用 libc 的 inotify 接口"""
+
+    def __init__(self, site_root):
+        self.site_root = site_root
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 失败')
+
+        self.directories = {}
+        for directory in WATCHED:
+            folder = site_root / directory
+            if not folder.is_dir():
+                continue
+            wd = libc.inotify_add_watch(self.fd, str(folder).encode('utf-8'), WATCH_MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f'无法监视 {folder}')
+            self.directories[wd] = directory
+
+    def wait(self, timeout=None):
+        """等待文件事件, 返回可能变化的相对路径集合 (超时返回空集合)"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        paths = set()
+        data = os.read(self.fd, 65536)
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', errors='replace')
+            offset += length
+            directory = self.directories.get(wd)
+            if directory is None or not name:
+                continue
+            relative = f'{directory}/{name}' if directory else name
+            if is_watched(relative):
+                paths.add(relative)
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """定时全量扫描, 不支持inotify时使用"""
+
+    def __init__(self, site_root):
+        self.site_root = site_root
+
+    def wait(self, timeout=None):
+        """等待一个扫描间隔, 返回None表示需要全量比较"""
+        time.sleep(POLL_INTERVAL if timeout is None else min(timeout, POLL_INTERVAL))
+        return None
+
+    def close(self):
+        pass
+
+
+def create_watcher(site_root, polling=False):
+    """优先使用inotify, 不可用时退回轮询"""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(site_root)
+        except (OSError, AttributeError) as e:
+            print(f"inotify 不可用, 改为轮询: {e}")
+    return PollingWatcher(site_root)
+
+
+def collect_changes(watcher, site_root, snapshot):
+    """阻塞到出现变化, 然后持续收集直到安静 DEBOUNCE_SECONDS"""
+    changed = set()
+    while not changed:
+        changed = detect_changes(site_root, snapshot, watcher.wait())
+
+    quiet_since = time.monotonic()
+    while time.monotonic() - quiet_since < DEBOUNCE_SECONDS:
+        remaining = DEBOUNCE_SECONDS - (time.monotonic() - quiet_since)
+        more = detect_changes(site_root, snapshot, watcher.wait(remaining))
+        if more:
+            changed |= more
+            quiet_since = time.monotonic()
+    return changed
+
+
+def plan_passes(changed):
+    """根据变化的文件决定需要运行的步骤, 返回 [(步骤名, 相关文件)]"""
+    templates = sorted(path for path in changed if path.startswith('templates/'))
+    images = sorted(path for path in changed if path.startswith('images/'))
+    articles = sorted(path for path in changed if path.startswith('articles/'))
+    pages = sorted(path for path in changed if path.endswith('.html') and not path.startswith('templates/'))
+    stylesheets = sorted(path for path in changed if path.endswith('.css'))
+
+    passes = []
+    if templates:
+        passes.append(('partials', templates))
+    if images:
+        passes.append(('image_refs', None))
+    elif pages or stylesheets:
+        passes.append(('image_refs', pages + stylesheets))
+    if stylesheets or templates:
+        passes.append(('dark_sections', None))
+    elif pages:
+        passes.append(('dark_sections', pages))
+    if articles:
+        passes.append(('blog_index', articles))
+        passes.append(('search_index', articles))
+    if templates or pages:
+        passes.append(('sitemap', pages))
+    return passes
+
+
+def run_pass(site_root, name, files):
+    """执行单个重建步骤"""
+    if name == 'partials':
+        html_files = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+        updated = [html_file for html_file in html_files if sync_partials(html_file, site_root)]
+        print(f"  ✓ 局部模板: 更新了 {len(updated)} 个页面")
+
+    elif name == 'image_refs':
+        resolver = ImageResolver(site_root / 'images')
+        if files is None:
+            files = ([path.relative_to(site_root).as_posix() for path in
+                      sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+                      + sorted(site_root.glob('css/*.css'))])
+        fixed = 0
+        for relative in files:
+            if (site_root / relative).exists():
+                fixed += len(resolve_file(site_root / relative, resolver))
+        print(f"  ✓ 图片引用: 检查 {len(files)} 个文件, 修复 {fixed} 处")
+
+    elif name == 'dark_sections':
+        marker = DarkSectionMarker(site_root)
+        if files is None:
+            paths = sorted(site_root.glob('*.html')) + sorted(site_root.glob('articles/*.html'))
+        else:
+            paths = [site_root / relative for relative in files if (site_root / relative).exists()]
+        updated = [path for path in paths if marker.mark_file(path)]
+        print(f"  ✓ 深色区块: 检查 {len(paths)} 个页面, 更新了 {len(updated)} 个")
+
+    elif name == 'blog_index':
+        # 文章列表脚本使用相对路径, 在站点目录中运行
+        import update_blog_articles
+        update_blog_articles.main()
+
+    elif name == 'search_index':
+        update_search_index(site_root)
+
+    elif name == 'sitemap':
+        update_sitemap(site_root)
+
+
+def rebuild(site_root, changed):
+    """对一批变化运行受影响的步骤"""
+    print(f"\n检测到 {len(changed)} 个文件变化: {', '.join(sorted(changed)[:5])}"
+          f"{' ...' if len(changed) > 5 else ''}")
+    passes = plan_passes(changed)
+    if not passes:
+        print("  - 没有需要重建的内容")
+        return
+
+    started = time.monotonic()
+    for name, files in passes:
+        try:
+            run_pass(site_root, name, files)
+        except Exception as e:
+            print(f"  ✗ {name} 失败: {e}")
+    print(f"重建完成, 用时 {time.monotonic() - started:.2f}s")
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    site_root = Path(args[0] if args else '.').resolve()
+    os.chdir(site_root)
+
+    watcher = create_watcher(site_root, polling='--poll' in sys.argv)
+    snapshot = scan(site_root)
+    mode = '轮询' if isinstance(watcher, PollingWatcher) else 'inotify'
+    print(f"开始监视 {site_root} ({mode}, {len(snapshot)} 个文件), 按 Ctrl+C 退出")
+
+    try:
+        while True:
+            changed = collect_changes(watcher, site_root, snapshot)
+            rebuild(site_root, changed)
+            # 重建步骤写入的文件记入快照, 不会再次触发重建
+            snapshot = scan(site_root)
+    except KeyboardInterrupt:
+        print("\n停止监视")
+    finally:
+        watcher.close()
+
+
+if __name__ == '__main__':
+    main()